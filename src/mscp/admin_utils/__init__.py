@@ -2,20 +2,25 @@
 """Administrative utilities exposed via ``mscp admin``.
 
 Re-exports `build_all_baselines` (rebuilds every supported baseline) and
-`add_new_rule` (interactive helper to scaffold a new rule YAML). Both are
-wired up as `argparse` subcommands in `mscp.cli`.
+`add_new_rule` (interactive helper to scaffold a new rule YAML), plus
+`generate_synthetic_corpus` (scaled rule library for performance
+testing) and `build_rule_catalog` (SQLite catalog of every rule). All are wired up as `argparse` subcommands in `mscp.cli`.
 """
 
 from .build_baselines import build_all_baselines
 from .release import update_mscp_release
 from .rule_utilities import add_new_rule, update_mscp_apple_release, remove_mscp_apple_release
 from .banner_generator import generate_mscp_banners
+from .synthetic_corpus import generate_synthetic_corpus
+from .rule_catalog import build_rule_catalog
 
 
 __all__ = [
     "build_all_baselines",
     "add_new_rule",
+    "build_rule_catalog",
     "generate_mscp_banners",
+    "generate_synthetic_corpus",
     "remove_mscp_apple_release",
     "update_mscp_apple_release",
     "update_mscp_release",
@@ -0,0 +1,179 @@
+# mscp/admin_utils/baseline_manifest.py
+"""Sidecar manifest for incremental baseline builds.
+
+``mscp admin baselines`` records what every generated baseline was built
+from in ``.manifest.json`` next to the baselines (in
+``config["baseline_dir"]``), so a later run only regenerates baselines
+whose inputs changed. The manifest is local build state: it reflects the
+custom rules and overrides of the checkout that wrote it.
+
+Layout::
+
+    {
+      "version": 1,
+      "baselines": {
+        "macos/cis_lvl1_macos_26.0.yaml": {"inputs": "...", "digest": "..."}
+      },
+      "rules": {
+        "audit_acls_files_configure": ["macos/cis_lvl1_macos_26.0.yaml", ...]
+      }
+    }
+
+``inputs`` is a digest of everything the baseline's content depends on
+(keyword, platform, member rules and their profile sections, authors
+and benchmark metadata; see `build_all_baselines`), ``digest`` a digest
+of the file as written, and ``rules`` the rule → baselines dependency
+map. Baseline names are paths relative to the baseline directory.
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+# Local python modules
+from ..common_utils import logger
+
+#: File name of the manifest inside ``config["baseline_dir"]``.
+MANIFEST_NAME: str = ".manifest.json"
+
+#: Bumped whenever the manifest layout or the inputs digest changes;
+#: manifests with another version are ignored.
+MANIFEST_VERSION: int = 1
+
+
+def digest(data: bytes) -> str:
+    """Return the hex BLAKE2b digest used for manifest entries."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def inputs_digest(inputs: Any) -> str:
+    """Return the digest of JSON-serializable build inputs."""
+    return digest(json.dumps(inputs, sort_keys=True, default=str).encode())
+
+
+class BaselineManifest:
+    """Build record of the baselines in one baseline directory.
+
+    Attributes:
+        baseline_dir (Path): Directory holding the baselines and the
+            manifest.
+    """
+
+    def __init__(self, baseline_dir: Path) -> None:
+        self.baseline_dir = Path(baseline_dir)
+        self._baselines: dict[str, dict[str, str]] = {}
+        self._rules: dict[str, list[str]] = {}
+
+    @property
+    def path(self) -> Path:
+        """Path of the manifest file."""
+        return self.baseline_dir / MANIFEST_NAME
+
+    @classmethod
+    def load(cls, baseline_dir: Path) -> "BaselineManifest":
+        """Read the manifest of ``baseline_dir``.
+
+        A missing, unreadable or outdated manifest yields an empty one, so
+        every baseline is regenerated.
+
+        Args:
+            baseline_dir (Path): Directory holding the baselines.
+
+        Returns:
+            BaselineManifest: The recorded state.
+        """
+        manifest = cls(baseline_dir)
+        try:
+            data: dict[str, Any] = json.loads(manifest.path.read_text())
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable baseline manifest {}: {}", manifest.path, e)
+            return manifest
+
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info(
+                "Ignoring baseline manifest version {}, expected {}",
+                data.get("version"),
+                MANIFEST_VERSION,
+            )
+            return manifest
+
+        manifest._baselines = data.get("baselines", {})
+        for rule_id, names in data.get("rules", {}).items():
+            for name in names:
+                manifest._rules.setdefault(name, []).append(rule_id)
+        return manifest
+
+    def names(self) -> list[str]:
+        """Return the recorded baseline names."""
+        return list(self._baselines)
+
+    def is_current(self, name: str, inputs: str) -> bool:
+        """Return whether baseline ``name`` is up to date.
+
+        Args:
+            name (str): Baseline path relative to the baseline directory.
+            inputs (str): Digest of the baseline's current inputs.
+
+        Returns:
+            bool: ``True`` if it was recorded with the same inputs and the
+                file still has the recorded content.
+        """
+        entry = self._baselines.get(name)
+        if entry is None or entry.get("inputs") != inputs:
+            return False
+        try:
+            return digest((self.baseline_dir / name).read_bytes()) == entry.get("digest")
+        except OSError:
+            return False
+
+    def record(self, name: str, inputs: str, rule_ids: Iterable[str]) -> None:
+        """Record that baseline ``name`` was just written.
+
+        Args:
+            name (str): Baseline path relative to the baseline directory.
+            inputs (str): Digest of the inputs it was built from.
+            rule_ids (Iterable[str]): IDs of its rules.
+        """
+        self._baselines[name] = {
+            "inputs": inputs,
+            "digest": digest((self.baseline_dir / name).read_bytes()),
+        }
+        self._rules[name] = sorted(set(rule_ids))
+
+    def discard(self, name: str) -> None:
+        """Forget baseline ``name``."""
+        self._baselines.pop(name, None)
+        self._rules.pop(name, None)
+
+    def dependents(self, rule_id: str) -> list[str]:
+        """Return the recorded baselines that include ``rule_id``."""
+        return sorted(name for name, rules in self._rules.items() if rule_id in rules)
+
+    def save(self) -> Path:
+        """Write the manifest, replacing the previous one atomically.
+
+        Returns:
+            Path: The manifest file.
+        """
+        rules: dict[str, list[str]] = {}
+        for name in sorted(self._rules):
+            for rule_id in self._rules[name]:
+                rules.setdefault(rule_id, []).append(name)
+
+        data = {
+            "version": MANIFEST_VERSION,
+            "baselines": dict(sorted(self._baselines.items())),
+            "rules": dict(sorted(rules.items())),
+        }
+        self.baseline_dir.mkdir(parents=True, exist_ok=True)
+        tmp_name = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_name.write_text(json.dumps(data, indent=1) + "\n")
+        os.replace(tmp_name, self.path)
+        return self.path
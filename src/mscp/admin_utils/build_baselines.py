@@ -5,59 +5,250 @@ Wires up the ``mscp admin baselines`` subcommand: discovers all rules
 for the requested platform, derives the set of benchmarks and tags
 they cover, then drives `generate_baseline` once per
 benchmark-and-platform pair plus once per remaining tag-and-platform
-pair.
+pair. Keywords that select none of a platform's rules are skipped.
+
+With ``--all-versions`` every OS version listed in ``mscp_data`` is
+built in the same pass: the rule library is loaded once and sliced per
+platform and version, and the 800-53 baselines, section descriptions
+and established benchmarks are loaded once (`BaselineResources`) and
+shared by every job.
+
+The `generate_baseline` calls are independent, so they are fanned out
+over a pool of forked worker processes (``mscp --jobs N``; defaults to
+the CPU count). Workers inherit the preloaded rules from the parent
+through ``fork`` instead of receiving a pickled copy, and what each job
+prints is replayed in job order, so the files and the console output
+match a serial run. Without ``fork`` support the jobs run serially.
+
+Builds are incremental: a `BaselineManifest` next to the baselines
+records a digest of each baseline's inputs, and only baselines whose
+membership, section placement or metadata changed (or whose file was
+edited or removed) are regenerated; ``--force`` regenerates them all.
+Rewritten files with identical content keep their modification time,
+and baselines the run no longer produces are deleted.
 """
 
 # Standard python modules
 import argparse
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Any, NamedTuple
 
 # Local python modules
 from ..common_utils import (
     config,
     logger,
     mscp_data,
-    remove_dir_contents,
 )
 from ..common_utils import logging_config
+from ..classes.baseline import Baseline
+from ..classes.macsecurityrule import Macsecurityrule
 from ..classes.rule_library import RuleLibrary
 from ..generate import (
     generate_baseline,
 )
 from ..generate.baseline import (
+    BaselineResources,
     collect_tags_and_benchmarks,
+    select_rules,
 )
+from .baseline_manifest import (
+    MANIFEST_NAME,
+    MANIFEST_VERSION,
+    BaselineManifest,
+    inputs_digest,
+)
+
+
+class BaselineJob(NamedTuple):
+    """One `generate_baseline` call: a tag or benchmark for one platform version."""
+
+    keyword: str
+    os_name: str
+    os_version: float
+
+    @property
+    def name(self) -> str:
+        """Output file relative to ``config["baseline_dir"]``, as `generate_baseline` writes it."""
+        return f"{self.os_name}/{self.keyword}_{self.os_name}_{self.os_version}.yaml"
+
+
+class _JobState(NamedTuple):
+    args: argparse.Namespace
+    platform_rules: dict[tuple[str, float], list[Macsecurityrule]]
+    resources: BaselineResources | None
+
+
+# state of the running `run_baseline_jobs` call; set before the pool
+# forks so workers inherit it instead of unpickling it
+_fork_state: _JobState | None = None
+
+
+def _generate(state: _JobState, job: BaselineJob) -> None:
+    job_args = argparse.Namespace(**vars(state.args))
+    job_args.keyword = job.keyword
+    job_args.os_name = job.os_name
+    job_args.os_version = job.os_version
+    generate_baseline(
+        job_args,
+        admin=True,
+        preloaded_rules=state.platform_rules.get((job.os_name, job.os_version), []),
+        resources=state.resources,
+    )
+
+
+def _run_forked_job(job: BaselineJob) -> str:
+    """Run ``job`` in a forked worker and return what it printed."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        _generate(_fork_state, job)
+    return output.getvalue()
+
+
+def run_baseline_jobs(
+    args: argparse.Namespace,
+    jobs: list[BaselineJob],
+    platform_rules: dict[tuple[str, float], list[Macsecurityrule]],
+    resources: BaselineResources | None = None,
+    workers: int | None = None,
+) -> None:
+    """Run `generate_baseline` for every job, in parallel when possible.
+
+    Jobs writing the same file (same keyword, platform and version) run
+    once.
+
+    Args:
+        args (argparse.Namespace): Base arguments for `generate_baseline`;
+            ``keyword``, ``os_name`` and ``os_version`` are set per job on
+            a copy.
+        jobs (list[BaselineJob]): The baselines to generate.
+        platform_rules (dict[tuple[str, float], list[Macsecurityrule]]):
+            Preloaded rules per ``(os_name, os_version)``, shared with the
+            workers.
+        resources (BaselineResources | None): Data shared by every job;
+            see `BaselineResources`.
+        workers (int | None): Maximum number of worker processes.
+            Defaults to ``config["jobs"]`` when set, otherwise the CPU
+            count; ``1`` runs the jobs in this process.
+    """
+    global _fork_state
+
+    state = _JobState(args, platform_rules, resources)
+    jobs = list(dict.fromkeys(jobs))
+    if workers is None:
+        workers = config.get("jobs") or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+
+    if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        # create every output folder up front so workers don't race on it
+        for os_name in {job.os_name for job in jobs}:
+            Path(config.get("baseline_dir", ""), os_name).mkdir(
+                parents=True, exist_ok=True
+            )
+        logger.debug("Generating {} baselines with {} workers", len(jobs), workers)
+        _fork_state = state
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                outputs = list(pool.map(_run_forked_job, jobs))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Baseline worker pool unavailable, running serially: {}", e)
+        else:
+            for output in outputs:
+                print(output, end="")
+            return
+        finally:
+            _fork_state = None
+
+    for job in jobs:
+        _generate(state, job)
+
+
+def _keywords(rules: list[Macsecurityrule]) -> set[str]:
+    """Return the keywords that select at least one of ``rules``."""
+    keywords = {"all_rules"}
+    for rule in rules:
+        keywords.update(rule.tags or [])
+        keywords.update(rule.benchmark_names())
+    return keywords
+
+
+def _job_inputs(
+    job: BaselineJob,
+    rules: list[Macsecurityrule],
+    resources: BaselineResources,
+) -> dict[str, Any]:
+    """Return everything the content of ``job``'s baseline depends on."""
+    return {
+        "manifest": MANIFEST_VERSION,
+        "job": job,
+        "rules": {rule.rule_id: Baseline.profile_section(rule) for rule in rules},
+        "established_benchmarks": resources.established_benchmarks.get(
+            (job.os_name, job.os_version)
+        ),
+        "mscp": mscp_data.get("mscp"),
+        "authors": mscp_data.get("authors"),
+        "versions": mscp_data["versions"]["platforms"].get(job.os_name),
+        "nist_baselines": resources.nist_baselines,
+    }
+
+
+def _remove_other_files(baselines_dir: Path, keep: set[str]) -> None:
+    """Delete files under ``baselines_dir`` not in ``keep``, then empty folders."""
+    if not baselines_dir.is_dir():
+        return
+    for path in sorted(baselines_dir.rglob("*"), reverse=True):
+        name = path.relative_to(baselines_dir).as_posix()
+        if path.is_dir():
+            if not any(path.iterdir()):
+                path.rmdir()
+        elif name not in keep and name != MANIFEST_NAME:
+            logger.debug("Removing baseline no longer generated: {}", name)
+            path.unlink()
 
 
 def build_all_baselines(args: argparse.Namespace) -> None:
-    """Regenerate every default baseline file for the configured platforms.
+    """Regenerate the default baseline files for the configured platforms.
 
-    Clears `config["baseline_dir"]`, collects every rule for
-    `args.os_name` / `args.os_version`, derives the set of benchmarks and
-    tags from those rules, and then calls `generate_baseline` once per
-    discovered benchmark (per its own platform list) and once per
-    remaining tag for every supported platform in
-    `mscp_data["versions"]["platforms"]`. A small set of housekeeping tags
-    (``arm64``, ``i368``, ``inherent``, ``manual``, ``n_a``, ``none``,
-    ``permanent``) is excluded from the second pass.
+    Collects every rule for every supported platform at
+    `args.os_version` (every version in `mscp_data` with
+    ``--all-versions``), derives the set of benchmarks and tags from
+    those rules, and then calls `generate_baseline` once per discovered
+    benchmark (per its own platform list) and once per remaining tag for
+    every supported platform in `mscp_data["versions"]["platforms"]`. A
+    small set of housekeeping tags (``arm64``, ``i368``, ``inherent``,
+    ``manual``, ``n_a``, ``none``, ``permanent``) is excluded from the
+    second pass. The calls run in parallel, see `run_baseline_jobs`.
+
+    Only baselines that the `BaselineManifest` does not record as up to
+    date are generated, unless ``args.force`` is set.
 
     Args:
         args (argparse.Namespace): Parsed CLI arguments. Required fields:
-            ``os_name``, ``os_version``. The function additionally sets
-            ``tailor``, ``list_tags``, ``controls``, ``keyword``, and
-            ``os_name`` on the namespace as it iterates — callers should
-            treat the namespace as scratch space.
+            ``os_name``, ``os_version``; optional ``all_versions`` and
+            ``force``. The function additionally sets ``tailor``,
+            ``list_tags`` and ``controls`` on the namespace; ``keyword``,
+            ``os_name`` and ``os_version`` are set per job on copies of it.
 
     Side Effects:
-        Deletes the contents of the default baseline directory and writes
-        new baseline YAML files into it.
+        Writes changed baseline YAML files to the default baseline
+        directory, deletes the files it no longer produces and updates
+        the manifest.
     """
     logger.info("Building all supported baselines...")
     logging_config.suppress_spinner = True
 
-    # clear existing default baselines
     baselines_dir = Path(config.get("baseline_dir", ""))
-    remove_dir_contents(baselines_dir)
+    if getattr(args, "force", False):
+        manifest = BaselineManifest(baselines_dir)
+    else:
+        manifest = BaselineManifest.load(baselines_dir)
 
     # set default args expected by generate_baseline
     args.tailor = False
@@ -82,34 +273,88 @@ def build_all_baselines(args: argparse.Namespace) -> None:
 
     all_tags[:] = [x for x in all_tags if x not in excluded_tags]
 
+    if getattr(args, "all_versions", False):
+        versions = {
+            platform: [v["os_version"] for v in platform_versions]
+            for platform, platform_versions in mscp_data["versions"]["platforms"].items()
+        }
+    else:
+        versions = {
+            platform: [float(args.os_version)]
+            for platform in mscp_data["versions"]["platforms"]
+        }
+
     # cache rules per (platform, version) so generate_baseline doesn't re-collect on every call
-    platform_rules = {
-        platform: list(
-            library.by_platform(platform).by_os(os_version=float(args.os_version))
+    platform_rules: dict[tuple[str, float], list[Macsecurityrule]] = {
+        (platform, os_version): list(
+            library.by_platform(platform).by_os(os_version=os_version)
         )
-        for platform in mscp_data["versions"]["platforms"]
+        for platform, os_versions in versions.items()
+        for os_version in os_versions
     }
 
-    # process every discovered benchmark and generate a baseline file
-    for keyword, platforms in benchmark_map.items():
-        args.keyword = keyword
-        for platform in platforms:
-            args.os_name = platform.lower()
-            generate_baseline(
-                args, admin=True, preloaded_rules=platform_rules.get(args.os_name, [])
-            )
+    # for every version, every discovered benchmark for each of its
+    # platforms, then every discovered tag for every supported platform;
+    # keywords selecting none of the version's rules are skipped
+    jobs: list[BaselineJob] = []
+    for os_version in sorted(
+        {v for os_versions in versions.values() for v in os_versions}, reverse=True
+    ):
+        keywords = {
+            platform: _keywords(platform_rules[(platform, os_version)])
+            for platform, os_versions in versions.items()
+            if os_version in os_versions
+        }
+        jobs += [
+            BaselineJob(keyword, platform.lower(), os_version)
+            for keyword, platforms in benchmark_map.items()
+            for platform in platforms
+            if keyword in keywords.get(platform.lower(), ())
+        ]
+        for platform in keywords:
+            for tag in all_tags:
+                # TODO: filtering out cmmc_lvl3 for macos and hicp_lp for ios/visionOS. They are incomplete and shouldn't be included.
+                if tag == "cmmc_lvl3" and platform == "macos":
+                    continue
+                if tag == "hicp_lp" and (platform == "ios" or platform == "visionos"):
+                    continue
+                if tag in keywords[platform]:
+                    jobs.append(BaselineJob(tag, platform, os_version))
 
-    # process every discovered tag and generate a baseline file for every supported platform
-    for platform in mscp_data["versions"]["platforms"]:
-        args.os_name = platform
-
-        for tag in all_tags:
-            # TODO: filtering out cmmc_lvl3 for macos and hicp_lp for ios/visionOS. They are incomplete and shouldn't be included.
-            if tag == "cmmc_lvl3" and platform == "macos":
-                continue
-            if tag == "hicp_lp" and (platform == "ios" or platform == "visionos"):
-                continue
-            args.keyword = tag
-            generate_baseline(
-                args, admin=True, preloaded_rules=platform_rules[platform]
-            )
+    jobs = list(dict.fromkeys(jobs))
+    resources = BaselineResources.load(platform_rules)
+
+    # skip the baselines whose inputs and file match the manifest
+    inputs: dict[BaselineJob, tuple[str, list[str]]] = {}
+    for job in jobs:
+        rules = select_rules(
+            platform_rules[(job.os_name, job.os_version)],
+            job.keyword,
+            job.os_name,
+            job.os_version,
+            members=resources.benchmark_members[(job.os_name, job.os_version)],
+        )
+        inputs[job] = (
+            inputs_digest(_job_inputs(job, rules, resources)),
+            [rule.rule_id for rule in rules],
+        )
+    outdated = [
+        job for job in jobs if not manifest.is_current(job.name, inputs[job][0])
+    ]
+
+    _remove_other_files(baselines_dir, {job.name for job in jobs})
+    for name in set(manifest.names()) - {job.name for job in jobs}:
+        manifest.discard(name)
+
+    run_baseline_jobs(args, outdated, platform_rules, resources)
+
+    for job in outdated:
+        if (baselines_dir / job.name).is_file():
+            manifest.record(job.name, *inputs[job])
+        else:
+            manifest.discard(job.name)
+    manifest.save()
+
+    logger.info(
+        "Generated {} baselines, {} unchanged", len(outdated), len(jobs) - len(outdated)
+    )
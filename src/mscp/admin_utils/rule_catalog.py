@@ -0,0 +1,30 @@
+# mscp/admin_utils/rule_catalog.py
+"""Build the SQLite rule catalog.
+
+Wires up the ``mscp admin catalog build`` subcommand, which loads every
+supported platform and OS version (including custom rules and
+overrides) into a `RuleLibrary` and writes it with `write_catalog`. See
+`mscp.classes.rule_catalog` for the table layout.
+"""
+
+# Standard python modules
+import argparse
+from pathlib import Path
+
+# Local python modules
+from ..classes import RuleLibrary, write_catalog
+from ..common_utils import config, logger
+
+
+def build_rule_catalog(args: argparse.Namespace) -> None:
+    """Write every rule for every supported platform to a SQLite catalog.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments. Reads ``output``
+            (catalog file; defaults to ``mscp_catalog.sqlite`` under
+            ``config["output_dir"]``).
+    """
+    output = Path(args.output or Path(config["output_dir"], "mscp_catalog.sqlite"))
+    library = RuleLibrary.from_rules_dir()
+    write_catalog(library, output)
+    logger.success("Wrote rule catalog with {} rules to {}", len(library), output)
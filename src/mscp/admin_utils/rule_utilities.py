@@ -17,7 +17,10 @@ from ..common_utils import (
     mscp_data,
     open_file,
     create_file,
+    find_file,
+    find_file_by_id,
     PLATFORM_MAP,
+    YAML_SUFFIXES,
     SCHEMA_PATH,
     conditional_inject_spinner,
 )
@@ -68,14 +71,11 @@ def get_rule_file(rule_id: str, rules_dir: Path) -> Path | None:
         rule_id (str): The ID of the rule to look up
         rules_dir (Path): The location to look for the rule files
     """
-    rule_file = next(rules_dir.rglob(f"{rule_id}.y*ml"), None)
+    rule_file = find_file(rule_id, [rules_dir], YAML_SUFFIXES)
 
     if rule_file:
         return rule_file
-    for possible_rule_file in rules_dir.rglob("*.y*ml"):
-        if open_file(possible_rule_file).get("id") == rule_id:
-            return possible_rule_file
-    return None
+    return find_file_by_id(rule_id, [rules_dir])
 
 
 def add_new_rule(args: argparse.Namespace) -> None:
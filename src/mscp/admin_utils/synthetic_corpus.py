@@ -0,0 +1,292 @@
+# mscp/admin_utils/synthetic_corpus.py
+"""Generate a scaled, synthetic rule library for performance testing.
+
+Wires up the ``mscp admin synthetic`` subcommand. Every rule file under
+the configured rules directory is copied ``--scale`` times into a new
+rules tree; copy 0 is the original rule, written verbatim, and copies
+1..N-1 get an ``_sNNN`` suffix. Copies keep the benchmarks,
+``mobileconfig_info`` and ``ddm_info`` payloads of the rule they were
+made from and pass ``mscp admin validate``, but differ from it so they
+do not all hit the same cache and index entries:
+
+- copy N is tagged ``synthetic_sNNN`` on top of the original tags,
+- numeric and enum ODV values are shifted by N within their validation
+  bounds,
+- copies are spread round-robin over the other section folders.
+
+Every bundled baseline is rewritten alongside it with each rule expanded
+to all of its copies, placed in the profile section of their folder.
+
+The output directory is marked with `MARKER_NAME`; the generator only
+clears the ``rules`` and ``baselines`` folders of a directory it wrote
+itself and refuses any other non-empty output directory.
+
+The generated tree is meant to be used with ``-R``::
+
+    mscp admin synthetic --scale 10 --output /tmp/corpus
+    mscp -R /tmp/corpus/rules admin validate
+    mscp -R /tmp/corpus/rules baseline -k cis_lvl1
+"""
+
+# Standard python modules
+import argparse
+import copy
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+# Local python modules
+from ..classes import Sectionmap
+from ..common_utils import (
+    config,
+    create_text,
+    create_yaml,
+    logger,
+    make_dir,
+    open_file,
+    open_text,
+)
+
+#: Rule folders that are copied once only; their rules are referenced by
+#: ID from the section files and must not be duplicated.
+SINGLETON_FOLDERS: frozenset[str] = frozenset({"supplemental"})
+
+#: File marking a directory as written by `generate_synthetic_corpus`.
+MARKER_NAME: str = ".mscp_synthetic_corpus"
+
+_ID_LINE = re.compile(r"^id:[ \t]*(\S+)[ \t]*$", re.MULTILINE)
+
+
+def synthetic_rule_id(rule_id: str, number: int) -> str:
+    """Return the ID of copy number ``number`` of ``rule_id``.
+
+    Args:
+        rule_id (str): Original rule ID.
+        number (int): Copy number; ``0`` is the original rule.
+
+    Returns:
+        str: The rule ID for that copy.
+    """
+    return rule_id if number == 0 else f"{rule_id}_s{number:03}"
+
+
+def _vary_odv(odv: dict[str, Any], number: int) -> None:
+    """Shift the numeric and enum ODV values of a rule copy in place.
+
+    Values stay within the ``hint`` validation bounds; other values are
+    left alone, since they are matched verbatim by checks and fixes.
+    """
+    validation: dict[str, Any] = odv.get("hint", {}).get("validation", {})
+    enum_values: list[str] = validation.get("enumValues", [])
+
+    for key, value in odv.items():
+        if key == "hint":
+            continue
+        if value in enum_values:
+            index = enum_values.index(value) + number
+            odv[key] = enum_values[index % len(enum_values)]
+        elif isinstance(value, int) and not isinstance(value, bool):
+            low = validation.get("min", value)
+            high = validation.get("max", value + number)
+            if low <= value <= high:
+                odv[key] = low + (value - low + number) % (high - low + 1)
+
+
+def _write_rules(
+    source: Path, target: Path, scale: int
+) -> tuple[dict[str, str], set[str]]:
+    """Copy every rule file under ``source`` into ``target`` ``scale`` times.
+
+    Returns:
+        tuple[dict[str, str], set[str]]: The folder each written rule ID
+            was placed in, and the IDs of the rules that were copied only
+            once.
+    """
+    placed: dict[str, str] = {}
+    singletons: set[str] = set()
+    folders: list[str] = sorted(
+        folder.name
+        for folder in source.iterdir()
+        if folder.is_dir()
+        and folder.name not in SINGLETON_FOLDERS
+        and folder.name.upper() in Sectionmap.__members__
+    )
+
+    for rule_file in sorted(source.rglob("*.y*ml")):
+        folder = rule_file.parent.relative_to(source)
+        text = open_text(rule_file)
+
+        if not (match := _ID_LINE.search(text)):
+            logger.warning("Skipping rule file without an id: {}", rule_file)
+            continue
+
+        rule_id = match.group(1)
+        make_dir(target / folder)
+        create_text(target / folder / rule_file.name, text)
+        placed[rule_id] = folder.name
+
+        if folder.parts[:1] and folder.parts[0] in SINGLETON_FOLDERS:
+            singletons.add(rule_id)
+            continue
+
+        rule: dict[str, Any] = open_file(rule_file)
+        offset = folders.index(folder.name) if folder.name in folders else None
+        for number in range(1, scale):
+            new_id = synthetic_rule_id(rule_id, number)
+            copy_folder = folder
+            if offset is not None:
+                copy_folder = Path(folders[(offset + number) % len(folders)])
+
+            rule_copy = copy.deepcopy(rule)
+            rule_copy["id"] = new_id
+            rule_copy["tags"] = [*rule.get("tags", []), f"synthetic_s{number:03}"]
+            if isinstance(rule_copy.get("odv"), dict):
+                _vary_odv(rule_copy["odv"], number)
+
+            make_dir(target / copy_folder)
+            create_yaml(target / copy_folder / f"{new_id}{rule_file.suffix}", rule_copy)
+            placed[new_id] = copy_folder.name
+
+    return placed, singletons
+
+
+def _section_names(folders: set[str]) -> dict[str, str]:
+    """Map each rule folder to the name of its section (see `Sectionmap`)."""
+    names: dict[str, str] = {}
+    for folder in folders:
+        section_file = Path(
+            config["sections_dir"], f"{Sectionmap[folder.upper()]}.yaml"
+        )
+        if section_file.is_file():
+            names[folder] = open_file(section_file).get("name", "")
+    return names
+
+
+def _write_baselines(
+    source: Path,
+    target: Path,
+    scale: int,
+    singletons: set[str],
+    sections: dict[str, str],
+) -> int:
+    """Rewrite every baseline under ``source`` with its rules scaled out.
+
+    Copies of a rule listed under its own folder's section move to the
+    section of the folder they were written to; rules in any other
+    profile section (``Inherent``, ``Permanent``, ...) keep their copies
+    there.
+
+    Returns:
+        int: Number of baseline files written.
+    """
+    written = 0
+    for baseline_file in sorted(source.rglob("*.yaml")):
+        baseline = open_file(baseline_file)
+        profile: dict[str, dict[str, Any]] = {}
+        for section in baseline.get("profile", []):
+            profile[section["section"]] = {**section, "rules": []}
+
+        for section in baseline.get("profile", []):
+            for rule_id in section.get("rules", []):
+                own_section = sections.get(rule_id) == section["section"]
+                for number in range(1 if rule_id in singletons else scale):
+                    new_id = synthetic_rule_id(rule_id, number)
+                    name = section["section"]
+                    if own_section and new_id in sections:
+                        name = sections[new_id]
+                    profile.setdefault(name, {"section": name, "rules": []})
+                    profile[name]["rules"].append(new_id)
+
+        if "profile" in baseline:
+            baseline["profile"] = list(profile.values())
+
+        output_file = target / baseline_file.relative_to(source)
+        make_dir(output_file.parent)
+        create_yaml(output_file, baseline)
+        written += 1
+
+    return written
+
+
+def _prepare_output(output: Path) -> bool:
+    """Check that ``output`` may hold the corpus and clear its last one.
+
+    Only a directory that is empty, missing, or marked with `MARKER_NAME`
+    is used. Symlinked ``rules`` / ``baselines`` folders (such as the
+    repository-root links to the bundled library) are never followed.
+
+    Returns:
+        bool: ``True`` if the corpus can be written to ``output``.
+    """
+    marker = output / MARKER_NAME
+    if output.exists() and not output.is_dir():
+        logger.error("Synthetic corpus output is not a directory: {}", output)
+        return False
+
+    if output.is_dir() and not marker.is_file() and any(output.iterdir()):
+        logger.error(
+            "Refusing to write a synthetic corpus to {}: it has content that "
+            "was not written by mscp admin synthetic",
+            output,
+        )
+        return False
+
+    for folder in (output / "rules", output / "baselines"):
+        if folder.is_symlink() or (folder.exists() and not folder.is_dir()):
+            logger.error("Refusing to replace {}: not a directory", folder)
+            return False
+
+    make_dir(output)
+    create_text(marker, "Generated by mscp admin synthetic; safe to delete.\n")
+    for folder in (output / "rules", output / "baselines"):
+        if folder.exists():
+            logger.debug("Removing previous synthetic corpus folder: {}", folder)
+            shutil.rmtree(folder)
+        make_dir(folder)
+
+    return True
+
+
+def generate_synthetic_corpus(args: argparse.Namespace) -> None:
+    """Write a rule library ``args.scale`` times the size of the current one.
+
+    Rules are read from ``config["rules_dir"]`` and baselines from
+    ``config["baseline_dir"]``. The ``rules`` and ``baselines`` folders
+    of a previous corpus in the output directory are removed first, so
+    re-running with a smaller scale leaves no stale copies behind. Exits
+    with an error if the output directory holds anything else (see
+    `_prepare_output`).
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments. Reads ``scale``
+            (number of copies of each rule) and ``output`` (corpus
+            directory; defaults to ``synthetic_corpus`` under
+            ``config["output_dir"]``).
+    """
+    output = Path(args.output or Path(config["output_dir"], "synthetic_corpus"))
+    rules_dir = output / "rules"
+    baselines_dir = output / "baselines"
+
+    if not _prepare_output(output):
+        sys.exit(1)
+
+    logger.info("Generating synthetic corpus at {} (scale {})", output, args.scale)
+    placed, singletons = _write_rules(
+        Path(config["rules_dir"]), rules_dir, args.scale
+    )
+    section_names = _section_names(set(placed.values()))
+    sections = {
+        rule_id: section_names[folder]
+        for rule_id, folder in placed.items()
+        if folder in section_names
+    }
+    baseline_count = _write_baselines(
+        Path(config["baseline_dir"]), baselines_dir, args.scale, singletons, sections
+    )
+
+    logger.success(
+        "Wrote {} rules and {} baselines to {}", len(placed), baseline_count, output
+    )
+    print(f"Synthetic corpus: {len(placed)} rules, {baseline_count} baselines → {output}")
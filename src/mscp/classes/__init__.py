@@ -4,19 +4,32 @@
 Re-exports the public model classes used throughout mSCP:
 
 - `Baseline`, `Profile`, `Author` — baseline document and its sections.
-- `Macsecurityrule`, `Sectionmap` — security rule model and its section
-  enumeration.
+- `Macsecurityrule`, `Sectionmap`, `RuleHeader`, `ResolvedRule` — security
+  rule model, its section enumeration, its lightweight header and its
+  ODV-resolved view.
 - `Payload` — configuration profile payload model.
 - `RuleLibrary` — ordered, indexed collection of `Macsecurityrule` objects.
+- `ControlCoverage` — rule × 800-53 control matrix and baseline coverage.
+- `RuleRecord` — frozen, read-only projection of a rule for rendering.
+- `ReferenceIndex`, `ReferenceHit` — reverse index from framework
+  identifiers to the rules carrying them.
+- `write_catalog`, `load_catalog` — SQLite catalog of fully resolved
+  rules, readable without parsing any YAML.
+- `RuleDiff`, `FieldChange`, `diff_rules` — cross-version rule comparison.
 """
 
 from .baseline import Author, Baseline, Profile
 from .legacy_baseline import LegacyBaseline, LegacyProfile
 
 # from .filehandler import FileHandler
-from .macsecurityrule import Macsecurityrule, Sectionmap
+from .macsecurityrule import Macsecurityrule, ResolvedRule, RuleHeader, Sectionmap
 from .payload import Payload
 from .rule_library import RuleLibrary
+from .rule_record import RuleRecord
+from .control_coverage import ControlCoverage
+from .reference_index import ReferenceHit, ReferenceIndex
+from .rule_catalog import load_catalog, write_catalog
+from .rule_diff import FieldChange, RuleDiff, diff_rules
 
 __all__ = [
     "Baseline",
@@ -25,7 +38,18 @@ __all__ = [
     "Macsecurityrule",
     "Payload",
     "Author",
+    "ControlCoverage",
+    "FieldChange",
     "Profile",
+    "ReferenceHit",
+    "ReferenceIndex",
+    "ResolvedRule",
+    "RuleDiff",
+    "RuleHeader",
     "RuleLibrary",
+    "RuleRecord",
     "Sectionmap",
+    "diff_rules",
+    "load_catalog",
+    "write_catalog",
 ]
@@ -9,20 +9,104 @@ methods to load baselines from YAML and write them back out.
 """
 
 # Standard python modules
+import os
 from collections import OrderedDict, defaultdict
 from pathlib import Path
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, NamedTuple, Optional
 
 # Additional python modules
 import pandas as pd
 from pydantic import BaseModel
 
 # Local python modules
-from ..common_utils import config, create_yaml, open_file, search_paths
+from ..common_utils import (
+    YAML_SUFFIXES,
+    config,
+    create_yaml,
+    find_file,
+    open_file,
+    save_rule_cache,
+    search_paths,
+)
 from ..common_utils.logger_instance import logger
 from .macsecurityrule import Macsecurityrule
+from .rule_record import RuleRecord
 
-__all__ = ["Author", "Profile", "Baseline"]
+__all__ = [
+    "Author",
+    "Profile",
+    "Baseline",
+    "load_section_descriptions",
+    "load_section_files",
+]
+
+
+class _SectionFiles(NamedTuple):
+    sections: dict[Path, dict[str, Any]]
+    mtimes: dict[str, int]
+
+
+# parsed section files per (directory, language)
+_section_files: dict[tuple[str, str], _SectionFiles] = {}
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def load_section_files(
+    directory: Path | str, language: str = "en"
+) -> dict[Path, dict[str, Any]]:
+    """Return every section file in ``directory``, parsed, keyed by path.
+
+    The result is memoized per directory and language and re-read only
+    when the directory or one of its files has a new mtime. The returned
+    mapping is shared between callers and must not be mutated.
+
+    Args:
+        directory (Path | str): Sections directory to read.
+        language (str): Language code for localized names and
+            descriptions. Defaults to ``"en"``.
+
+    Returns:
+        dict[Path, dict[str, Any]]: Parsed section files keyed by path.
+    """
+    key = (str(directory), language)
+    cached = _section_files.get(key)
+    if cached is not None and all(
+        _mtime(path) == mtime for path, mtime in cached.mtimes.items()
+    ):
+        return cached.sections
+
+    sections: dict[Path, dict[str, Any]] = {}
+    mtimes: dict[str, int] = {key[0]: _mtime(key[0])}
+    for yaml_file in Path(directory).glob("*.y*ml"):
+        mtimes[str(yaml_file)] = _mtime(str(yaml_file))
+        sections[yaml_file] = open_file(yaml_file, language)
+
+    _section_files[key] = _SectionFiles(sections=sections, mtimes=mtimes)
+    return sections
+
+
+def load_section_descriptions(language: str = "en") -> dict[str, str]:
+    """Return section name → description from ``config["sections_dir"]``.
+
+    Args:
+        language (str): Language code for localized descriptions.
+            Defaults to ``"en"``.
+
+    Returns:
+        dict[str, str]: Descriptions keyed by section display name.
+    """
+    return {
+        section_data.get("name"): section_data.get("description", "")
+        for section_data in load_section_files(
+            config["sections_dir"], language
+        ).values()
+    }
 
 
 class Author(BaseModel):
@@ -109,6 +193,14 @@ class Baseline(BaseModel):
         "Supplemental",
     ]
 
+    #: Tags that place a rule in a section of their own, in precedence order.
+    _SPECIAL_SECTIONS: ClassVar[dict[str, str]] = {
+        "inherent": "Inherent",
+        "permanent": "Permanent",
+        "n_a": "Not Applicable",
+        "supplemental": "Supplemental",
+    }
+
     authors: list[Author]
     profile: list[Profile]
     name: str
@@ -131,6 +223,12 @@ class Baseline(BaseModel):
         that user-provided section files shadow the bundled defaults on a
         per-file basis.
 
+        The rules of every profile are loaded in one batch: their files
+        are parsed together (see `Macsecurityrule.collect_platform_rules`)
+        and the platform's version data and customization overrides are
+        resolved once, then each profile's rules are built in order.
+        Section files come from `load_section_files`.
+
         Args:
             file_path (Path): Path to the baseline YAML file.
             language (str): Language code passed through to the file
@@ -151,45 +249,58 @@ class Baseline(BaseModel):
 
         platform: dict[str, Any] = baseline_data["platform"]
 
-        # Parse profiles
-        profiles: list[Profile] = []
+        # Resolve the section of every profile first
+        sections: list[tuple[dict[str, Any], list[str]]] = []
+        rules_to_collect: defaultdict[str, list[str]] = defaultdict(list)
         for prof in baseline_data.get("profile", []):
             logger.debug(f"Section Name: {prof['section']}")
             section_clean: str = prof["section"].replace(" ", "").lower()
 
-            section_file = next(
-                (
-                    file
-                    for section_dir in section_dirs
-                    if section_dir.exists()
-                    for file in section_dir.rglob(f"{section_clean}.y*ml")
-                ),
-                None,
-            )
+            section_file = find_file(section_clean, section_dirs, YAML_SUFFIXES)
 
             if not section_file:
                 logger.warning("Rule file not found for rule: {}", prof["section"])
                 continue
 
-            section_data: dict[str, str] = open_file(Path(section_file), language)
+            section_file = Path(section_file)
+            section_data: dict[str, Any] = load_section_files(
+                section_file.parent, language
+            ).get(section_file) or open_file(section_file, language)
 
             logger.debug(f"Section Data: {section_data}")
 
+            sections.append((section_data, prof.get("rules", [])))
+            rules_to_collect[prof["section"]] += prof.get("rules", [])
+
+        # Parse every profile's rule files in one batch
+        documents = Macsecurityrule.load_rule_documents(
+            rules_to_collect, jobs=None, language=language
+        )
+        context = Macsecurityrule.load_context(
+            platform["os"], platform["version"], tailoring=False
+        )
+
+        # Parse profiles
+        profiles: list[Profile] = []
+        for section_data, rule_ids in sections:
             profiles.append(
                 Profile(
                     section=section_data.get("name", "").strip(),
                     description=section_data.get("description", "").strip(),
                     rules=Macsecurityrule.load_rules(
-                        prof.get("rules", []),
+                        rule_ids,
                         platform["os"],
                         platform["version"],
                         baseline_data.get("parent_values", ""),
                         section_data.get("name", "").strip(),
                         tailoring=False,
                         language=language,
+                        documents=documents,
+                        context=context,
                     ),
                 )
             )
+        save_rule_cache()
 
         # Instantiate Baseline object
         baseline = cls(
@@ -217,6 +328,7 @@ class Baseline(BaseModel):
         os_version: float,
         baseline_dict: dict[str, Any],
         language: str = "en",
+        section_descriptions: dict[str, str] | None = None,
     ) -> "Baseline":
         """Build a new baseline from a rule set and write it to YAML.
 
@@ -245,14 +357,18 @@ class Baseline(BaseModel):
                 are filled in if absent.
             language (str): Language code for loaded section descriptions.
                 Defaults to ``"en"``.
+            section_descriptions (dict[str, str] | None): Section name →
+                description, as returned by `load_section_descriptions`.
+                Loaded for ``language`` when omitted; pass it to share one
+                copy across many baselines.
 
         Returns:
             Baseline: The newly constructed and written baseline.
 
         Side Effects:
-            Writes the generated baseline to ``output_file``. Reads every
-            ``*.y*ml`` file in ``config["sections_dir"]`` to resolve
-            section descriptions.
+            Writes the generated baseline to ``output_file``. Unless
+            ``section_descriptions`` is given, reads every ``*.y*ml`` file
+            in ``config["sections_dir"]`` to resolve section descriptions.
         """
 
         description: str = ""
@@ -283,32 +399,12 @@ class Baseline(BaseModel):
 
             baseline_dict["description"] = description.strip()
 
-        special_sections: dict[str, str] = {
-            "inherent": "Inherent",
-            "permanent": "Permanent",
-            "n_a": "Not Applicable",
-            "supplemental": "Supplemental",
-        }
-
         grouped_rules: defaultdict[str, list[Macsecurityrule]] = defaultdict(list)
-        section_descriptions: dict[str, str] = {}
-
-        for yaml_file in Path(config["sections_dir"]).glob("*.y*ml"):
-            section_data: dict = open_file(yaml_file, language)
-            section_descriptions[section_data.get("name")] = section_data.get(
-                "description", ""
-            )
+        if section_descriptions is None:
+            section_descriptions = load_section_descriptions(language)
 
         for rule in rules:
-            matched: bool = False
-            for tag, section_name in special_sections.items():
-                if rule.tags is not None and tag in rule.tags:
-                    grouped_rules[section_name].append(rule)
-                    matched = True
-                    break
-
-            if not matched:
-                grouped_rules[rule.section].append(rule)
+            grouped_rules[cls.profile_section(rule)].append(rule)
 
         for section in grouped_rules:
             grouped_rules[section] = sorted(
@@ -338,12 +434,32 @@ class Baseline(BaseModel):
         baseline.to_yaml(output_path=output_file)
         return baseline
 
+    @classmethod
+    def profile_section(cls, rule: Macsecurityrule) -> str:
+        """Return the profile section `create_new` places ``rule`` in.
+
+        Rules tagged ``inherent``, ``permanent``, ``n_a`` or
+        ``supplemental`` go to that special section (first match wins);
+        every other rule stays in its own ``section``.
+
+        Args:
+            rule (Macsecurityrule): Rule to place.
+
+        Returns:
+            str: Section display name.
+        """
+        for tag, section_name in cls._SPECIAL_SECTIONS.items():
+            if rule.tags is not None and tag in rule.tags:
+                return section_name
+        return rule.section
+
     def to_dataframe(self) -> pd.DataFrame:
         """Flatten the baseline's rules into a `pandas.DataFrame`.
 
-        Each rule contributes one row. The nested ``references`` mapping
-        is unpacked so each reference namespace (``nist``, ``disa``, etc.)
-        becomes its own column.
+        Each rule contributes one row built from its `RuleRecord`, with
+        identical long text fields shared across rows. The nested
+        ``references`` mapping is unpacked so each reference namespace
+        (``nist``, ``disa``, etc.) becomes its own column.
 
         Returns:
             pd.DataFrame: One row per rule across all profiles, with rule
@@ -351,9 +467,10 @@ class Baseline(BaseModel):
         """
 
         rules: list[dict] = []
+        pool: dict[str, str] = {}
         for profile in self.profile:
             for rule in profile.rules:
-                rule_data = rule.model_dump()
+                rule_data = RuleRecord.from_rule(rule, pool).to_dict()
                 references = rule_data.pop("references", {})
 
                 for ref_key, ref_value in references.items():
@@ -363,6 +480,29 @@ class Baseline(BaseModel):
 
         return pd.DataFrame(rules)
 
+    def to_template_dict(self) -> dict[str, Any]:
+        """Return the baseline as template context, with rules as `RuleRecord`s.
+
+        Equivalent to ``model_dump()`` except that each profile's
+        ``rules`` holds read-only `RuleRecord` projections instead of
+        fully dumped rules, sharing identical long text fields.
+
+        Returns:
+            dict[str, Any]: Baseline fields; ``profile`` is a list of
+                ``{"section", "description", "rules"}`` dicts.
+        """
+        data = self.model_dump(exclude={"profile"})
+        pool: dict[str, str] = {}
+        data["profile"] = [
+            {
+                "section": profile.section,
+                "description": profile.description,
+                "rules": [RuleRecord.from_rule(rule, pool) for rule in profile.rules],
+            }
+            for profile in self.profile
+        ]
+        return data
+
     def to_yaml(self, output_path: Path) -> None:
         """Serialize this baseline to YAML in canonical key order.
 
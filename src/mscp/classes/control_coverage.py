@@ -0,0 +1,232 @@
+# mscp/classes/control_coverage.py
+"""NIST SP 800-53r5 control coverage across a rule library.
+
+Provides `ControlCoverage`, which builds a boolean rule × control
+matrix from a collection of rules (typically a multi-platform
+`RuleLibrary`) and answers, for every platform / OS version at once,
+which controls of each 800-53 baseline (``low``, ``moderate``, ``high``
+and any other list in ``includes/800-53_baselines.yaml``) are covered by
+at least one rule and which are missing, plus per-rule control counts.
+
+Coverage is computed with matrix products over the whole library
+rather than per-platform loops; control IDs are compared after
+`normalize_control_id` normalization (``"AC-02"`` == ``"AC-2"``).
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterable
+
+# Additional python modules
+import numpy as np
+import pandas as pd
+
+# Local python modules
+from ..common_utils import config, create_csv, create_json, make_dir, open_file
+from ..common_utils.logger_instance import logger
+from .macsecurityrule import Macsecurityrule
+from .rule_library import normalize_control_id
+
+
+def _control_sort_key(control: str) -> tuple[str, int, int, str]:
+    """Sort key ordering ``AC-2`` < ``AC-2(1)`` < ``AC-14``."""
+    match = re.match(r"([A-Z]+)-(\d+)(?:\((\d+)\))?", control)
+    if not match:
+        return (control, 0, 0, control)
+    family, number, enhancement = match.groups()
+    return (family, int(number), int(enhancement or 0), control)
+
+
+def load_nist_baselines() -> dict[str, list[str]]:
+    """Return the control lists from ``includes/800-53_baselines.yaml``.
+
+    Returns:
+        dict[str, list[str]]: Baseline name (e.g. ``"low"``) → control IDs.
+    """
+    data = open_file(Path(config.get("includes_dir", ""), "800-53_baselines.yaml"))
+    return {name: list(controls or []) for name, controls in data.items()}
+
+
+class ControlCoverage:
+    """Boolean rule × control matrix with per-platform baseline coverage.
+
+    Args:
+        rules (Iterable[Macsecurityrule]): Rules to analyze. Rules for
+            several platforms / OS versions may be mixed; each
+            ``(os_type, os_version)`` pair is reported separately.
+        baselines (dict[str, list[str]] | None): Baseline name → required
+            controls. Defaults to `load_nist_baselines`.
+
+    Attributes:
+        rules (list[Macsecurityrule]): The analyzed rules (matrix rows).
+        controls (list[str]): Normalized control IDs (matrix columns),
+            in family / number / enhancement order.
+        platforms (list[tuple[str, float]]): ``(os_type, os_version)``
+            pairs, in first-seen order.
+        matrix (np.ndarray): ``rules × controls`` boolean matrix; ``True``
+            where the rule references the control.
+        required (np.ndarray): ``baselines × controls`` boolean matrix of
+            the controls each baseline requires.
+        covered (np.ndarray): ``platforms × controls`` boolean matrix;
+            ``True`` where any rule for the platform covers the control.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Macsecurityrule],
+        baselines: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.rules: list[Macsecurityrule] = list(rules)
+        self.baselines: dict[str, list[str]] = (
+            load_nist_baselines() if baselines is None else baselines
+        )
+
+        rule_controls = [
+            {normalize_control_id(c) for c in rule.references.nist.nist_800_53r5 or []}
+            for rule in self.rules
+        ]
+        baseline_controls = {
+            name: {normalize_control_id(c) for c in controls}
+            for name, controls in self.baselines.items()
+        }
+        self.controls: list[str] = sorted(
+            set().union(*rule_controls, *baseline_controls.values()),
+            key=_control_sort_key,
+        )
+        column = {control: i for i, control in enumerate(self.controls)}
+
+        self.matrix: np.ndarray = np.zeros(
+            (len(self.rules), len(self.controls)), dtype=bool
+        )
+        rows = [row for row, controls in enumerate(rule_controls) for _ in controls]
+        cols = [column[c] for controls in rule_controls for c in controls]
+        self.matrix[rows, cols] = True
+
+        self.required: np.ndarray = np.zeros(
+            (len(self.baselines), len(self.controls)), dtype=bool
+        )
+        for row, controls in enumerate(baseline_controls.values()):
+            self.required[row, [column[c] for c in controls]] = True
+
+        keys = [(rule.os_type, rule.os_version) for rule in self.rules]
+        self.platforms: list[tuple[str, float]] = list(dict.fromkeys(keys))
+        group = {key: i for i, key in enumerate(self.platforms)}
+        membership = np.zeros((len(self.platforms), len(self.rules)), dtype=np.int32)
+        membership[[group[key] for key in keys], np.arange(len(self.rules))] = 1
+
+        self.covered: np.ndarray = (membership @ self.matrix.astype(np.int32)) > 0
+
+    def missing(self, os_type: str, os_version: float, baseline: str) -> list[str]:
+        """Return the controls of ``baseline`` no rule for the platform covers.
+
+        Args:
+            os_type (str): Platform, as stored on the rules (e.g. ``"macOS"``).
+            os_version (float): OS version.
+            baseline (str): Baseline name (e.g. ``"low"``).
+
+        Returns:
+            list[str]: Missing control IDs, in `controls` order.
+        """
+        row = self.platforms.index((os_type, os_version))
+        gaps = self.required[list(self.baselines).index(baseline)] & ~self.covered[row]
+        return [self.controls[i] for i in np.flatnonzero(gaps)]
+
+    def summary(self) -> pd.DataFrame:
+        """Return coverage per platform / OS version and baseline.
+
+        Returns:
+            pd.DataFrame: One row per platform, version and baseline with
+                ``required``, ``covered`` and ``missing`` counts, the
+                ``coverage`` percentage and the list of missing controls.
+        """
+        required = self.required.astype(np.int32)
+        covered_counts = self.covered.astype(np.int32) @ required.T
+        totals = required.sum(axis=1)
+        gaps = self.required[np.newaxis, :, :] & ~self.covered[:, np.newaxis, :]
+
+        records: list[dict[str, Any]] = []
+        for p, (os_type, os_version) in enumerate(self.platforms):
+            for b, name in enumerate(self.baselines):
+                total = int(totals[b])
+                covered = int(covered_counts[p, b])
+                records.append(
+                    {
+                        "platform": os_type,
+                        "os_version": os_version,
+                        "baseline": name,
+                        "required": total,
+                        "covered": covered,
+                        "missing": total - covered,
+                        "coverage": round(100 * covered / total, 1) if total else 100.0,
+                        "missing_controls": [
+                            self.controls[i] for i in np.flatnonzero(gaps[p, b])
+                        ],
+                    }
+                )
+        return pd.DataFrame.from_records(records)
+
+    def rule_counts(self) -> pd.DataFrame:
+        """Return the number of controls each rule maps to.
+
+        Returns:
+            pd.DataFrame: One row per rule with its total control count
+                and the number of controls it contributes to each
+                baseline.
+        """
+        per_baseline = self.matrix.astype(np.int32) @ self.required.astype(np.int32).T
+        frame = pd.DataFrame(
+            {
+                "rule_id": [rule.rule_id for rule in self.rules],
+                "platform": [rule.os_type for rule in self.rules],
+                "os_version": [rule.os_version for rule in self.rules],
+                "controls": self.matrix.sum(axis=1),
+            }
+        )
+        for b, name in enumerate(self.baselines):
+            frame[name] = per_baseline[:, b]
+        return frame
+
+    def write(self, output_dir: Path, output_format: str = "csv") -> list[Path]:
+        """Write the coverage summary and per-rule counts to ``output_dir``.
+
+        CSV output produces ``coverage_summary.csv`` (missing controls
+        joined with ``;``) and ``coverage_rules.csv``; JSON output
+        produces a single ``coverage.json`` with ``summary`` and
+        ``rules`` lists.
+
+        Args:
+            output_dir (Path): Directory to write to; created if needed.
+            output_format (str): ``"csv"`` or ``"json"``.
+
+        Returns:
+            list[Path]: The files written.
+        """
+        make_dir(output_dir)
+        summary = self.summary()
+        rules = self.rule_counts()
+
+        if output_format == "json":
+            path = output_dir / "coverage.json"
+            create_json(
+                path,
+                {
+                    "summary": json.loads(summary.to_json(orient="records")),
+                    "rules": json.loads(rules.to_json(orient="records")),
+                },
+            )
+            written = [path]
+        else:
+            summary["missing_controls"] = summary["missing_controls"].str.join(";")
+            written = [
+                output_dir / "coverage_summary.csv",
+                output_dir / "coverage_rules.csv",
+            ]
+            create_csv(written[0], summary.to_dict(orient="records"))
+            create_csv(written[1], rules.to_dict(orient="records"))
+
+        logger.success("Wrote control coverage: {}", ", ".join(map(str, written)))
+        return written
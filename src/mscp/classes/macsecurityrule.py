@@ -8,14 +8,17 @@ filenames.
 
 # Standard python modules
 import base64
+import copy
+import os
+import pickle
 from collections import OrderedDict, defaultdict
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, NamedTuple
 from uuid import uuid4
 
 # Additional python modules
-from pydantic import Field, ValidationError, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, field_validator
 
 # Local python modules
 from ._base import BaseModelWithAccessors
@@ -26,13 +29,16 @@ from .references import References
 from ..common_utils import (
     config,
     create_yaml,
+    get_file_index,
     get_version_data,
+    load_rule_file,
+    load_rule_files,
     make_dir,
     mscp_data,
-    open_file,
     sanitize_input,
     prompt_for_odv,
     collect_overrides,
+    save_rule_cache,
 )
 from ..common_utils.logger_instance import logger
 
@@ -49,6 +55,186 @@ def deep_merge(a, b, preferred_key=None):
     return a
 
 
+def _apply_overrides(rule_yaml: dict[str, Any], overrides: dict[str, Any]) -> list[str]:
+    """Merge a rule's customization overrides into its parsed YAML in place.
+
+    ``references`` are updated, ``tags`` are extended, ``platforms`` are
+    deep-merged and every other key is replaced. Override values are deep
+    copied first, since `collect_overrides` shares them between calls and
+    the rule is normalized in place afterwards.
+
+    Args:
+        rule_yaml: Parsed rule document, with ``rule_id`` already set.
+        overrides: Override values for this rule (see `collect_overrides`).
+
+    Returns:
+        list[str]: The customized keys, in override order.
+    """
+    customized_fields: list[str] = []
+
+    if overrides:
+        logger.info(f"Found customization for {rule_yaml['rule_id']}")
+
+    for custom_rule_key, custom_rule_value in copy.deepcopy(overrides).items():
+        logger.debug(
+            f"Found customization ({custom_rule_value}) for {custom_rule_key} in {rule_yaml['rule_id']}"
+        )
+        customized_fields.append(custom_rule_key)
+        if custom_rule_key == "references":
+            rule_yaml[custom_rule_key].update(custom_rule_value)
+            continue
+        if custom_rule_key == "tags":
+            if custom_rule_value not in rule_yaml[custom_rule_key]:
+                rule_yaml[custom_rule_key] += custom_rule_value
+            continue
+        if custom_rule_key == "platforms":
+            platform_info = rule_yaml.get("platforms")
+            deep_merge(platform_info, custom_rule_value)
+            continue
+
+        rule_yaml[custom_rule_key] = custom_rule_value
+
+    return customized_fields
+
+
+class RuleHeader(NamedTuple):
+    """The fields of a rule needed to decide whether a baseline includes it.
+
+    Produced by `Macsecurityrule.collect_platform_headers` without
+    building the full model, and turned into `Macsecurityrule` objects by
+    `Macsecurityrule.from_headers`. Shares the attribute names of
+    `Macsecurityrule`, so keyword helpers accept either.
+
+    Attributes:
+        rule_id: Rule identifier (the YAML ``id``).
+        section: Section name the rule is loaded under.
+        tags: Tags, with customization overrides applied.
+        platforms: Platform data, with customization overrides applied.
+        odv: Organizational Defined Values keyed by benchmark, if any.
+        source_file: The rule's YAML file.
+        document: The parsed rule file without customization overrides,
+            so `from_headers` does not need to read it again. Shared, not
+            copied; `from_headers` copies it for the rules it builds.
+    """
+
+    rule_id: str
+    section: str
+    tags: list[str]
+    platforms: dict[str, dict[str, Any]]
+    odv: dict[str, Any] | None
+    source_file: Path
+    document: dict[str, Any]
+
+
+#: Rule fields searched for ``$ODV`` placeholders, in substitution order.
+_ODV_FIELDS: tuple[str, ...] = (
+    "title",
+    "discussion",
+    "check",
+    "fix",
+    "result_value",
+    "mobileconfig_info",
+    "ddm_info",
+    "platforms",
+)
+
+
+class _LoadContext(NamedTuple):
+    """Per-platform state `Macsecurityrule.load_rules` needs for every rule.
+
+    Built once by `Macsecurityrule.load_context` and shared by the
+    ``load_rules`` calls of a batched load.
+    """
+
+    os_name: str
+    rule_files: dict[str, Path]
+    overrides: dict[str, Any]
+
+
+class _OdvSlot(NamedTuple):
+    """One ``$ODV`` placeholder in a rule: where it is and what it says.
+
+    ``filled`` is the value last written to ``path`` by
+    `Macsecurityrule._fill_in_odv`; a different current value means the
+    field was reassigned since, and the current value is used as the
+    template instead.
+    """
+
+    path: tuple[str | int, ...]
+    template: str
+    filled: Any
+
+
+def _odv_paths(obj: Any, path: tuple[str | int, ...]) -> Iterator[tuple[tuple, str]]:
+    """Yield ``(path, string)`` for every string under ``obj`` containing ``$ODV``."""
+    if isinstance(obj, str):
+        if "$ODV" in obj:
+            yield path, obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from _odv_paths(value, (*path, key))
+    elif isinstance(obj, list):
+        for index, value in enumerate(obj):
+            yield from _odv_paths(value, (*path, index))
+    elif isinstance(obj, Mobileconfigpayload):
+        yield from _odv_paths(obj.payload_content, (*path, "payload_content"))
+
+
+def _get_path(obj: Any, path: tuple[str | int, ...]) -> Any:
+    for key in path:
+        obj = getattr(obj, key) if isinstance(obj, BaseModel) else obj[key]
+    return obj
+
+
+def _set_path(obj: Any, path: tuple[str | int, ...], value: Any) -> Any:
+    """Return ``obj`` with ``path`` set to ``value``.
+
+    Only the containers along ``path`` are copied; everything else is
+    shared with ``obj``.
+    """
+    if not path:
+        return value
+    key, rest = path[0], path[1:]
+    if isinstance(obj, BaseModel):
+        return obj.model_copy(update={key: _set_path(getattr(obj, key), rest, value)})
+    obj = obj.copy()
+    obj[key] = _set_path(obj[key], rest, value)
+    return obj
+
+
+class ResolvedRule:
+    """Read-only view of a `Macsecurityrule` with ``$ODV`` resolved for one benchmark.
+
+    Returned by `Macsecurityrule.resolve_odv`. Fields that contain an
+    ``$ODV`` placeholder hold the resolved value; every other attribute is
+    read straight from the underlying rule, so no copy of the rule is made.
+    Supports attribute, ``[]`` and ``get`` access like the rule itself.
+    """
+
+    __slots__ = ("_rule", "_values")
+
+    def __init__(self, rule: "Macsecurityrule", values: dict[str, Any]) -> None:
+        self._rule = rule
+        self._values = values
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        return getattr(self._rule, name)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, attr: str, default: Any = None) -> Any:
+        return getattr(self, attr, default)
+
+    def __repr__(self) -> str:
+        return f"ResolvedRule({self._rule.rule_id!r})"
+
+
 class Sectionmap(StrEnum):
     """Mapping from rule directory names to canonical section filenames.
 
@@ -143,6 +329,7 @@ class Macsecurityrule(BaseModelWithAccessors):
     severity: str | None = None
     default_state: str | None = None
     source_file: Path | None = Field(default=None, exclude=True)
+    _odv_plan: tuple[_OdvSlot, ...] | None = PrivateAttr(default=None)
 
     @field_validator("odv", mode="after")
     @classmethod
@@ -164,13 +351,17 @@ class Macsecurityrule(BaseModelWithAccessors):
         section: str,
         tailoring: bool = False,
         language: str = "en",
+        documents: dict[Path, dict[str, Any]] | None = None,
+        context: _LoadContext | None = None,
     ) -> list["Macsecurityrule"]:
         """Load `Macsecurityrule` objects for a list of rule IDs.
 
-        Resolves each rule ID against ``config["rules_dir"]`` (and the
-        custom rules directory when not tailoring), parses the YAML, and
-        applies any matching customizations (references / tags / platforms
-        merge; other keys overwrite). Rules whose YAML lacks the requested
+        Resolves each rule ID against the file index (`get_file_index`) of
+        ``config["rules_dir"]`` and the custom rules directory (bundled
+        files take precedence; same-named custom files are applied as
+        overrides), parses the YAML through the persistent rule cache
+        (`load_rule_file`), and applies any matching customizations
+        (references / tags / platforms merge; other keys overwrite). Rules whose YAML lacks the requested
         ``os_type`` / ``os_version`` are skipped with a debug log.
 
         Args:
@@ -184,8 +375,14 @@ class Macsecurityrule(BaseModelWithAccessors):
                 special-section override applies).
             tailoring: If true, suppresses loading of customization
                 overrides. Defaults to ``False``.
-            language: Language code passed to `open_file` for localized
-                text. Defaults to ``"en"``.
+            language: Language code passed to `load_rule_file` for
+                localized text. Defaults to ``"en"``.
+            documents: Already parsed rule documents keyed by file path
+                (see `load_rule_files`). Entries are consumed as they are
+                used; files not present are loaded individually.
+            context: Shared platform state from `load_context`, for
+                callers loading several sections of the same platform and
+                version. Resolved for this call when omitted.
 
         Returns:
             Successfully loaded rules. Rules whose YAML file is missing or
@@ -197,22 +394,14 @@ class Macsecurityrule(BaseModelWithAccessors):
         rules: list[Macsecurityrule] = []
         os_version_str: str = str(float(os_version))
         os_version_int: int = int(os_version)
-        current_version_data: dict[str, Any] = get_version_data(
-            os_type, os_version, mscp_data
-        )
-        os_name: str = current_version_data["os_name"]
+        if context is None:
+            context = cls.load_context(os_type, os_version, tailoring)
+        os_name: str = context.os_name
         os_typeversion: str = f"{os_type}_{os_version_int}".lower()
         os_type = os_type.replace("os", "OS")
 
-        rules_dirs: list[Path] = [
-            Path(config["rules_dir"]),
-            Path(Path(config["custom"]["rules_dir"])),
-        ]
-
-        if tailoring:
-            custom_rule_dict = {}
-        else:
-            custom_rule_dict = collect_overrides(Path(config["custom"]["rules_dir"]))
+        rule_files: dict[str, Path] = context.rule_files
+        custom_rule_dict: dict[str, Any] = context.overrides
 
         for rule_id in rule_ids:
             logger.debug("Transforming rule: {}", rule_id)
@@ -226,22 +415,16 @@ class Macsecurityrule(BaseModelWithAccessors):
             severity: str | None = None
             tags: list[str] = []
 
-            rule_file = next(
-                (
-                    file
-                    for rules_dir in rules_dirs
-                    if rules_dir.exists()
-                    for pattern in (f"{rule_id}.y*ml", f"{rule_id}.json")
-                    for file in rules_dir.rglob(pattern)
-                ),
-                None,
-            )
+            rule_file = rule_files.get(rule_id)
 
             if not rule_file:
                 logger.warning("Rule file not found for rule: {}", rule_id)
                 continue
 
-            rule_yaml: dict[str, Any] = open_file(rule_file, language)
+            if documents and rule_file in documents:
+                rule_yaml: dict[str, Any] = documents.pop(rule_file)
+            else:
+                rule_yaml = load_rule_file(rule_file, language)
 
             tags: list[str] = rule_yaml.get("tags", [])
 
@@ -263,30 +446,9 @@ class Macsecurityrule(BaseModelWithAccessors):
 
             rule_yaml["rule_id"] = rule_yaml.pop("id", rule_id)
 
-            customized_fields = []
-
-            if rule_yaml["rule_id"] in custom_rule_dict:
-                logger.info(f"Found customization for {rule_yaml['rule_id']}")
-                for custom_rule_key, custom_rule_value in custom_rule_dict[
-                    rule_yaml["rule_id"]
-                ].items():
-                    logger.debug(
-                        f"Found customization ({custom_rule_value}) for {custom_rule_key} in {rule_yaml['rule_id']}"
-                    )
-                    customized_fields.append(custom_rule_key)
-                    if custom_rule_key == "references":
-                        rule_yaml[custom_rule_key].update(custom_rule_value)
-                        continue
-                    if custom_rule_key == "tags":
-                        if custom_rule_value not in rule_yaml[custom_rule_key]:
-                            rule_yaml[custom_rule_key] += custom_rule_value
-                        continue
-                    if custom_rule_key == "platforms":
-                        platform_info = rule_yaml.get("platforms")
-                        deep_merge(platform_info, custom_rule_value)
-                        continue
-
-                    rule_yaml[custom_rule_key] = custom_rule_value
+            customized_fields: list[str] = _apply_overrides(
+                rule_yaml, custom_rule_dict.get(rule_yaml["rule_id"], {})
+            )
 
             enforcement_info = rule_yaml["platforms"][os_type].get(
                 "enforcement_info", {}
@@ -310,7 +472,6 @@ class Macsecurityrule(BaseModelWithAccessors):
                 )
 
                 if check_result:
-                    print(enforcement_info["check"]["result"].items())
                     for k, v in enforcement_info["check"]["result"].items():
                         if isinstance(v, (int, bool, str)):
                             result_value = v
@@ -492,6 +653,7 @@ class Macsecurityrule(BaseModelWithAccessors):
             rule.source_file = rule_file
 
             if rule.odv is not None and parent_values is not None:
+                rule._compile_odv_plan()
                 rule._fill_in_odv(parent_values)
 
             logger.success("Transformed rule: {}", rule_id)
@@ -510,6 +672,7 @@ class Macsecurityrule(BaseModelWithAccessors):
         os_version: int,
         tailoring: bool = False,
         parent_values: str = "default",
+        jobs: int | None = None,
     ) -> list["Macsecurityrule"]:
         """Load every rule under ``config["rules_dir"]`` for a specific OS type and version.
 
@@ -519,6 +682,11 @@ class Macsecurityrule(BaseModelWithAccessors):
         `load_rules`. Rules that do not declare support for the requested
         ``os_type`` / ``os_version`` are skipped.
 
+        All rule files are parsed up front with `load_rule_files`, using
+        up to ``jobs`` worker processes for files missing from the rule
+        cache. Rules are still assembled section by section in directory
+        order, so the result does not depend on ``jobs``.
+
         Args:
             os_type: Operating system family (e.g. ``"macos"``).
             os_version: Operating system version.
@@ -526,6 +694,8 @@ class Macsecurityrule(BaseModelWithAccessors):
                 ``False``.
             parent_values: ODV lookup key forwarded to `load_rules`.
                 Defaults to ``"default"``.
+            jobs: Maximum number of parser processes. Defaults to
+                ``config["jobs"]`` when set, otherwise the CPU count.
 
         Returns:
             All rules across all sections that match the given platform and version.
@@ -533,8 +703,226 @@ class Macsecurityrule(BaseModelWithAccessors):
 
         logger.info("=== LOADING ALL RULES ===")
 
+        rules_to_collect = cls.collect_rule_sections()
+        documents = cls.load_rule_documents(rules_to_collect, jobs)
+        rules = cls._build_section_rules(
+            rules_to_collect,
+            documents,
+            os_type=os_type,
+            os_version=os_version,
+            tailoring=tailoring,
+            parent_values=parent_values,
+        )
+        save_rule_cache()
+
+        logger.info("=== ALL RULES LOADED ===")
+
+        return rules
+
+    @classmethod
+    def collect_all_platform_rules(
+        cls,
+        platforms: dict[str, list[float]],
+        tailoring: bool = False,
+        parent_values: str = "default",
+        jobs: int | None = None,
+        rule_ids: Iterable[str] | None = None,
+    ) -> list["Macsecurityrule"]:
+        """Load every rule for several OS types and versions in one pass.
+
+        Equivalent to calling `collect_platform_rules` for each
+        ``(os_type, os_version)`` pair in ``platforms``, in order, but the
+        rules directory is walked and every rule file is parsed only once.
+        Each platform is built from its own copy of the parsed documents,
+        since `load_rules` consumes and mutates them.
+
+        Args:
+            platforms: Mapping of OS type (e.g. ``"macos"``) to the OS
+                versions to load for it.
+            tailoring: If true, skips customization overrides. Defaults to
+                ``False``.
+            parent_values: ODV lookup key forwarded to `load_rules`.
+                Defaults to ``"default"``.
+            jobs: Maximum number of parser processes. Defaults to
+                ``config["jobs"]`` when set, otherwise the CPU count.
+            rule_ids: If given, load only the rules with these IDs (file
+                stems). Defaults to every rule.
+
+        Returns:
+            Rules for every requested platform, ordered by platform,
+            version, section and rule.
+        """
+
+        logger.info("=== LOADING ALL RULES FOR ALL PLATFORMS ===")
+
         rules: list[Macsecurityrule] = []
-        rules_to_collect = defaultdict(list)
+        rules_to_collect = cls.collect_rule_sections()
+        if rule_ids is not None:
+            wanted = set(rule_ids)
+            rules_to_collect = {
+                section: selected
+                for section, collected in rules_to_collect.items()
+                if (selected := [r for r in collected if r in wanted])
+            }
+        snapshot: bytes = pickle.dumps(
+            cls.load_rule_documents(rules_to_collect, jobs),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+        for os_type, os_versions in platforms.items():
+            for os_version in os_versions:
+                rules += cls._build_section_rules(
+                    rules_to_collect,
+                    pickle.loads(snapshot),
+                    os_type=os_type,
+                    os_version=os_version,
+                    tailoring=tailoring,
+                    parent_values=parent_values,
+                )
+        save_rule_cache()
+
+        logger.info("=== ALL RULES FOR ALL PLATFORMS LOADED ===")
+
+        return rules
+
+    @classmethod
+    def collect_platform_headers(
+        cls,
+        os_type: str,
+        os_version: float,
+        tailoring: bool = False,
+        jobs: int | None = None,
+    ) -> list[RuleHeader]:
+        """Read the header of every rule for a specific OS type and version.
+
+        Cheap first pass of a two-phase load: walks and parses the rules
+        exactly like `collect_platform_rules` and applies customization
+        overrides, but keeps only the fields in `RuleHeader` instead of
+        building and validating `Macsecurityrule` models. Pass the headers
+        you need to `from_headers` to build the full rules.
+
+        Args:
+            os_type: Operating system family (e.g. ``"macos"``).
+            os_version: Operating system version.
+            tailoring: If true, skips customization overrides. Defaults to
+                ``False``.
+            jobs: Maximum number of parser processes. Defaults to
+                ``config["jobs"]`` when set, otherwise the CPU count.
+
+        Returns:
+            Headers of the rules that support the platform and version, in
+            the order `collect_platform_rules` returns them.
+        """
+        rules_to_collect = cls.collect_rule_sections()
+        documents = cls.load_rule_documents(rules_to_collect, jobs)
+        rule_files: dict[str, Path] = get_file_index(
+            [Path(config["rules_dir"]), Path(config["custom"]["rules_dir"])]
+        )
+
+        if tailoring:
+            custom_rule_dict = {}
+        else:
+            custom_rule_dict = collect_overrides(Path(config["custom"]["rules_dir"]))
+
+        os_type = os_type.replace("os", "OS")
+        os_version_str: str = str(float(os_version))
+        headers: list[RuleHeader] = []
+
+        for section, collected_rules in rules_to_collect.items():
+            for rule_id in collected_rules:
+                rule_file = rule_files.get(rule_id)
+                if not rule_file:
+                    continue
+
+                if rule_file in documents:
+                    rule_yaml: dict[str, Any] = documents.pop(rule_file)
+                else:
+                    rule_yaml = load_rule_file(rule_file)
+
+                if os_version_str not in rule_yaml.get("platforms", {}).get(
+                    os_type, {}
+                ):
+                    continue
+
+                header_id: str = rule_yaml.get("id", rule_id)
+                header_yaml: dict[str, Any] = rule_yaml
+                if overrides := custom_rule_dict.get(header_id):
+                    # keep the document itself free of overrides for from_headers
+                    header_yaml = copy.deepcopy(rule_yaml)
+                    header_yaml["rule_id"] = header_id
+                    _apply_overrides(header_yaml, overrides)
+
+                headers.append(
+                    RuleHeader(
+                        rule_id=header_id,
+                        section=section,
+                        tags=header_yaml.get("tags") or [],
+                        platforms=header_yaml["platforms"],
+                        odv=header_yaml.get("odv"),
+                        source_file=rule_file,
+                        document=rule_yaml,
+                    )
+                )
+        save_rule_cache()
+
+        logger.debug("NUMBER OF RULE HEADERS: {}", len(headers))
+
+        return headers
+
+    @classmethod
+    def from_headers(
+        cls,
+        headers: list[RuleHeader],
+        os_type: str,
+        os_version: float,
+        tailoring: bool = False,
+        parent_values: str = "default",
+    ) -> list["Macsecurityrule"]:
+        """Build the full rules for headers from `collect_platform_headers`.
+
+        Args:
+            headers: Headers of the rules to build, in the desired order.
+            os_type: Operating system family the headers were read for.
+            os_version: Operating system version the headers were read for.
+            tailoring: If true, skips customization overrides. Defaults to
+                ``False``.
+            parent_values: ODV lookup key forwarded to `load_rules`.
+                Defaults to ``"default"``.
+
+        Returns:
+            The same rules `collect_platform_rules` would return for these
+            headers, grouped by section in order of first appearance (the
+            order `collect_platform_headers` already uses).
+        """
+        rules_to_collect: dict[str, list[str]] = defaultdict(list)
+        documents: dict[Path, dict[str, Any]] = {}
+        for header in headers:
+            rules_to_collect[header.section].append(header.source_file.stem)
+            # load_rules consumes its documents; copy only the selected ones
+            documents[header.source_file] = pickle.loads(
+                pickle.dumps(header.document, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+
+        return cls._build_section_rules(
+            rules_to_collect,
+            documents,
+            os_type=os_type,
+            os_version=os_version,
+            tailoring=tailoring,
+            parent_values=parent_values,
+        )
+
+    @staticmethod
+    def collect_rule_sections() -> dict[str, list[str]]:
+        """Map each section name to the rule IDs found in its rules folder.
+
+        Sections appear in the order their folders are first encountered
+        under the bundled and custom rules directories.
+
+        Returns:
+            Rule IDs keyed by section name.
+        """
+        rules_to_collect: dict[str, list[str]] = defaultdict(list)
 
         section_dirs: list[Path] = [
             Path(config["custom"]["sections_dir"]),
@@ -547,7 +935,7 @@ class Macsecurityrule(BaseModelWithAccessors):
         ]
 
         section_data: dict[str, str] = {
-            section_file.stem: open_file(section_file).get("name", "")
+            section_file.stem: load_rule_file(section_file).get("name", "")
             for section_dir in section_dirs
             for section_file in section_dir.glob("*.y*ml")
             if section_file.is_file()
@@ -590,6 +978,93 @@ class Macsecurityrule(BaseModelWithAccessors):
                             "Failed to load rule from file {}: {}", rule_file, e
                         )
 
+        return rules_to_collect
+
+    @staticmethod
+    def load_context(
+        os_type: str, os_version: float, tailoring: bool = False
+    ) -> _LoadContext:
+        """Resolve the platform state shared by `load_rules` calls.
+
+        Callers loading several sections of the same platform and version
+        build this once and pass it as ``context`` to each `load_rules`.
+
+        Args:
+            os_type: Operating system family (e.g. ``"macOS"``).
+            os_version: Operating system version (e.g. ``15.0``).
+            tailoring: If true, customization overrides are not collected.
+                Defaults to ``False``.
+
+        Returns:
+            The OS name, rule file index and customization overrides.
+        """
+        rules_dirs: list[Path] = [
+            Path(config["rules_dir"]),
+            Path(config["custom"]["rules_dir"]),
+        ]
+
+        if tailoring:
+            overrides: dict[str, Any] = {}
+        else:
+            overrides = collect_overrides(Path(config["custom"]["rules_dir"]))
+
+        return _LoadContext(
+            os_name=get_version_data(os_type, os_version, mscp_data)["os_name"],
+            rule_files=get_file_index(rules_dirs),
+            overrides=overrides,
+        )
+
+    @staticmethod
+    def load_rule_documents(
+        rules_to_collect: dict[str, list[str]],
+        jobs: int | None,
+        language: str = "en",
+    ) -> dict[Path, dict[str, Any]]:
+        """Parse the rule file of every collected rule ID via `load_rule_files`.
+
+        Args:
+            rules_to_collect: Rule IDs keyed by section name. IDs without a
+                rule file are ignored.
+            jobs: Worker processes used for parsing; ``None`` falls back to
+                ``config["jobs"]`` and then the CPU count.
+            language: Language code for localized text. Defaults to ``"en"``.
+
+        Returns:
+            Parsed rule documents keyed by file path, suitable for the
+            ``documents`` argument of `load_rules`.
+        """
+        if jobs is None:
+            jobs = config.get("jobs") or os.cpu_count() or 1
+
+        rule_files: dict[str, Path] = get_file_index(
+            [Path(config["rules_dir"]), Path(config["custom"]["rules_dir"])]
+        )
+
+        return load_rule_files(
+            (
+                rule_files[rule_id]
+                for collected_rules in rules_to_collect.values()
+                for rule_id in collected_rules
+                if rule_id in rule_files
+            ),
+            language=language,
+            jobs=jobs,
+        )
+
+    @classmethod
+    def _build_section_rules(
+        cls,
+        rules_to_collect: dict[str, list[str]],
+        documents: dict[Path, dict[str, Any]],
+        os_type: str,
+        os_version: float,
+        tailoring: bool,
+        parent_values: str,
+    ) -> list["Macsecurityrule"]:
+        """Run `load_rules` for each collected section against ``documents``."""
+        rules: list[Macsecurityrule] = []
+        context = cls.load_context(os_type, os_version, tailoring)
+
         for section, collected_rules in rules_to_collect.items():
             rules += cls.load_rules(
                 rule_ids=collected_rules,
@@ -598,8 +1073,9 @@ class Macsecurityrule(BaseModelWithAccessors):
                 parent_values=parent_values,
                 section=section,
                 tailoring=tailoring,
+                documents=documents,
+                context=context,
             )
-        logger.info("=== ALL RULES LOADED ===")
 
         return rules
 
@@ -677,18 +1153,26 @@ class Macsecurityrule(BaseModelWithAccessors):
                         )
                     )
 
-    def _fill_in_odv(self, parent_values: str) -> None:
-        """Replace ``$ODV`` placeholders in rule fields with the resolved value.
+    def _compile_odv_plan(self) -> tuple[_OdvSlot, ...]:
+        """Record every field path that contains an ``$ODV`` placeholder.
 
-        Args:
-            parent_values: Key to look up in ``self.odv``. Expected values
-                include ``"custom"``, ``"recommended"``, or a specific
-                benchmark name.
+        Called by `load_rules` before the first fill, so the plan keeps the
+        original templates and the rule can later be resolved for any
+        benchmark (`resolve_odv`) without walking or copying the whole
+        rule. Computed lazily for rules built any other way.
+
+        Returns:
+            tuple[_OdvSlot, ...]: The rule's substitution plan.
         """
-        if self.odv is None:
-            logger.warning("No ODV dictionary found for rule: {}", self.rule_id)
-            return
+        self._odv_plan = tuple(
+            _OdvSlot(path=path, template=template, filled=template)
+            for field in _ODV_FIELDS
+            for path, template in _odv_paths(getattr(self, field, None), (field,))
+        )
+        return self._odv_plan
 
+    def _odv_value(self, parent_values: str) -> Any:
+        """Return the ODV for ``parent_values``, honouring customizations."""
         odv_lookup: dict[str, Any] = self.odv
         if "odv" in self.customized:
             odv_value: str | int | bool | None = odv_lookup.get("custom")
@@ -699,44 +1183,139 @@ class Macsecurityrule(BaseModelWithAccessors):
                 f"ODV value cannot be determined for {self.rule_id}, defaulting to recommended value: {odv_lookup.get('recommended')}"
             )
             odv_value: str | int | bool | None = odv_lookup.get("recommended")
+        return odv_value
 
-        fields_to_process: tuple[str, ...] = (
-            "title",
-            "discussion",
-            "check",
-            "fix",
-            "result_value",
-        )
+    def _resolve_odv_plan(
+        self, odv_value: Any
+    ) -> tuple[dict[str, Any], tuple[_OdvSlot, ...]]:
+        """Apply the substitution plan for ``odv_value`` without touching the rule.
+
+        Returns:
+            tuple: The resolved top-level field values and the plan with
+                ``filled`` updated to match them.
+        """
+        plan = self._odv_plan
+        if plan is None:
+            plan = self._compile_odv_plan()
+
+        values: dict[str, Any] = {}
+        new_plan: list[_OdvSlot] = []
+        for slot in plan:
+            field = slot.path[0]
+            root = values.get(field, getattr(self, field, None))
+            try:
+                current = _get_path(root, slot.path[1:])
+            except (AttributeError, IndexError, KeyError, TypeError):
+                continue
 
-        def replace_odv_in_obj(obj):
-            if isinstance(obj, str) and "$ODV" in obj:
-                if obj == "$ODV":
-                    return odv_value
-                return obj.replace("$ODV", str(odv_value))
-            elif isinstance(obj, dict):
-                return {k: replace_odv_in_obj(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [replace_odv_in_obj(item) for item in obj]
+            template = slot.template if current == slot.filled else current
+            if isinstance(template, str) and "$ODV" in template:
+                if template == "$ODV":
+                    resolved = odv_value
+                else:
+                    resolved = template.replace("$ODV", str(odv_value))
             else:
-                return obj
+                resolved = template
 
-        for field in fields_to_process:
-            value = getattr(self, field, None)
-            if value is not None:
-                setattr(self, field, replace_odv_in_obj(value))
+            values[field] = _set_path(root, slot.path[1:], resolved)
+            new_plan.append(slot._replace(template=template, filled=resolved))
 
-        if self.mobileconfig_info is not None:
-            for payload in self.mobileconfig_info:
-                payload.payload_content = replace_odv_in_obj(payload.payload_content)
+        return values, tuple(new_plan)
 
-        if self.enforcement_info is not None:
-            self.enforcement_info = replace_odv_in_obj(self.enforcement_info)
+    def _fill_in_odv(self, parent_values: str) -> None:
+        """Replace ``$ODV`` placeholders in rule fields with the resolved value.
 
-        if self.ddm_info is not None:
-            self.ddm_info = replace_odv_in_obj(self.ddm_info)
+        Only the paths recorded in the rule's substitution plan are
+        visited (see `_compile_odv_plan`).
 
-        if self.platforms is not None:
-            self.platforms = replace_odv_in_obj(self.platforms)
+        Args:
+            parent_values: Key to look up in ``self.odv``. Expected values
+                include ``"custom"``, ``"recommended"``, or a specific
+                benchmark name.
+        """
+        if self.odv is None:
+            logger.warning("No ODV dictionary found for rule: {}", self.rule_id)
+            return
+
+        values, self._odv_plan = self._resolve_odv_plan(self._odv_value(parent_values))
+        for field, value in values.items():
+            setattr(self, field, value)
+
+    def benchmark_names(self) -> list[str]:
+        """Return the benchmark names of this rule for its own platform and version.
+
+        Returns:
+            list[str]: Names from ``platforms[os_type][os_version]
+                ["benchmarks"]``, in file order.
+        """
+        return [
+            benchmark.get("name", "")
+            for benchmark in self.platforms.get(self.os_type, {})
+            .get(str(float(self.os_version)), {})
+            .get("benchmarks", [])
+        ]
+
+    def resolve_odv(self, parent_values: str) -> ResolvedRule:
+        """Return a view of this rule with ``$ODV`` resolved for ``parent_values``.
+
+        Unlike `_fill_in_odv` the rule itself is left untouched, so the
+        same rule can be resolved for several benchmarks without copying
+        it. Placeholders are resolved from the templates recorded when the
+        rule was loaded.
+
+        Args:
+            parent_values: Key to look up in ``self.odv`` (a benchmark name
+                or ``"recommended"``).
+
+        Returns:
+            ResolvedRule: The resolved view. Rules without ODVs are
+                returned unchanged behind the view.
+        """
+        if self.odv is None:
+            return ResolvedRule(self, {})
+
+        values, _ = self._resolve_odv_plan(self._odv_value(parent_values))
+        return ResolvedRule(self, values)
+
+    def odv_plan_data(self) -> list[dict[str, Any]] | None:
+        """Export the ``$ODV`` substitution plan as plain data.
+
+        Lets a rule be stored without its YAML (see `write_catalog`) and
+        still be resolved for any benchmark after `with_odv_plan`.
+
+        Returns:
+            list[dict[str, Any]] | None: One ``{"path", "template",
+                "filled"}`` dict per placeholder, with ``path`` as a list;
+                ``None`` if no plan has been recorded.
+        """
+        if self._odv_plan is None:
+            return None
+        return [
+            {"path": list(slot.path), "template": slot.template, "filled": slot.filled}
+            for slot in self._odv_plan
+        ]
+
+    def with_odv_plan(
+        self, data: list[dict[str, Any]] | None
+    ) -> "Macsecurityrule":
+        """Restore a substitution plan exported by `odv_plan_data`.
+
+        Args:
+            data: The exported plan, or ``None`` to record no plan (it is
+                then compiled lazily from the current field values).
+
+        Returns:
+            Macsecurityrule: This rule, updated in place.
+        """
+        self._odv_plan = (
+            None
+            if data is None
+            else tuple(
+                _OdvSlot(tuple(slot["path"]), slot["template"], slot["filled"])
+                for slot in data
+            )
+        )
+        return self
 
     def write_odv_custom_rule(self, odv: Any) -> None:
         """Persist a custom ODV value for this rule.
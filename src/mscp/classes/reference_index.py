@@ -0,0 +1,197 @@
+# mscp/classes/reference_index.py
+"""Reverse index from framework identifiers to rules.
+
+Provides `ReferenceIndex`, which maps every reference identifier a rule
+carries (CCE, 800-53r5, 800-171r3, CCI, SRG, DISA STIG ID, CMMC, CIS
+benchmark section and Controls v8, BSI, BZK, HICP and custom references)
+to the rules and platforms that carry it, with exact, prefix, glob and
+800-53 family lookups. `rule_references` lists a single rule's
+identifiers with the keys the index uses.
+
+The index is a snapshot: build a new one after mutating the rules.
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import re
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from typing import Any, Iterable, Iterator, NamedTuple
+
+# Local python modules
+from .macsecurityrule import Macsecurityrule
+from .rule_library import normalize_control_id
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class ReferenceHit(NamedTuple):
+    """One rule carrying a reference identifier.
+
+    Attributes:
+        framework (str): Where the identifier is stored, as
+            ``"namespace.field"`` (e.g. ``"disa.cci"``).
+        reference (str): The identifier as written in the rule.
+        rule_id (str): The rule carrying it.
+        os_type (str): The rule's platform (e.g. ``"macOS"``).
+        os_version (float): The rule's OS version.
+    """
+
+    framework: str
+    reference: str
+    rule_id: str
+    os_type: str
+    os_version: float
+
+
+def _normalize_reference(reference: str) -> str:
+    return reference.strip().upper()
+
+
+def _control_key(control: str) -> str:
+    """Return the lookup key of an 800-53 control.
+
+    Like `normalize_control_id`, and also strips the zero padding of the
+    enhancement: ``"ac-02(01)"`` → ``"AC-2(1)"``.
+    """
+    return re.sub(r"\(0*(\d)", r"(\1", normalize_control_id(control.strip()))
+
+
+def _walk_references(framework: str, value: Any) -> Iterator[tuple[str, str]]:
+    """Yield ``(framework, identifier)`` pairs, descending into nested dicts."""
+    if isinstance(value, dict):
+        for key, nested in value.items():
+            yield from _walk_references(f"{framework}.{key}", nested)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _walk_references(framework, item)
+    elif value is not None:
+        yield framework, str(value)
+
+
+def rule_references(rule: Macsecurityrule) -> Iterator[tuple[str, str, set[str]]]:
+    """Yield ``(framework, identifier, lookup keys)`` for every reference of ``rule``.
+
+    The keys are the ones `ReferenceIndex` files the identifier under.
+    """
+    flat = rule.references.flat_refs()
+    for ref_key, value in flat.items():
+        for framework, reference in _walk_references(ref_key, value):
+            keys = {_normalize_reference(reference)}
+            if framework == "nist.nist_800_53r5":
+                keys = {_control_key(reference)}
+            elif framework == "cis.benchmark":
+                keys.add(_normalize_reference(reference.split(" (", 1)[0]))
+            yield framework, reference, keys
+
+
+class ReferenceIndex:
+    """Map reference identifiers to the rules and platforms carrying them.
+
+    Identifiers are matched case-insensitively. 800-53r5 controls are
+    normalized with `_control_key`, which strips zero padding from the
+    base control and the enhancement (``"AC-02(01)"``,
+    ``"ac-2(1)"`` and ``"AC-2(1)"`` are the same key), and CIS benchmark entries such as
+    ``"3.1 (level 1)"`` are also indexed under their section (``"3.1"``).
+
+    Args:
+        rules (Iterable[Macsecurityrule]): Rules to index, typically a
+            multi-platform `RuleLibrary`.
+    """
+
+    def __init__(self, rules: Iterable[Macsecurityrule]) -> None:
+        self._hits: dict[str, list[ReferenceHit]] = {}
+        for rule in rules:
+            for framework, reference, keys in rule_references(rule):
+                hit = ReferenceHit(
+                    framework, reference, rule.rule_id, rule.os_type, rule.os_version
+                )
+                for key in keys:
+                    self._hits.setdefault(key, []).append(hit)
+        self._keys: list[str] = sorted(self._hits)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, identifier: str) -> bool:
+        return bool(self.lookup(identifier))
+
+    @property
+    def identifiers(self) -> list[str]:
+        """All indexed identifiers (normalized), sorted."""
+        return list(self._keys)
+
+    def _collect(self, keys: Iterable[str]) -> list[ReferenceHit]:
+        return [hit for key in keys for hit in self._hits[key]]
+
+    def lookup(self, identifier: str) -> list[ReferenceHit]:
+        """Return the rules carrying exactly ``identifier``.
+
+        Args:
+            identifier (str): A reference identifier (e.g. ``"CCI-000765"``).
+
+        Returns:
+            list[ReferenceHit]: Matching hits, in rule order.
+        """
+        key = _normalize_reference(identifier)
+        keys = dict.fromkeys(
+            k for k in (key, _control_key(key)) if k in self._hits
+        )
+        return self._collect(keys)
+
+    def prefix(self, prefix: str) -> list[ReferenceHit]:
+        """Return the rules carrying an identifier starting with ``prefix``.
+
+        Args:
+            prefix (str): Identifier prefix (e.g. ``"SRG-OS-0001"``).
+
+        Returns:
+            list[ReferenceHit]: Matching hits, ordered by identifier.
+        """
+        prefix = _normalize_reference(prefix)
+        start = bisect_left(self._keys, prefix)
+        keys = []
+        for key in self._keys[start:]:
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        return self._collect(keys)
+
+    def match(self, pattern: str) -> list[ReferenceHit]:
+        """Return the rules carrying an identifier matching a glob.
+
+        Args:
+            pattern (str): `fnmatch` pattern (e.g. ``"AC-2(*)"``).
+
+        Returns:
+            list[ReferenceHit]: Matching hits, ordered by identifier.
+        """
+        pattern = _normalize_reference(pattern)
+        return self._collect(k for k in self._keys if fnmatchcase(k, pattern))
+
+    def family(self, control: str) -> list[ReferenceHit]:
+        """Return the rules carrying an 800-53 control or any enhancement of it.
+
+        Args:
+            control (str): Base control (e.g. ``"AC-2"``); matches ``AC-2``
+                and ``AC-2(1)``, ``AC-2(12)``, ... but not ``AC-20``.
+
+        Returns:
+            list[ReferenceHit]: Matching hits, ordered by identifier.
+        """
+        base = _control_key(control)
+        return self.lookup(base) + self.prefix(f"{base}(")
+
+    def find(self, query: str) -> list[ReferenceHit]:
+        """Return `match` results for glob queries and `lookup` results otherwise.
+
+        Args:
+            query (str): Identifier or glob pattern.
+
+        Returns:
+            list[ReferenceHit]: Matching hits.
+        """
+        if _GLOB_CHARS.intersection(query):
+            return self.match(query)
+        return self.lookup(query)
@@ -4,9 +4,10 @@ Defines the per-framework reference submodels (NIST, DISA, CIS, BSI, BZK,
 HHS, custom) and the top-level ``References`` container that groups them.
 """
 
+import copy
 from typing import Any, Iterable
 
-from pydantic import ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from ._base import BaseModelWithAccessors
 
@@ -205,6 +206,95 @@ class References(BaseModelWithAccessors):
     bzk: bzkReferences | None = None
     hhs: hhsReferences | None = None
     custom_refs: customReferences | None = None
+    _lookup: dict[Any, dict[str, Any]] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and drop the cached `get_ref` lookup tables."""
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.clear_ref_cache()
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute and drop the cached `get_ref` lookup tables."""
+        super().__delattr__(name)
+        self.clear_ref_cache()
+
+    def clear_ref_cache(self) -> None:
+        """Drop the lookup tables built by `get_ref`.
+
+        Assigning or deleting a namespace on this object does this
+        automatically; call it after assigning a field of a submodel
+        directly (e.g. ``references.nist.cce = [...]``).
+        """
+        self.__pydantic_private__["_lookup"].clear()
+
+    def _flat_refs(self, case_insensitive: bool) -> dict[str, Any]:
+        """Return the cached ``{"namespace.field": value}`` table.
+
+        Lists of plain identifiers are stored as tuples so lookups can hand
+        out copies cheaply; nested custom references stay as dumped.
+        """
+        # read the private dict directly: ``self._lookup`` goes through
+        # pydantic's ``__getattr__`` and costs more than the lookup itself
+        lookup = self.__pydantic_private__["_lookup"]
+        flat = lookup.get(case_insensitive)
+        if flat is None:
+            flat = {}
+            for ns_attr in (*type(self).model_fields, *(self.model_extra or {})):
+                submodel = getattr(self, ns_attr, None)
+                if not isinstance(submodel, BaseModel):
+                    continue
+                for field, value in submodel.model_dump(exclude_none=False).items():
+                    if case_insensitive:
+                        field = field.lower()
+                    if isinstance(value, list) and not any(
+                        isinstance(item, (dict, list)) for item in value
+                    ):
+                        value = tuple(value)
+                    flat[f"{ns_attr}.{field}"] = value
+            lookup[case_insensitive] = flat
+        return flat
+
+    def flat_refs(self, case_insensitive: bool = True) -> dict[str, Any]:
+        """Return every reference field keyed by ``"namespace.field"``.
+
+        Answered from the same cached table as namespaced `get_ref`
+        lookups. Lists of plain identifiers are returned as tuples and
+        nested custom references as copies, so the result can be modified
+        freely.
+
+        Args:
+            case_insensitive: If true (the default), field names are
+                lowercased.
+
+        Returns:
+            dict[str, Any]: ``{"namespace.field": value}`` for every field
+                of every namespace, including unset (``None``) fields.
+        """
+        return {
+            key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for key, value in self._flat_refs(case_insensitive).items()
+        }
+
+    def _unqualified_refs(
+        self, case_insensitive: bool, search_order: tuple[str, ...]
+    ) -> dict[str, tuple[str, ...]]:
+        """Return the cached ``{field: tuple[str, ...]}`` table for ``search_order``."""
+        lookup = self.__pydantic_private__["_lookup"]
+        key = (case_insensitive, search_order)
+        table = lookup.get(key)
+        if table is None:
+            table = {}
+            flat = self._flat_refs(case_insensitive)
+            for ns_attr in search_order:
+                prefix = f"{ns_attr}."
+                for ref_key, value in flat.items():
+                    if ref_key.startswith(prefix):
+                        field = ref_key[len(prefix) :]
+                        if field not in table:
+                            table[field] = tuple(str(x) for x in (value or []))
+            lookup[key] = table
+        return table
 
     def get_ref(
         self,
@@ -224,6 +314,11 @@ class References(BaseModelWithAccessors):
           and returns the first match (values are coerced to
           ``list[str]``).
 
+        Both styles are answered from tables built on the first call and
+        cached until a namespace is assigned or deleted (or
+        `clear_ref_cache` is called). The returned values are copies, so
+        callers may modify them without affecting the cache.
+
         Three legacy keys are translated automatically:
         ``"800-53r5"`` → ``"nist_800_53r5"``,
         ``"800-171r3"`` → ``"nist_800_171r3"``,
@@ -246,13 +341,6 @@ class References(BaseModelWithAccessors):
         Raises:
             KeyError: If the key is not found and no ``default`` was given.
         """
-
-        def _dump_fields(model) -> dict[str, Any]:
-            d = model.model_dump(exclude_none=False)
-            if case_insensitive:
-                return {k.lower(): v for k, v in d.items()}
-            return d
-
         if key == "800-53r5":
             key = "nist_800_53r5"
         if key == "800-171r3":
@@ -265,29 +353,26 @@ class References(BaseModelWithAccessors):
             ns_attr = ns.strip()
             field_key = field.strip().lower() if case_insensitive else field.strip()
 
-            submodel = getattr(self, ns_attr, None)
-            if submodel is None:
-                if default is not _SENTINEL:
-                    return default
-                raise KeyError(f"Namespace '{ns_attr}' not present")
-
-            fields = _dump_fields(submodel)
-            if field_key in fields:
-                return fields[field_key]
+            flat = self._flat_refs(case_insensitive)
+            if f"{ns_attr}.{field_key}" in flat:
+                value = flat[f"{ns_attr}.{field_key}"]
+                if isinstance(value, tuple):
+                    return list(value)
+                if isinstance(value, (dict, list)):
+                    return copy.deepcopy(value)
+                return value
 
             if default is not _SENTINEL:
                 return default
+            if not isinstance(getattr(self, ns_attr, None), BaseModel):
+                raise KeyError(f"Namespace '{ns_attr}' not present")
             raise KeyError(f"Field '{field}' not found in '{ns_attr}'")
 
         field_key = key.strip().lower() if case_insensitive else key.strip()
 
-        for ns_attr in search_order:
-            submodel = getattr(self, ns_attr, None)
-            if submodel is None:
-                continue
-            fields = _dump_fields(submodel)
-            if field_key in fields:
-                return [str(x) for x in (fields[field_key] or [])]
+        table = self._unqualified_refs(case_insensitive, tuple(search_order))
+        if field_key in table:
+            return list(table[field_key])
 
         if default is not _SENTINEL:
             return default
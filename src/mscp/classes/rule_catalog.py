@@ -0,0 +1,305 @@
+# mscp/classes/rule_catalog.py
+"""SQLite catalog of fully resolved rules.
+
+Provides `write_catalog`, which stores a rule library (typically every
+platform and OS version from `RuleLibrary.from_rules_dir`) in a single
+SQLite file, and `load_catalog`, which rebuilds the rules from it without
+reading any YAML. `RuleLibrary.from_catalog` wraps `load_catalog`.
+
+The catalog is meant to be queried directly by tools that do not import
+mSCP. Every table below is keyed by ``rule``, the rule's row in
+``rules``; rows follow library order.
+
+``catalog_info(key, value)``
+    ``schema_version``, ``mscp_version``, ``mscp_build``, ``built`` (UTC
+    ISO timestamp) and ``rules`` (row count).
+``rules(row, rule_id, platform, os_type, os_version, os_name, section, ...)``
+    Also ``mechanism``, ``severity``, ``title``, ``source_file``,
+    ``document`` and ``odv_plan``. One row per rule and platform / OS
+    version. ``platform`` is the lowercase ``os_type``; ``document`` is
+    the rule's ``model_dump_json()`` and ``odv_plan`` its ``$ODV``
+    substitution plan (`Macsecurityrule.odv_plan_data` as JSON, or
+    ``NULL``).
+``tags(rule, tag)``
+``benchmarks(rule, benchmark)``
+    Benchmarks the rule belongs to on its own platform and OS version.
+``refs(rule, framework, reference, key)``
+    Every reference identifier, with ``framework`` as
+    ``"namespace.field"`` (e.g. ``"disa.cci"``) and ``key`` normalized as
+    in `ReferenceIndex` (uppercase; 800-53 controls as ``"AC-2(1)"``;
+    CIS benchmark entries also under their section).
+``odvs(rule, benchmark, value)``
+    The rule's ``odv`` entries (``recommended``, per-benchmark values,
+    ``hint``, ``custom``); ``value`` is JSON.
+``payload_keys(rule, kind, payload_type, key, value)``
+    Configuration profile (``kind = 'mobileconfig'``) and DDM
+    (``kind = 'ddm'``, ``payload_type`` = declaration type) settings;
+    ``value`` is JSON.
+
+Example::
+
+    SELECT r.rule_id, r.os_version FROM refs f JOIN rules r ON r.row = f.rule
+    WHERE f.key = 'CCI-000765' AND r.platform = 'macos';
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+# Local python modules
+from ..common_utils import make_dir, mscp_data
+from ..common_utils.logger_instance import logger
+from .macsecurityrule import Macsecurityrule
+from .reference_index import rule_references
+
+#: Bumped whenever the table layout changes; `load_catalog` refuses
+#: catalogs written with another version.
+CATALOG_SCHEMA_VERSION: int = 2
+
+_SCHEMA: str = """
+CREATE TABLE catalog_info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE rules (
+    row INTEGER PRIMARY KEY,
+    rule_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    os_type TEXT NOT NULL,
+    os_version REAL NOT NULL,
+    os_name TEXT NOT NULL,
+    section TEXT,
+    mechanism TEXT,
+    severity TEXT,
+    title TEXT NOT NULL,
+    source_file TEXT,
+    document TEXT NOT NULL,
+    odv_plan TEXT
+);
+CREATE TABLE tags (
+    rule INTEGER NOT NULL REFERENCES rules(row),
+    tag TEXT NOT NULL
+);
+CREATE TABLE benchmarks (
+    rule INTEGER NOT NULL REFERENCES rules(row),
+    benchmark TEXT NOT NULL
+);
+CREATE TABLE refs (
+    rule INTEGER NOT NULL REFERENCES rules(row),
+    framework TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE TABLE odvs (
+    rule INTEGER NOT NULL REFERENCES rules(row),
+    benchmark TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE payload_keys (
+    rule INTEGER NOT NULL REFERENCES rules(row),
+    kind TEXT NOT NULL,
+    payload_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT
+);
+"""
+
+# created after the bulk insert, which is faster than maintaining them
+_INDEXES: str = """
+CREATE INDEX rules_rule_id ON rules (rule_id, platform, os_version);
+CREATE INDEX rules_platform ON rules (platform, os_version);
+CREATE INDEX rules_mechanism ON rules (mechanism);
+CREATE INDEX tags_tag ON tags (tag);
+CREATE INDEX tags_rule ON tags (rule);
+CREATE INDEX benchmarks_benchmark ON benchmarks (benchmark);
+CREATE INDEX benchmarks_rule ON benchmarks (rule);
+CREATE INDEX refs_key ON refs (key);
+CREATE INDEX refs_framework ON refs (framework, key);
+CREATE INDEX refs_rule ON refs (rule);
+CREATE INDEX odvs_rule ON odvs (rule, benchmark);
+CREATE INDEX payload_keys_key ON payload_keys (key);
+CREATE INDEX payload_keys_type ON payload_keys (payload_type, key);
+CREATE INDEX payload_keys_rule ON payload_keys (rule);
+"""
+
+
+def _json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _payload_keys(rule: Macsecurityrule) -> Iterator[tuple[str, str, str, str]]:
+    """Yield ``(kind, payload_type, key, value)`` for profile and DDM settings."""
+    for payload in rule.mobileconfig_info or []:
+        for content in payload.payload_content:
+            for key, value in content.items():
+                yield "mobileconfig", payload.payload_type, key, _json(value)
+    if rule.ddm_info:
+        declaration_type = rule.ddm_info.get("declarationtype", "")
+        for key, value in rule.ddm_info.items():
+            if key != "declarationtype":
+                yield "ddm", declaration_type, key, _json(value)
+
+
+def write_catalog(rules: Iterable[Macsecurityrule], path: Path) -> Path:
+    """Write ``rules`` to a new SQLite catalog at ``path``.
+
+    The catalog is built in a temporary file next to ``path`` and moved
+    into place once complete, so readers never see a partial catalog.
+
+    Args:
+        rules (Iterable[Macsecurityrule]): Rules to store, in library order.
+        path (Path): Catalog file to write; replaced if it exists.
+
+    Returns:
+        Path: ``path``.
+    """
+    path = Path(path)
+    make_dir(path.parent)
+    tmp_name = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_name.unlink(missing_ok=True)
+
+    rows: dict[str, list[tuple]] = {
+        "rules": [],
+        "tags": [],
+        "benchmarks": [],
+        "refs": [],
+        "odvs": [],
+        "payload_keys": [],
+    }
+    for row, rule in enumerate(rules):
+        plan = rule.odv_plan_data()
+        rows["rules"].append(
+            (
+                row,
+                rule.rule_id,
+                rule.os_type.lower(),
+                rule.os_type,
+                rule.os_version,
+                rule.os_name,
+                rule.section,
+                rule.mechanism,
+                rule.severity,
+                rule.title,
+                str(rule.source_file) if rule.source_file else None,
+                rule.model_dump_json(),
+                _json(plan) if plan is not None else None,
+            )
+        )
+        rows["tags"] += [(row, tag) for tag in rule.tags]
+        rows["benchmarks"] += [(row, name) for name in rule.benchmark_names()]
+        rows["refs"] += [
+            (row, framework, reference, key)
+            for framework, reference, keys in rule_references(rule)
+            for key in sorted(keys)
+        ]
+        rows["odvs"] += [
+            (row, benchmark, _json(value))
+            for benchmark, value in (rule.odv or {}).items()
+        ]
+        rows["payload_keys"] += [(row, *entry) for entry in _payload_keys(rule)]
+
+    info = {
+        "schema_version": str(CATALOG_SCHEMA_VERSION),
+        "mscp_version": str(mscp_data.get("mscp", {}).get("version", "")),
+        "mscp_build": str(mscp_data.get("mscp", {}).get("build", "")),
+        "built": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rules": str(len(rows["rules"])),
+    }
+
+    try:
+        connection = sqlite3.connect(tmp_name)
+        try:
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(_SCHEMA)
+            with connection:
+                connection.executemany(
+                    "INSERT INTO catalog_info VALUES (?, ?)", info.items()
+                )
+                for table, values in rows.items():
+                    if values:
+                        marks = ", ".join("?" * len(values[0]))
+                        connection.executemany(
+                            f"INSERT INTO {table} VALUES ({marks})", values
+                        )
+            connection.executescript(_INDEXES)
+            connection.execute("ANALYZE")
+        finally:
+            connection.close()
+        os.replace(tmp_name, path)
+    except BaseException:
+        tmp_name.unlink(missing_ok=True)
+        raise
+
+    logger.info("Wrote {} rules to catalog {}", len(rows["rules"]), path)
+    return path
+
+
+def load_catalog(
+    path: Path, platform: str | None = None, os_version: float | None = None
+) -> list[Macsecurityrule]:
+    """Rebuild the rules stored in the catalog at ``path``.
+
+    Args:
+        path (Path): Catalog written by `write_catalog`.
+        platform (str | None): Only load rules for this platform
+            (case-insensitive, e.g. ``"macos"``).
+        os_version (float | None): Only load rules for this OS version.
+
+    Returns:
+        list[Macsecurityrule]: The rules, in the order they were written,
+            with their ``source_file`` and ``$ODV`` substitution plan.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+        ValueError: If the catalog was written with another schema version.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"Rule catalog not found: {path}")
+
+    clauses: list[str] = []
+    params: list[Any] = []
+    if platform is not None:
+        clauses.append("platform = ?")
+        params.append(platform.lower())
+    if os_version is not None:
+        clauses.append("os_version = ?")
+        params.append(float(os_version))
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        version = connection.execute(
+            "SELECT value FROM catalog_info WHERE key = 'schema_version'"
+        ).fetchone()
+        found = version[0] if version else "unknown"
+        if found != str(CATALOG_SCHEMA_VERSION):
+            raise ValueError(
+                f"Rule catalog {path} has schema version {found}, "
+                f"expected {CATALOG_SCHEMA_VERSION}"
+            )
+        records = connection.execute(
+            f"SELECT document, source_file, odv_plan FROM rules{where} ORDER BY row",
+            params,
+        ).fetchall()
+    finally:
+        connection.close()
+
+    rules: list[Macsecurityrule] = []
+    for document, source_file, odv_plan in records:
+        rule = Macsecurityrule.model_validate_json(document)
+        if source_file is not None:
+            rule.source_file = Path(source_file)
+        if odv_plan is not None:
+            rule.with_odv_plan(json.loads(odv_plan))
+        rules.append(rule)
+
+    logger.info("Loaded {} rules from catalog {}", len(rules), path)
+    return rules
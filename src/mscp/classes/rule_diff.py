@@ -0,0 +1,263 @@
+# mscp/classes/rule_diff.py
+"""Cross-version rule comparison.
+
+Provides `diff_rules`, which compares the rules loaded for two platform
+/ OS version pairs (e.g. macOS 15.0 and macOS 26.0), and `RuleDiff`, its
+result: added and removed rules plus, for every rule present on both
+sides, the fields that changed. `RuleLibrary.diff` wraps `diff_rules`.
+
+Each rule is reduced to a normalized projection of the fields in
+`DIFF_FIELDS` (references and benchmarks for its own platform and
+version only, list fields sorted) and the projection is hashed; only
+rules whose hashes differ are compared field by field.
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NamedTuple
+
+# Local python modules
+from .macsecurityrule import Macsecurityrule
+
+#: Projection fields compared by `diff_rules`, in report order.
+DIFF_FIELDS: tuple[str, ...] = (
+    "title",
+    "mechanism",
+    "check",
+    "result_value",
+    "fix",
+    "default_state",
+    "severity",
+    "odv",
+    "benchmarks",
+    "tags",
+    "cce",
+    "disa_stig",
+    "cis_benchmark",
+    "800-53r5",
+    "mobileconfig_info",
+    "ddm_info",
+)
+
+# projection fields holding unordered collections; reported as added /
+# removed items
+_SET_FIELDS: frozenset[str] = frozenset(
+    {"benchmarks", "tags", "cce", "disa_stig", "cis_benchmark", "800-53r5"}
+)
+
+
+def _projection(rule: Macsecurityrule) -> dict[str, Any]:
+    """Return the normalized values of `DIFF_FIELDS` for ``rule``."""
+    references = rule.references
+
+    def ref(key: str) -> list[str]:
+        return sorted(map(str, references.get_ref(key, default=None) or []))
+
+    dumped = rule.model_dump(include={"odv", "mobileconfig_info", "ddm_info"})
+    return {
+        "title": rule.title,
+        "mechanism": rule.mechanism,
+        "check": rule.check,
+        "result_value": rule.result_value,
+        "fix": rule.fix,
+        "default_state": rule.default_state,
+        "severity": rule.severity,
+        "odv": dumped["odv"],
+        "benchmarks": sorted(rule.benchmark_names()),
+        "tags": sorted(rule.tags),
+        "cce": ref("nist.cce"),
+        "disa_stig": ref("disa.disa_stig"),
+        "cis_benchmark": ref("cis.benchmark"),
+        "800-53r5": ref("nist.nist_800_53r5"),
+        "mobileconfig_info": dumped["mobileconfig_info"],
+        "ddm_info": dumped["ddm_info"],
+    }
+
+
+def _digest(projection: dict[str, Any]) -> bytes:
+    data = json.dumps(projection, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class FieldChange(NamedTuple):
+    """One changed field of a rule.
+
+    Attributes:
+        field (str): Projection field name (see `DIFF_FIELDS`).
+        old (Any): Value on the ``from`` side.
+        new (Any): Value on the ``to`` side.
+    """
+
+    field: str
+    old: Any
+    new: Any
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return ``{"from", "to"}``, plus ``added`` / ``removed`` for list fields."""
+        data: dict[str, Any] = {"from": self.old, "to": self.new}
+        if self.field in _SET_FIELDS:
+            data["added"] = [item for item in self.new if item not in self.old]
+            data["removed"] = [item for item in self.old if item not in self.new]
+        return data
+
+
+@dataclass
+class RuleDiff:
+    """Differences between the rules of two platform / OS version pairs.
+
+    Attributes:
+        source (str): Label of the ``from`` side (e.g. ``"macOS 15.0"``).
+        target (str): Label of the ``to`` side.
+        added (dict[str, str]): Rule ID → title of rules only in ``target``.
+        removed (dict[str, str]): Rule ID → title of rules only in ``source``.
+        changed (dict[str, list[FieldChange]]): Rule ID → changed fields,
+            in `DIFF_FIELDS` order, for rules in both.
+        unchanged (int): Number of rules identical on both sides.
+    """
+
+    source: str
+    target: str
+    added: dict[str, str] = field(default_factory=dict)
+    removed: dict[str, str] = field(default_factory=dict)
+    changed: dict[str, list[FieldChange]] = field(default_factory=dict)
+    unchanged: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the diff as JSON-serializable data.
+
+        Returns:
+            dict[str, Any]: ``from`` / ``to`` labels, a ``summary`` of
+                counts, the ``added`` and ``removed`` rules and the
+                ``changed`` fields per rule.
+        """
+        return {
+            "from": self.source,
+            "to": self.target,
+            "summary": {
+                "added": len(self.added),
+                "removed": len(self.removed),
+                "changed": len(self.changed),
+                "unchanged": self.unchanged,
+            },
+            "added": [
+                {"rule_id": rule_id, "title": title}
+                for rule_id, title in self.added.items()
+            ],
+            "removed": [
+                {"rule_id": rule_id, "title": title}
+                for rule_id, title in self.removed.items()
+            ],
+            "changed": {
+                rule_id: {change.field: change.to_dict() for change in changes}
+                for rule_id, changes in self.changed.items()
+            },
+        }
+
+    def to_markdown(self) -> str:
+        """Return the diff as a Markdown report.
+
+        Returns:
+            str: The report, ending with a newline.
+        """
+        lines = [
+            f"# {self.source} → {self.target}",
+            "",
+            f"{len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.changed)} changed, {self.unchanged} unchanged.",
+        ]
+        for heading, rules in (("Added", self.added), ("Removed", self.removed)):
+            if rules:
+                lines += ["", f"## {heading} ({len(rules)})", ""]
+                lines += [
+                    f"- `{rule_id}` — {title}" for rule_id, title in rules.items()
+                ]
+
+        if self.changed:
+            lines += ["", f"## Changed ({len(self.changed)})"]
+        for rule_id, changes in self.changed.items():
+            lines += ["", f"### `{rule_id}`", ""]
+            for change in changes:
+                lines += _markdown_change(change, self.source, self.target)
+        return "\n".join(lines) + "\n"
+
+
+def _markdown_value(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _markdown_change(change: FieldChange, source: str, target: str) -> list[str]:
+    """Return the Markdown list item for one field change."""
+    if change.field in _SET_FIELDS:
+        data = change.to_dict()
+        parts = [f"+`{item}`" for item in data["added"]]
+        parts += [f"-`{item}`" for item in data["removed"]]
+        return [f"- **{change.field}**: {', '.join(parts)}"]
+
+    old, new = _markdown_value(change.old), _markdown_value(change.new)
+    if "\n" not in old + new and len(old) + len(new) < 120:
+        return [f"- **{change.field}**: `{old}` → `{new}`"]
+    return [
+        f"- **{change.field}**",
+        "",
+        f"  {source}:",
+        "",
+        "  ```",
+        *(f"  {line}" for line in old.splitlines()),
+        "  ```",
+        "",
+        f"  {target}:",
+        "",
+        "  ```",
+        *(f"  {line}" for line in new.splitlines()),
+        "  ```",
+        "",
+    ]
+
+
+def diff_rules(
+    source: Iterable[Macsecurityrule],
+    target: Iterable[Macsecurityrule],
+    source_label: str = "from",
+    target_label: str = "to",
+) -> RuleDiff:
+    """Compare two sets of rules by rule ID.
+
+    Args:
+        source (Iterable[Macsecurityrule]): Rules on the ``from`` side,
+            typically one platform / OS version.
+        target (Iterable[Macsecurityrule]): Rules on the ``to`` side.
+        source_label (str): Label for the ``from`` side.
+        target_label (str): Label for the ``to`` side.
+
+    Returns:
+        RuleDiff: Added, removed and changed rules, in ``target`` order
+            (``source`` order for removed rules).
+    """
+    old = {rule.rule_id: rule for rule in source}
+    new = {rule.rule_id: rule for rule in target}
+    diff = RuleDiff(source_label, target_label)
+
+    for rule_id, rule in new.items():
+        if rule_id not in old:
+            diff.added[rule_id] = rule.title
+            continue
+        old_projection = _projection(old[rule_id])
+        new_projection = _projection(rule)
+        if _digest(old_projection) == _digest(new_projection):
+            diff.unchanged += 1
+            continue
+        diff.changed[rule_id] = [
+            FieldChange(name, old_projection[name], new_projection[name])
+            for name in DIFF_FIELDS
+            if old_projection[name] != new_projection[name]
+        ]
+    diff.removed = {
+        rule_id: rule.title for rule_id, rule in old.items() if rule_id not in new
+    }
+    return diff
@@ -4,112 +4,223 @@
 Provides `RuleLibrary`, an ordered, indexed container that supports
 lookup by rule ID, positional access, and filtering by tag, mechanism,
 and OS with method chaining.
+
+Filters are answered from inverted indexes (`_LibraryIndex`) that map
+each tag, benchmark, platform, OS name / version, mechanism and
+normalized NIST control to the set of rows holding it. A library built
+by filtering shares the index of the library it was derived from and
+only records its own row set, so chained filters are set intersections.
+
+A library loaded with `RuleLibrary.from_rules_dir` remembers the state
+of the rule, override and section files it was built from, so
+`RuleLibrary.refresh` can reload only the rules whose files changed.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple
 
+from ..common_utils import RULE_SUFFIXES, collect_overrides, config
+from ..common_utils.logger_instance import logger
 from .macsecurityrule import Macsecurityrule
 
+if TYPE_CHECKING:
+    from .rule_diff import RuleDiff
+
 
 # ------------------------------------------------------------------
 # File-level text patching helpers
 #
 # All mutation methods use these instead of rule.to_yaml() to avoid
 # the lossy round-trip through the Pydantic model (which flattens
-# per-version CCE/DISA dicts and renames YAML keys).
+# per-version CCE/DISA dicts and renames YAML keys). Each helper maps
+# the text of a rule file to its patched text; `_apply_patches` reads
+# a file once, runs every queued patch and writes the result back.
 # ------------------------------------------------------------------
 
+_Patch = Callable[[str], str]
 
-def _patch_list_remove(path: Path, value: str, item_indent: int) -> bool:
-    """Remove every ``- {value}`` list item at ``item_indent`` spaces from a YAML file.
 
-    Returns ``True`` if the file was modified.
-    """
-    text = path.read_text(encoding="utf-8")
+def _patch_list_remove(text: str, value: str, item_indent: int) -> str:
+    """Remove every ``- {value}`` list item at ``item_indent`` spaces."""
     prefix = " " * item_indent
-    new_text = re.sub(
+    return re.sub(
         rf"^{re.escape(prefix)}- {re.escape(value)}\s*\n",
         "",
         text,
         flags=re.MULTILINE,
     )
-    if new_text == text:
-        return False
-    path.write_text(new_text, encoding="utf-8")
-    return True
 
 
-def _patch_list_append(path: Path, list_key: str, value: str, key_indent: int) -> bool:
-    """Append ``- {value}`` to the list under ``list_key`` in a YAML file.
+def _patch_list_append(text: str, list_key: str, value: str, key_indent: int) -> str:
+    """Append ``- {value}`` to the list under ``list_key``.
 
     ``list_key`` must appear at exactly ``key_indent`` leading spaces.
-    Appends after the last existing item in the block. Returns ``True`` if
-    the file was modified.
+    Appends after the last existing item in the block.
     """
-    text = path.read_text(encoding="utf-8")
     item_prefix = " " * (key_indent + 2)
     item_line = f"{item_prefix}- {value}\n"
     pattern = (
         rf"(^{re.escape(' ' * key_indent)}{re.escape(list_key)}:\n"
         rf"(?:{re.escape(item_prefix)}- [^\n]*\n)*)"
     )
-    new_text = re.sub(
+    return re.sub(
         pattern,
         lambda m: m.group(1) + item_line,
         text,
         flags=re.MULTILINE,
     )
-    if new_text == text:
-        return False
-    path.write_text(new_text, encoding="utf-8")
-    return True
-
 
-def _patch_nist_control_add_sorted(path: Path, control: str) -> bool:
-    """Add ``control`` to the ``800-53r5:`` list, keeping entries sorted.
 
-    Returns ``True`` if the file was modified.
-    """
-    text = path.read_text(encoding="utf-8")
+def _patch_nist_control_add_sorted(text: str, control: str) -> str:
+    """Add ``control`` to the ``800-53r5:`` list, keeping entries sorted."""
     match = re.search(r"(    800-53r5:\n)((?:      - [^\n]+\n)*)", text)
     if not match:
-        return False
+        return text
     header = match.group(1)
     items = re.findall(r"      - ([^\n]+)", match.group(2))
     if control in items:
-        return False
+        return text
     items.append(control)
     items.sort()
     new_block = header + "".join(f"      - {item}\n" for item in items)
-    new_text = text[: match.start()] + new_block + text[match.end() :]
-    path.write_text(new_text, encoding="utf-8")
-    return True
+    return text[: match.start()] + new_block + text[match.end() :]
+
+
+def _patch_benchmark_add(text: str, version_str: str, entry_line: str) -> str:
+    """Append ``entry_line`` to the ``benchmarks:`` block of version ``version_str``."""
+    version_pattern = (
+        rf"(    '{re.escape(version_str)}':\n"
+        rf"(?:(?!    (?:'[0-9]|[a-zA-Z]))[^\n]*\n)*?"
+        rf"      benchmarks:\n"
+        rf"(?:        - name: [^\n]+\n(?:          severity: [^\n]+\n)?)*)"
+    )
+    return re.sub(
+        version_pattern,
+        lambda m: m.group(0) + entry_line,
+        text,
+        flags=re.MULTILINE,
+    )
 
 
-def _patch_benchmark_remove(path: Path, name: str) -> bool:
+def _patch_benchmark_remove(text: str, name: str) -> str:
     """Remove all benchmark entries with ``name`` from every ``benchmarks:`` block.
 
     Handles both single-line entries (``- name: X``) and entries with an
-    optional ``severity:`` continuation line. Returns ``True`` if modified.
+    optional ``severity:`` continuation line.
     """
-    text = path.read_text(encoding="utf-8")
-    new_text = re.sub(
+    return re.sub(
         rf"^        - name: {re.escape(name)}\n(?:          severity: [^\n]+\n)?",
         "",
         text,
         flags=re.MULTILINE,
     )
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` through a temporary file and a rename.
+
+    Readers never observe a partially written rule file, and a failed
+    write leaves the original untouched.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _apply_patches(path: Path, patches: list[_Patch]) -> bool:
+    """Read ``path`` once, apply ``patches`` in order and write it if changed.
+
+    Returns ``True`` if the file was modified.
+    """
+    text = path.read_text(encoding="utf-8")
+    new_text = text
+    for patch in patches:
+        new_text = patch(new_text)
     if new_text == text:
         return False
-    path.write_text(new_text, encoding="utf-8")
+    _write_text_atomic(path, new_text)
     return True
 
 
-def _normalize_control_id(control: str) -> str:
+# ------------------------------------------------------------------
+# Source file tracking for `RuleLibrary.refresh`
+# ------------------------------------------------------------------
+
+
+class _FileState(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+class _LibrarySource(NamedTuple):
+    """What a `RuleLibrary.from_rules_dir` library was built from."""
+
+    platforms: dict[str, list[float]]
+    rule_dirs: tuple[Path, ...]
+    section_dirs: tuple[Path, ...]
+    files: dict[Path, _FileState]
+    overrides: dict[str, Any]
+
+
+def _snapshot_files(
+    directories: Iterable[Path], previous: dict[Path, _FileState] | None = None
+) -> dict[Path, _FileState]:
+    """Return the state of every rule file under ``directories``.
+
+    Files whose mtime and size match ``previous`` keep their recorded
+    digest; every other file is hashed.
+    """
+    previous = previous or {}
+    files: dict[Path, _FileState] = {}
+    for directory in directories:
+        for root, _, names in os.walk(directory):
+            for name in names:
+                if os.path.splitext(name)[1] not in RULE_SUFFIXES:
+                    continue
+                path = Path(root, name)
+                try:
+                    stat = path.stat()
+                    known = previous.get(path)
+                    if known and (known.mtime_ns, known.size) == (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                    ):
+                        files[path] = known
+                        continue
+                    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                except OSError:
+                    continue
+                files[path] = _FileState(stat.st_mtime_ns, stat.st_size, digest)
+    return files
+
+
+def _rule_key(rule: Macsecurityrule) -> tuple[str, float, str]:
+    """Return ``(platform, os_version, file stem)``, which a full load keeps unique."""
+    stem = rule.source_file.stem if rule.source_file else rule.rule_id
+    return (rule.os_type.lower(), float(rule.os_version), stem)
+
+
+def normalize_control_id(control: str) -> str:
     """Normalize a NIST control ID to uppercase with no leading zeros.
 
     Examples: ``"au-09"`` → ``"AU-9"``, ``"AU-09(3)"`` → ``"AU-9(3)"``.
@@ -117,6 +228,156 @@ def _normalize_control_id(control: str) -> str:
     return re.sub(r"-0*(\d)", r"-\1", control.upper())
 
 
+def _rule_has(rule: Macsecurityrule) -> list[str]:
+    """Return the optional parts ``rule`` carries, for the ``"has"`` index."""
+    return [
+        name
+        for name, present in (
+            ("odv", rule.odv is not None),
+            ("mobileconfig", bool(rule.mobileconfig_info)),
+            ("ddm", rule.ddm_info is not None),
+            ("default_state", bool(rule.default_state)),
+        )
+        if present
+    ]
+
+
+#: Index name → function returning the keys a rule is indexed under.
+_INDEX_KEYS: dict[str, Callable[[Macsecurityrule], Iterable[Any]]] = {
+    "id": lambda rule: (rule.rule_id,),
+    "tag": lambda rule: rule.tags or (),
+    "benchmark": lambda rule: [name.lower() for name in rule.benchmark_names()],
+    "benchmark_name": lambda rule: [name for name in rule.benchmark_names() if name],
+    "platform": lambda rule: (rule.os_type.lower(),),
+    "os_name": lambda rule: ((rule.os_name or "").lower(),),
+    "os_version": lambda rule: (rule.os_version,),
+    "mechanism": lambda rule: ((rule.mechanism or "").lower(),),
+    "control": lambda rule: [
+        normalize_control_id(control)
+        for control in rule.references.nist.nist_800_53r5 or []
+    ],
+    "has": _rule_has,
+}
+
+#: Per-index generation, bumped by the `RuleLibrary` mutations that can
+#: change it; indexes built under an older generation are rebuilt before
+#: their next lookup.
+_generations: dict[str, int] = dict.fromkeys(_INDEX_KEYS, 0)
+
+
+def _invalidate_indexes(*fields: str) -> None:
+    """Mark the ``fields`` indexes of every `_LibraryIndex` as stale."""
+    for field in fields:
+        _generations[field] += 1
+
+
+class _LibraryIndex:
+    """Inverted indexes over one list of rules, shared by derived libraries.
+
+    Each index maps a key to the frozenset of row numbers (positions in
+    ``rules``) whose rule holds that key. Indexes are built on first use
+    and rebuilt after a `RuleLibrary` mutation that can change them, in
+    any library, since rules are shared between libraries. Changes made
+    to rule objects directly, outside the `RuleLibrary` mutation methods,
+    are not detected.
+
+    The index also carries the file patches queued by an open
+    `RuleLibrary.transaction`, so a transaction covers every library
+    derived from the same root.
+
+    Args:
+        rules (list[Macsecurityrule]): The rules to index, in library order.
+    """
+
+    def __init__(self, rules: list[Macsecurityrule]) -> None:
+        self.rules = rules
+        self.all_rows: frozenset[int] = frozenset(range(len(rules)))
+        self.pending: dict[Path, list[_Patch]] | None = None
+        self._keys: dict[str, dict[Any, frozenset[int]]] = {}
+        self._built: dict[str, int] = {}
+        self._globs: dict[tuple[str, str], frozenset[int]] = {}
+
+    def lookup(self, field: str, key: Any) -> frozenset[int]:
+        """Return the rows whose rule has ``key`` for ``field``.
+
+        Args:
+            field (str): Index name — ``"id"``, ``"tag"``, ``"benchmark"``
+                (lowercase), ``"benchmark_name"``, ``"platform"``
+                (lowercase), ``"os_name"`` (lowercase), ``"os_version"``,
+                ``"mechanism"`` (lowercase), ``"control"`` (normalized) or
+                ``"has"`` (``"odv"``, ``"mobileconfig"``, ``"ddm"``,
+                ``"default_state"``).
+            key (Any): Key to look up; must already be normalized.
+
+        Returns:
+            frozenset[int]: Matching rows, possibly empty.
+        """
+        return self.keys(field).get(key, frozenset())
+
+    def match(self, field: str, pattern: str) -> frozenset[int]:
+        """Return the rows with any key of ``field`` matching the glob ``pattern``.
+
+        Results are memoized until the index is rebuilt.
+
+        Args:
+            field (str): Index name, as for `lookup`.
+            pattern (str): `fnmatch`-style pattern, already normalized.
+
+        Returns:
+            frozenset[int]: Matching rows, possibly empty.
+        """
+        index = self.keys(field)
+        rows = self._globs.get((field, pattern))
+        if rows is None:
+            rows = self._globs[(field, pattern)] = frozenset().union(
+                *(rows for key, rows in index.items() if fnmatchcase(str(key), pattern))
+            )
+        return rows
+
+    def keys(self, field: str) -> dict[Any, frozenset[int]]:
+        """Return the whole ``key → rows`` index for ``field``."""
+        if self._built.get(field) != _generations[field]:
+            self._build(field)
+        return self._keys[field]
+
+    def _build(self, field: str) -> None:
+        index: defaultdict[Any, set[int]] = defaultdict(set)
+        rule_keys = _INDEX_KEYS[field]
+        for row, rule in enumerate(self.rules):
+            for key in rule_keys(rule):
+                index[key].add(row)
+
+        self._keys[field] = {key: frozenset(rows) for key, rows in index.items()}
+        self._globs = {k: v for k, v in self._globs.items() if k[0] != field}
+        self._built[field] = _generations[field]
+
+    def replace(self, replaced: dict[int, Macsecurityrule]) -> None:
+        """Update the built indexes after rules were swapped in place.
+
+        Args:
+            replaced (dict[int, Macsecurityrule]): Row → the rule that
+                ``rules[row]`` held before. Rows must not have moved.
+        """
+        for field, index in self._keys.items():
+            if self._built.get(field) != _generations[field]:
+                continue
+            rule_keys = _INDEX_KEYS[field]
+            removed: defaultdict[Any, set[int]] = defaultdict(set)
+            added: defaultdict[Any, set[int]] = defaultdict(set)
+            for row, old in replaced.items():
+                for key in rule_keys(old):
+                    removed[key].add(row)
+                for key in rule_keys(self.rules[row]):
+                    added[key].add(row)
+            for key in removed.keys() | added.keys():
+                rows = (index.get(key, frozenset()) - removed[key]) | added[key]
+                if rows:
+                    index[key] = frozenset(rows)
+                else:
+                    index.pop(key, None)
+            self._globs = {k: v for k, v in self._globs.items() if k[0] != field}
+
+
 class RuleLibrary:
     """An ordered, indexed collection of `Macsecurityrule` objects.
 
@@ -128,7 +389,9 @@ class RuleLibrary:
     narrow to a single platform.
 
     Construct directly from a list of rules, or use ``from_rules_dir``
-    to load every supported platform at once.
+    to load every supported platform at once. Libraries returned by the
+    filter methods share the indexes of the library they were filtered
+    from.
 
     Args:
         rules (list[Macsecurityrule]): Initial rules to populate the
@@ -137,50 +400,237 @@ class RuleLibrary:
 
     def __init__(self, rules: list[Macsecurityrule]) -> None:
         self._rules: list[Macsecurityrule] = list(rules)
-        self._index: dict[str, list[Macsecurityrule]] = {}
-        self._benchmarks: set[str] = set()
-        for r in self._rules:
-            self._index.setdefault(r.rule_id, []).append(r)
-            version_str = str(float(r.os_version))
-            for b in (
-                r.platforms.get(r.os_type, {})
-                .get(version_str, {})
-                .get("benchmarks", [])
-            ):
-                name = b.get("name")
-                if name:
-                    self._benchmarks.add(name)
+        self._shared: _LibraryIndex = _LibraryIndex(self._rules)
+        self._rows: frozenset[int] | None = None
+        self._id_index: dict[str, list[Macsecurityrule]] | None = None
+        self._source: _LibrarySource | None = None
+
+    @classmethod
+    def _derived(cls, shared: _LibraryIndex, rows: frozenset[int]) -> RuleLibrary:
+        """Return a library over ``rows`` of ``shared``, in index order."""
+        library = cls.__new__(cls)
+        library._rules = [shared.rules[row] for row in sorted(rows)]
+        library._shared = shared
+        library._rows = rows
+        library._id_index = None
+        library._source = None
+        return library
+
+    def _select(self, rows: frozenset[int]) -> RuleLibrary:
+        """Return a new library of this library's rules that are in ``rows``."""
+        if self._rows is not None:
+            rows = rows & self._rows
+        return RuleLibrary._derived(self._shared, rows)
+
+    def _filter(self, field: str, key: Any) -> RuleLibrary:
+        """Return a new library of the rules indexed under ``field`` / ``key``."""
+        return self._select(self._shared.lookup(field, key))
+
+    @property
+    def _index(self) -> dict[str, list[Macsecurityrule]]:
+        """dict[str, list[Macsecurityrule]]: Rules keyed by ``rule_id``, built on first use."""
+        if self._id_index is None:
+            self._id_index = {}
+            for r in self._rules:
+                self._id_index.setdefault(r.rule_id, []).append(r)
+        return self._id_index
 
     @classmethod
     def from_rules_dir(cls) -> RuleLibrary:
         """Load all rules for every supported platform and OS version.
 
         Reads the platform/version matrix from the bundled
-        ``mscp-data.yaml`` (via ``mscp_data``) and calls
-        ``Macsecurityrule.collect_platform_rules`` once per combination. Use
-        ``by_platform`` or ``by_os`` to narrow the result to a specific
-        platform.
+        ``mscp-data.yaml`` (via ``mscp_data``) and loads every combination
+        with ``Macsecurityrule.collect_all_platform_rules``, which parses
+        each rule file once. Use ``by_platform`` or ``by_os`` to narrow the
+        result to a specific platform.
 
         Returns:
             RuleLibrary: A new library containing rules for all supported
-                platforms and versions.
+                platforms and versions. It can be updated from the files
+                it was loaded from with `refresh`.
         """
         from ..common_utils import mscp_data
 
-        all_rules: list[Macsecurityrule] = []
-        platforms: dict = mscp_data.get("versions", {}).get("platforms", {})
-        for os_type, versions in platforms.items():
-            for version_info in versions:
-                os_version = version_info.get("os_version")
-                if os_version is None:
-                    continue
-                all_rules.extend(
-                    Macsecurityrule.collect_platform_rules(
-                        os_type=os_type,
-                        os_version=os_version,
-                    )
-                )
-        return cls(all_rules)
+        platforms: dict[str, list[float]] = {
+            os_type: [
+                version_info["os_version"]
+                for version_info in versions
+                if version_info.get("os_version") is not None
+            ]
+            for os_type, versions in mscp_data.get("versions", {})
+            .get("platforms", {})
+            .items()
+        }
+        rule_dirs = (Path(config["rules_dir"]), Path(config["custom"]["rules_dir"]))
+        section_dirs = (
+            Path(config["sections_dir"]),
+            Path(config["custom"]["sections_dir"]),
+        )
+        # snapshot before loading, so edits made during the load are
+        # picked up by the next refresh
+        source = _LibrarySource(
+            platforms=platforms,
+            rule_dirs=rule_dirs,
+            section_dirs=section_dirs,
+            files=_snapshot_files(rule_dirs + section_dirs),
+            overrides=collect_overrides(rule_dirs[1]),
+        )
+        library = cls(Macsecurityrule.collect_all_platform_rules(platforms))
+        library._source = source
+        return library
+
+    @classmethod
+    def from_catalog(
+        cls,
+        path: Path,
+        platform: str | None = None,
+        os_version: float | None = None,
+    ) -> RuleLibrary:
+        """Load a library from a SQLite catalog written by `write_catalog`.
+
+        No rule YAML is read, so the library cannot be `refresh`-ed.
+
+        Args:
+            path (Path): The catalog file (see ``mscp admin catalog build``).
+            platform (str | None): Only load rules for this platform
+                (case-insensitive).
+            os_version (float | None): Only load rules for this OS version.
+
+        Returns:
+            RuleLibrary: The stored rules, in catalog order.
+        """
+        from .rule_catalog import load_catalog
+
+        return cls(load_catalog(path, platform=platform, os_version=os_version))
+
+    def refresh(self) -> list[str]:
+        """Reload the rules whose rule or override files changed on disk.
+
+        Compares the rule, override and section files against the state
+        recorded at the last load or refresh: a file counts as changed
+        when its mtime or size differs and its SHA-256 digest differs
+        too, so touched but unmodified files are ignored. Only the
+        changed, added and removed rules are rebuilt, for every platform
+        and OS version in the library; a changed section file reloads
+        everything. Rules keep the order a fresh `from_rules_dir` would
+        give them.
+
+        When no rule was added or removed for any platform, the rules are
+        swapped in place and the built indexes are updated for just those
+        rows; otherwise this library gets a new index. Either way,
+        libraries filtered from this one before the refresh are not
+        re-filtered and should be derived again.
+
+        Returns:
+            list[str]: Sorted IDs of the reloaded rules; empty if nothing
+                changed.
+
+        Raises:
+            ValueError: If the library was not loaded with
+                `from_rules_dir`.
+            RuntimeError: If called inside a `transaction`.
+        """
+        source = self._source
+        if source is None:
+            raise ValueError("refresh() needs a library loaded with from_rules_dir()")
+        if self._shared.pending is not None:
+            raise RuntimeError("cannot refresh a rule library inside a transaction")
+
+        files = _snapshot_files(source.rule_dirs + source.section_dirs, source.files)
+        overrides = collect_overrides(source.rule_dirs[1])
+        changed = {
+            path
+            for path in files.keys() | source.files.keys()
+            if getattr(files.get(path), "digest", None)
+            != getattr(source.files.get(path), "digest", None)
+        }
+        self._source = source._replace(files=files, overrides=overrides)
+
+        affected: set[str] | None = {
+            rule_id
+            for rule_id in overrides.keys() | source.overrides.keys()
+            if overrides.get(rule_id) != source.overrides.get(rule_id)
+        }
+        for path in changed:
+            if path.is_relative_to(source.section_dirs[0]) or path.is_relative_to(
+                source.section_dirs[1]
+            ):
+                affected = None
+                break
+            affected.add(path.stem)
+
+        if affected is not None and not affected:
+            return []
+
+        if affected is None:
+            logger.info("Section files changed; reloading every rule")
+            new_rules = Macsecurityrule.collect_all_platform_rules(source.platforms)
+            reloaded = {_rule_key(rule)[2] for rule in new_rules}
+        else:
+            logger.info("Reloading {} changed rules", len(affected))
+            pool: defaultdict[tuple[str, float, str], list[Macsecurityrule]] = (
+                defaultdict(list)
+            )
+            for rule in self._rules:
+                if _rule_key(rule)[2] not in affected:
+                    pool[_rule_key(rule)].append(rule)
+            for rule in Macsecurityrule.collect_all_platform_rules(
+                source.platforms, rule_ids=affected
+            ):
+                pool[_rule_key(rule)].append(rule)
+
+            sections = Macsecurityrule.collect_rule_sections()
+            new_rules = [
+                rule
+                for os_type, os_versions in source.platforms.items()
+                for os_version in os_versions
+                for collected in sections.values()
+                for rule_id in collected
+                for rule in pool.pop((os_type.lower(), float(os_version), rule_id), [])
+            ]
+            reloaded = affected
+
+        old_rules = self._rules
+        if len(new_rules) == len(old_rules) and all(
+            _rule_key(old) == _rule_key(new) for old, new in zip(old_rules, new_rules)
+        ):
+            replaced = {
+                row: old
+                for row, (old, new) in enumerate(zip(old_rules, new_rules))
+                if old is not new
+            }
+            old_rules[:] = new_rules
+            self._shared.replace(replaced)
+        else:
+            self._rules = new_rules
+            self._shared = _LibraryIndex(new_rules)
+        self._id_index = None
+
+        return sorted(reloaded)
+
+    def watch(self, interval: float = 1.0) -> Iterator[list[str]]:
+        """Poll the rule files and yield after every change.
+
+        Calls `refresh` every ``interval`` seconds and yields its result
+        whenever a rule was reloaded. The generator never ends on its
+        own; stop it by breaking out of the loop.
+
+        Example::
+
+            for changed in library.watch():
+                print("reloaded", ", ".join(changed))
+
+        Args:
+            interval (float): Seconds between polls. Defaults to ``1.0``.
+
+        Yields:
+            list[str]: Sorted IDs of the reloaded rules.
+        """
+        while True:
+            time.sleep(interval)
+            if changed := self.refresh():
+                yield changed
 
     # ------------------------------------------------------------------
     # Collection protocol
@@ -214,6 +664,15 @@ class RuleLibrary:
         """list[str]: The rule IDs of every rule in the library, in order."""
         return [r.rule_id for r in self._rules]
 
+    @property
+    def _benchmarks(self) -> set[str]:
+        """set[str]: Names of every benchmark referenced by a rule in the library."""
+        return {
+            name
+            for name, rows in self._shared.keys("benchmark_name").items()
+            if self._rows is None or not rows.isdisjoint(self._rows)
+        }
+
     # ------------------------------------------------------------------
     # Index access
     # ------------------------------------------------------------------
@@ -301,7 +760,7 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        return RuleLibrary([r for r in self._rules if r.odv is not None])
+        return self._filter("has", "odv")
 
     def has_mobileconfig(self) -> RuleLibrary:
         """Return a new library containing only rules that have a mobileconfig payload.
@@ -312,7 +771,7 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        return RuleLibrary([r for r in self._rules if r.mobileconfig_info])
+        return self._filter("has", "mobileconfig")
 
     def has_ddm(self) -> RuleLibrary:
         """Return a new library containing only rules that have a DDM payload.
@@ -323,7 +782,7 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        return RuleLibrary([r for r in self._rules if r.ddm_info is not None])
+        return self._filter("has", "ddm")
 
     def by_nist_control(self, control: str) -> RuleLibrary:
         """Return a new library containing only rules mapped to the given NIST SP 800-53r5 control.
@@ -335,17 +794,7 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        normalized = _normalize_control_id(control)
-        return RuleLibrary(
-            [
-                r
-                for r in self._rules
-                if any(
-                    _normalize_control_id(c) == normalized
-                    for c in (r.references.nist.nist_800_53r5 or [])
-                )
-            ]
-        )
+        return self._filter("control", normalize_control_id(control))
 
     def by_tag(self, tag: str) -> RuleLibrary:
         """Return a new library containing only rules tagged with ``tag``.
@@ -356,7 +805,7 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        return RuleLibrary([r for r in self._rules if tag in r.tags])
+        return self._filter("tag", tag)
 
     def by_mechanism(self, mechanism: str) -> RuleLibrary:
         """Return a new library containing only rules with the given enforcement mechanism.
@@ -371,8 +820,7 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        lower = mechanism.lower()
-        return RuleLibrary([r for r in self._rules if r.mechanism.lower() == lower])
+        return self._filter("mechanism", mechanism.lower())
 
     def by_benchmark(self, benchmark: str) -> RuleLibrary:
         """Return a new library containing only rules that belong to the given benchmark.
@@ -392,23 +840,13 @@ class RuleLibrary:
             ValueError: If no rules match, listing the available benchmark
                 keywords for this library.
         """
-        lower = benchmark.lower()
-        result = []
-        for r in self._rules:
-            version_str = str(float(r.os_version))
-            benchmarks = (
-                r.platforms.get(r.os_type, {})
-                .get(version_str, {})
-                .get("benchmarks", [])
-            )
-            if any(b.get("name", "").lower() == lower for b in benchmarks):
-                result.append(r)
+        result = self._filter("benchmark", benchmark.lower())
         if not result:
             raise ValueError(
                 f"benchmark {benchmark!r} not found in this library. "
                 f"Available: {', '.join(sorted(self._benchmarks))}"
             )
-        return RuleLibrary(result)
+        return result
 
     def by_platform(self, platform: str) -> RuleLibrary:
         """Return a new library containing only rules for the given OS family.
@@ -420,13 +858,122 @@ class RuleLibrary:
         Returns:
             RuleLibrary: Matching rules in their original order.
         """
-        lower = platform.lower()
-        return RuleLibrary([r for r in self._rules if r.os_type.lower() == lower])
+        return self._filter("platform", platform.lower())
+
+    def diff(self, source: tuple[str, float], target: tuple[str, float]) -> RuleDiff:
+        """Compare the rules of two platform / OS version pairs.
+
+        Example::
+
+            library.diff(("macos", 15.0), ("macos", 26.0)).to_markdown()
+
+        Args:
+            source (tuple[str, float]): ``(platform, os_version)`` of the
+                ``from`` side. The platform is case-insensitive.
+            target (tuple[str, float]): ``(platform, os_version)`` of the
+                ``to`` side.
+
+        Returns:
+            RuleDiff: Added, removed and changed rules; see
+                `mscp.classes.rule_diff`.
+
+        Raises:
+            ValueError: If the library has no rules for either side.
+        """
+        from .rule_diff import diff_rules
+
+        sides: list[tuple[RuleLibrary, str]] = []
+        for platform, os_version in (source, target):
+            rules = self.by_platform(platform).by_os(os_version=float(os_version))
+            if not rules:
+                raise ValueError(f"no rules loaded for {platform} {os_version}")
+            sides.append((rules, f"{rules[0].os_type} {float(os_version)}"))
+        (old, old_label), (new, new_label) = sides
+        return diff_rules(old, new, old_label, new_label)
+
+    def query(self, expression: str) -> RuleLibrary:
+        """Return a new library containing the rules matched by a query expression.
+
+        Terms are ``field:value`` pairs combined with ``&``, ``|``, ``!``
+        and parentheses, e.g.
+        ``"benchmark:cis_lvl1 & platform:macos & !tag:manual & control:AC-2*"``.
+        Fields are ``benchmark``, ``control``, ``has`` (``odv``,
+        ``mobileconfig``, ``ddm``, ``default_state``), ``id``,
+        ``mechanism``, ``os``, ``platform``, ``tag`` and ``version``.
+        Values are compared as the matching ``by_*`` method does, may be
+        double-quoted, and may use ``*`` / ``?`` wildcards (except
+        ``has`` and ``version``). Expressions are compiled once and
+        cached, see `mscp.classes.rule_query`.
+
+        Args:
+            expression (str): Query expression.
+
+        Returns:
+            RuleLibrary: Matching rules in their original order.
+
+        Raises:
+            ValueError: If the expression is malformed.
+        """
+        from .rule_query import compile_query
+
+        return self._select(compile_query(expression).evaluate(self._shared))
 
     # ------------------------------------------------------------------
     # Mutations
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def transaction(self) -> Iterator[RuleLibrary]:
+        """Batch the source-file writes of every mutation made inside the block.
+
+        Mutations still update the in-memory rules immediately, but their
+        file patches are queued per ``source_file`` — for this library and
+        every library derived from the same root — and applied when the
+        block exits: each file is read once, patched once per queued
+        mutation in order, and written back through a temporary file and
+        an atomic rename. Nested transactions join the outermost one.
+
+        If the block raises, the queued patches are discarded and no file
+        is written; in-memory changes to the rules are not rolled back.
+
+        Example::
+
+            with library.transaction():
+                library.by_tag("cis_lvl2").add_tag("reviewed").remove_tag("draft")
+
+        Yields:
+            RuleLibrary: ``self``.
+        """
+        shared = self._shared
+        if shared.pending is not None:
+            yield self
+            return
+
+        shared.pending = {}
+        try:
+            yield self
+        except BaseException:
+            logger.warning(
+                "Rule library transaction failed; discarding changes to {} files",
+                len(shared.pending),
+            )
+            raise
+        else:
+            written = sum(
+                _apply_patches(path, patches)
+                for path, patches in shared.pending.items()
+            )
+            logger.debug("Rule library transaction updated {} files", written)
+        finally:
+            shared.pending = None
+
+    def _patch(self, path: Path, patch: _Patch) -> None:
+        """Apply ``patch`` to ``path`` now, or queue it in the open transaction."""
+        if self._shared.pending is not None:
+            self._shared.pending.setdefault(path, []).append(patch)
+        else:
+            _apply_patches(path, [patch])
+
     def add_tag(self, tag: str) -> RuleLibrary:
         """Add ``tag`` to every rule in this library and write each source file once.
 
@@ -442,7 +989,11 @@ class RuleLibrary:
                 rule.tags.append(tag)
             if rule.source_file and rule.source_file not in seen:
                 seen.add(rule.source_file)
-                _patch_list_append(rule.source_file, "tags", tag, key_indent=0)
+                self._patch(
+                    rule.source_file,
+                    lambda text: _patch_list_append(text, "tags", tag, key_indent=0),
+                )
+        _invalidate_indexes("tag")
         return self
 
     def remove_tag(self, tag: str) -> RuleLibrary:
@@ -460,7 +1011,11 @@ class RuleLibrary:
                 rule.tags.remove(tag)
             if rule.source_file and rule.source_file not in seen:
                 seen.add(rule.source_file)
-                _patch_list_remove(rule.source_file, tag, item_indent=2)
+                self._patch(
+                    rule.source_file,
+                    lambda text: _patch_list_remove(text, tag, item_indent=2),
+                )
+        _invalidate_indexes("tag")
         return self
 
     def add_nist_control(self, control: str) -> RuleLibrary:
@@ -475,16 +1030,21 @@ class RuleLibrary:
         Returns:
             RuleLibrary: ``self``, for method chaining.
         """
-        normalized = _normalize_control_id(control)
+        normalized = normalize_control_id(control)
         canonical = control.upper()
         seen: set = set()
         for rule in self._rules:
             controls = rule.references.nist.nist_800_53r5 or []
-            if not any(_normalize_control_id(c) == normalized for c in controls):
+            if not any(normalize_control_id(c) == normalized for c in controls):
                 rule.references.nist.nist_800_53r5 = sorted(controls + [canonical])
+                rule.references.clear_ref_cache()
             if rule.source_file and rule.source_file not in seen:
                 seen.add(rule.source_file)
-                _patch_nist_control_add_sorted(rule.source_file, canonical)
+                self._patch(
+                    rule.source_file,
+                    lambda text: _patch_nist_control_add_sorted(text, canonical),
+                )
+        _invalidate_indexes("control")
         return self
 
     def remove_nist_control(self, control: str) -> RuleLibrary:
@@ -497,19 +1057,24 @@ class RuleLibrary:
         Returns:
             RuleLibrary: ``self``, for method chaining.
         """
-        normalized = _normalize_control_id(control)
+        normalized = normalize_control_id(control)
         seen: set = set()
         for rule in self._rules:
             if rule.references.nist.nist_800_53r5:
                 remaining = [
                     c
                     for c in rule.references.nist.nist_800_53r5
-                    if _normalize_control_id(c) != normalized
+                    if normalize_control_id(c) != normalized
                 ]
                 rule.references.nist.nist_800_53r5 = remaining or None
+                rule.references.clear_ref_cache()
             if rule.source_file and rule.source_file not in seen:
                 seen.add(rule.source_file)
-                _patch_list_remove(rule.source_file, control, item_indent=6)
+                self._patch(
+                    rule.source_file,
+                    lambda text: _patch_list_remove(text, control, item_indent=6),
+                )
+        _invalidate_indexes("control")
         return self
 
     def add_benchmark(self, name: str, severity: str | None = None) -> RuleLibrary:
@@ -533,9 +1098,10 @@ class RuleLibrary:
                 by_file.setdefault(rule.source_file, []).append(rule)
 
         entry_suffix = (f"\n          severity: {severity}") if severity else ""
+        entry_line = f"        - name: {name}{entry_suffix}\n"
 
         for source_file, rules in by_file.items():
-            text = source_file.read_text(encoding="utf-8")
+            version_strs: list[str] = []
             for rule in rules:
                 version_str = str(float(rule.os_version))
                 os_type = rule.os_type
@@ -551,22 +1117,20 @@ class RuleLibrary:
                 ).setdefault("benchmarks", []).append(
                     {"name": name, **({"severity": severity} if severity else {})}
                 )
-                # Find the benchmarks: block within the version's section and append
-                version_pattern = (
-                    rf"(    '{re.escape(version_str)}':\n"
-                    rf"(?:(?!    (?:'[0-9]|[a-zA-Z]))[^\n]*\n)*?"
-                    rf"      benchmarks:\n"
-                    rf"(?:        - name: [^\n]+\n(?:          severity: [^\n]+\n)?)*)"
-                )
-                entry_line = f"        - name: {name}{entry_suffix}\n"
-                text = re.sub(
-                    version_pattern,
-                    lambda m, entry_line=entry_line: m.group(0) + entry_line,
-                    text,
-                    flags=re.MULTILINE,
-                )
-            source_file.write_text(text, encoding="utf-8")
+                version_strs.append(version_str)
+
+            if not version_strs:
+                continue
+
+            # Append to the benchmarks: block within each version's section
+            def patch(text: str, version_strs=version_strs) -> str:
+                for version_str in version_strs:
+                    text = _patch_benchmark_add(text, version_str, entry_line)
+                return text
 
+            self._patch(source_file, patch)
+
+        _invalidate_indexes("benchmark", "benchmark_name")
         return self
 
     def remove_benchmark(self, name: str) -> RuleLibrary:
@@ -587,7 +1151,11 @@ class RuleLibrary:
             ]
             if rule.source_file and rule.source_file not in seen:
                 seen.add(rule.source_file)
-                _patch_benchmark_remove(rule.source_file, name)
+                self._patch(
+                    rule.source_file,
+                    lambda text: _patch_benchmark_remove(text, name),
+                )
+        _invalidate_indexes("benchmark", "benchmark_name")
         return self
 
     def by_os(
@@ -616,10 +1184,9 @@ class RuleLibrary:
         if os_name is None and os_version is None:
             raise ValueError("at least one of os_name or os_version must be provided")
 
-        rules = self._rules
+        rows = self._shared.all_rows
         if os_name is not None:
-            lower = os_name.lower()
-            rules = [r for r in rules if r.os_name.lower() == lower]
+            rows = rows & self._shared.lookup("os_name", os_name.lower())
         if os_version is not None:
-            rules = [r for r in rules if r.os_version == os_version]
-        return RuleLibrary(rules)
+            rows = rows & self._shared.lookup("os_version", os_version)
+        return self._select(rows)
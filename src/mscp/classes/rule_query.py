@@ -0,0 +1,256 @@
+# mscp/classes/rule_query.py
+"""Boolean query expressions over a `RuleLibrary`'s indexes.
+
+`compile_query` parses an expression such as::
+
+    benchmark:cis_lvl1 & platform:macos & !tag:manual & control:AC-2*
+
+into a `QueryPlan` — a small tree of terms and ``&`` / ``|`` / ``!``
+nodes — that `RuleLibrary.query` evaluates against the library's
+inverted indexes as set operations. Plans are memoized per expression
+string, so repeating a query costs only the set operations.
+
+Terms are ``field:value`` pairs; values containing spaces or
+parentheses can be double-quoted, and ``*`` / ``?`` / ``[...]`` globs
+are matched against every key of the field's index. ``!`` binds
+tighter than ``&``, which binds tighter than ``|``; use parentheses to
+group. Supported fields are listed in `QUERY_FIELDS`.
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Union
+
+# Local python modules
+from .rule_library import normalize_control_id
+
+if TYPE_CHECKING:
+    from .rule_library import _LibraryIndex
+
+#: Values accepted by the ``has:`` field.
+HAS_VALUES: tuple[str, ...] = ("odv", "mobileconfig", "ddm", "default_state")
+
+
+def _normalize_has(value: str) -> str:
+    value = value.lower()
+    if value not in HAS_VALUES:
+        raise ValueError(
+            f"unknown has: value {value!r}. Available: {', '.join(HAS_VALUES)}"
+        )
+    return value
+
+
+def _normalize_version(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"version must be a number, not {value!r}") from None
+
+
+#: Query field → (index name, key normalizer, globs allowed).
+QUERY_FIELDS: dict[str, tuple[str, Callable[[str], Any], bool]] = {
+    "benchmark": ("benchmark", str.lower, True),
+    "control": ("control", normalize_control_id, True),
+    "has": ("has", _normalize_has, False),
+    "id": ("id", str, True),
+    "mechanism": ("mechanism", str.lower, True),
+    "os": ("os_name", str.lower, True),
+    "platform": ("platform", str.lower, True),
+    "tag": ("tag", str, True),
+    "version": ("os_version", _normalize_version, False),
+}
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+_TOKEN = re.compile(
+    r"""
+    (?:
+        (?P<op>[&|!()])
+      | (?P<field>[A-Za-z_]+):
+        (?:"(?P<quoted>[^"]*)"|(?P<value>[^\s&|!()"]+(?:\([^\s&|!()"]*\)\*?)?))
+    )
+    """,
+    re.VERBOSE,
+)
+
+
+class _Term(NamedTuple):
+    index: str
+    key: Any
+    glob: bool
+
+    def evaluate(self, index: _LibraryIndex) -> frozenset[int]:
+        if self.glob:
+            return index.match(self.index, self.key)
+        return index.lookup(self.index, self.key)
+
+
+class _Not(NamedTuple):
+    operand: QueryNode
+
+    def evaluate(self, index: _LibraryIndex) -> frozenset[int]:
+        return index.all_rows - self.operand.evaluate(index)
+
+
+class _And(NamedTuple):
+    operands: tuple[QueryNode, ...]
+
+    def evaluate(self, index: _LibraryIndex) -> frozenset[int]:
+        # intersect the positive terms smallest-first, then subtract the
+        # negated ones instead of building their complements
+        positive = sorted(
+            (op.evaluate(index) for op in self.operands if not isinstance(op, _Not)),
+            key=len,
+        )
+        rows = positive[0] if positive else index.all_rows
+        for other in positive[1:]:
+            rows = rows & other
+        for op in self.operands:
+            if isinstance(op, _Not) and rows:
+                rows = rows - op.operand.evaluate(index)
+        return rows
+
+
+class _Or(NamedTuple):
+    operands: tuple[QueryNode, ...]
+
+    def evaluate(self, index: _LibraryIndex) -> frozenset[int]:
+        return frozenset().union(*(op.evaluate(index) for op in self.operands))
+
+
+QueryNode = Union[_Term, _Not, _And, _Or]
+
+
+class QueryPlan(NamedTuple):
+    """A compiled query expression.
+
+    Attributes:
+        expression (str): The source expression.
+        root (QueryNode): Root of the evaluation tree.
+    """
+
+    expression: str
+    root: QueryNode
+
+    def evaluate(self, index: _LibraryIndex) -> frozenset[int]:
+        """Return the rows of ``index`` matched by the query."""
+        return self.root.evaluate(index)
+
+
+class _Parser:
+    """Recursive-descent parser for query expressions."""
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens: list[tuple[str, Any, int]] = []
+        pos = len(expression) - len(expression.lstrip())
+        while pos < len(expression):
+            if not (match := _TOKEN.match(expression, pos)):
+                self._fail(pos, "expected a field:value term or operator")
+            if match.group("op"):
+                self.tokens.append(("op", match.group("op"), match.start("op")))
+            else:
+                value = match.group("quoted")
+                if value is None:
+                    value = match.group("value")
+                self.tokens.append(
+                    ("term", (match.group("field"), value), match.start("field"))
+                )
+            pos = match.end()
+            pos += len(expression[pos:]) - len(expression[pos:].lstrip())
+        self.pos = 0
+
+    def _fail(self, offset: int, message: str):
+        raise ValueError(
+            f"invalid query {self.expression!r} at position {offset}: {message}"
+        )
+
+    def _peek(self) -> tuple[str, Any, int] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, op: str) -> bool:
+        token = self._peek()
+        if token and token[0] == "op" and token[1] == op:
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> QueryNode:
+        if not self.tokens:
+            self._fail(0, "empty query")
+        node = self._or()
+        if (token := self._peek()) is not None:
+            self._fail(token[2], f"unexpected {token[1]!r}")
+        return node
+
+    def _or(self) -> QueryNode:
+        operands = [self._and()]
+        while self._accept("|"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else _Or(tuple(operands))
+
+    def _and(self) -> QueryNode:
+        operands = [self._not()]
+        while self._accept("&"):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else _And(tuple(operands))
+
+    def _not(self) -> QueryNode:
+        if self._accept("!"):
+            return _Not(self._not())
+        return self._atom()
+
+    def _atom(self) -> QueryNode:
+        token = self._peek()
+        if token is None:
+            self._fail(len(self.expression), "unexpected end of query")
+        kind, value, offset = token
+        if kind == "op":
+            if value != "(":
+                self._fail(offset, f"unexpected {value!r}")
+            self.pos += 1
+            node = self._or()
+            if not self._accept(")"):
+                self._fail(
+                    self._peek()[2] if self._peek() else len(self.expression),
+                    "missing ')'",
+                )
+            return node
+
+        self.pos += 1
+        field, raw = value
+        if field.lower() not in QUERY_FIELDS:
+            self._fail(
+                offset,
+                f"unknown field {field!r}. Available: {', '.join(QUERY_FIELDS)}",
+            )
+        index, normalize, globs = QUERY_FIELDS[field.lower()]
+        glob = bool(_GLOB_CHARS.search(raw))
+        if glob and not globs:
+            self._fail(offset, f"{field}: does not support wildcards")
+        try:
+            key = normalize(raw)
+        except ValueError as e:
+            self._fail(offset, str(e))
+        return _Term(index, key, glob)
+
+
+@lru_cache(maxsize=256)
+def compile_query(expression: str) -> QueryPlan:
+    """Parse ``expression`` into a reusable `QueryPlan`.
+
+    Args:
+        expression (str): Query expression, e.g.
+            ``"benchmark:disa_stig & mechanism:script & !has:default_state"``.
+
+    Returns:
+        QueryPlan: The compiled plan. Plans are memoized per expression.
+
+    Raises:
+        ValueError: If the expression is malformed or names an unknown
+            field or ``has:`` value.
+    """
+    return QueryPlan(expression, _Parser(expression).parse())
@@ -0,0 +1,136 @@
+# mscp/classes/rule_record.py
+"""Compact, read-only rule records for rendering.
+
+Provides `RuleRecord`, a frozen ``__slots__`` projection of a
+`Macsecurityrule` for the one platform / OS version it was loaded for.
+Rendering paths (`Baseline.to_dataframe`, the guidance templates and the
+Markdown tree) consume records instead of ``model_dump()`` output, so
+they no longer copy every rule's ``platforms`` tree (all OS versions),
+``uuid`` and ``source_file``.
+
+Short values that repeat across rules (tags, section, benchmark,
+mechanism and platform names) are interned with `sys.intern`. Long text
+fields (discussion, check, fix) can go through a pool passed to
+`RuleRecord.from_rule`, so the records built by one rendering call share
+one copy of each identical string; the pool is dropped with the records.
+"""
+
+from __future__ import annotations
+
+# Standard python modules
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Local python modules
+from .macsecurityrule import Macsecurityrule
+
+# nested model fields dumped to plain dicts for the templates
+_DUMPED_FIELDS: set[str] = {
+    "references",
+    "odv",
+    "mobileconfig_info",
+    "ddm_info",
+    "enforcement_info",
+}
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+def _pooled(value: str | None, pool: dict[str, str] | None) -> str | None:
+    if value is None or pool is None:
+        return value
+    return pool.setdefault(value, value)
+
+
+@dataclass(frozen=True, slots=True)
+class RuleRecord:
+    """Immutable view of a rule for one platform and OS version.
+
+    Field names and values match ``Macsecurityrule.model_dump()`` so
+    templates can use a record wherever they used a dumped rule, except
+    that list fields are tuples, ``uuid`` / ``platforms`` /
+    ``source_file`` are omitted and ``benchmarks`` lists the rule's
+    benchmark names for its own platform and version.
+    """
+
+    title: str
+    rule_id: str
+    discussion: str
+    references: dict[str, Any]
+    odv: dict[str, Any] | None
+    tags: tuple[str, ...]
+    result_value: str | int | bool | None
+    mobileconfig_info: list[dict[str, Any]] | None
+    ddm_info: dict[str, Any] | None
+    customized: tuple[str, ...]
+    mechanism: str | None
+    section: str | None
+    os_name: str
+    os_type: str
+    os_version: float
+    check: str | None
+    fix: str | None
+    enforcement_info: dict[str, Any] | None
+    severity: str | None
+    default_state: str | None
+    benchmarks: tuple[str, ...]
+
+    @classmethod
+    def from_rule(
+        cls, rule: Macsecurityrule, pool: dict[str, str] | None = None
+    ) -> RuleRecord:
+        """Project ``rule`` into a record.
+
+        Args:
+            rule (Macsecurityrule): A rule loaded for one platform and OS
+                version.
+            pool (dict[str, str] | None): Strings already used by other
+                records of the same rendering call; identical long text
+                fields are taken from (and added to) it. Defaults to no
+                sharing.
+
+        Returns:
+            RuleRecord: The record.
+        """
+        dumped = rule.model_dump(include=_DUMPED_FIELDS)
+        return cls(
+            title=_pooled(rule.title, pool),
+            rule_id=sys.intern(rule.rule_id),
+            discussion=_pooled(rule.discussion, pool),
+            references=dumped["references"],
+            odv=dumped["odv"],
+            tags=tuple(sys.intern(tag) for tag in rule.tags),
+            result_value=rule.result_value,
+            mobileconfig_info=dumped["mobileconfig_info"],
+            ddm_info=dumped["ddm_info"],
+            customized=tuple(sys.intern(field) for field in rule.customized),
+            mechanism=_intern(rule.mechanism),
+            section=_intern(rule.section),
+            os_name=sys.intern(rule.os_name),
+            os_type=sys.intern(rule.os_type),
+            os_version=rule.os_version,
+            check=_pooled(rule.check, pool),
+            fix=_pooled(rule.fix, pool),
+            enforcement_info=dumped["enforcement_info"],
+            severity=_intern(rule.severity),
+            default_state=_pooled(rule.default_state, pool),
+            benchmarks=tuple(sys.intern(name) for name in rule.benchmark_names()),
+        )
+
+    def get(self, attr: str, default: Any = None) -> Any:
+        """Return the value of *attr*, or *default* if it is absent."""
+        return getattr(self, attr, default)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a dict, with tuple fields as lists.
+
+        Returns:
+            dict[str, Any]: Field name → value, in field order.
+        """
+        data = asdict(self)
+        for field in ("tags", "customized", "benchmarks"):
+            data[field] = list(data[field])
+        return data
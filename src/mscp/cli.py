@@ -3,8 +3,8 @@
 
 Defines `parse_cli`, the top-level entry point invoked from
 `mscp.__main__`. Builds an `argparse` tree with subcommands
-`baseline` / `guidance` / `mapping` / `scap` / `admin` (the
-last with its own nested utilities) and dispatches to the matching
+`baseline` / `guidance` / `mapping` / `scap` / `query` / `coverage` /
+`refs` / `diff` / `admin` (the last with its own nested utilities) and dispatches to the matching
 function in `mscp.generate` or `mscp.admin_utils`.
 """
 
@@ -19,8 +19,10 @@ from pathlib import Path
 # Local python modules
 from .admin_utils import (
     build_all_baselines,
+    build_rule_catalog,
     add_new_rule,
     generate_mscp_banners,
+    generate_synthetic_corpus,
     remove_mscp_apple_release,
     update_mscp_apple_release,
     update_mscp_release,
@@ -41,6 +43,10 @@ from .generate import (
     generate_guidance,
     generate_mapping,
     generate_scap,
+    generate_query,
+    generate_coverage,
+    generate_refs,
+    generate_diff,
     generate_localize_template,
     generate_mo_from_json,
 )
@@ -179,6 +185,33 @@ def validate_file(arg: str) -> Path | None:
         sys.exit()
 
 
+def positive_int(arg: str) -> int:
+    """`argparse` type validator: ensure `arg` is an integer of at least 1."""
+    try:
+        value = int(arg)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {arg}")
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return value
+
+
+def platform_version(arg: str) -> tuple[str, float]:
+    """`argparse` type validator: parse ``platform:version`` (e.g. ``macos:15.0``)."""
+    platform, _, version = arg.partition(":")
+    platform = platform.lower()
+    versions = mscp_data.get("versions", {}).get("platforms", {}).get(platform)
+    if versions is None:
+        raise argparse.ArgumentTypeError(f"unknown platform in {arg!r}")
+    try:
+        os_version = float(version)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected platform:version, got {arg!r}")
+    if os_version not in [v.get("os_version") for v in versions]:
+        raise argparse.ArgumentTypeError(f"unsupported {platform} version in {arg!r}")
+    return platform, os_version
+
+
 def valid_date(date_str):
     try:
         datetime.strptime(date_str, "%Y-%m-%d")
@@ -191,7 +224,7 @@ def parse_cli() -> None:
     """Build the mSCP argument parser, parse `sys.argv`, and dispatch.
 
     Constructs the top-level parser plus the `baseline`, `guidance`,
-    `mapping`, `scap`, and `admin` subcommands (each with its own
+    `mapping`, `scap`, `query`, `coverage`, `refs`, `diff`, and `admin` subcommands (each with its own
     flags), applies log-verbosity overrides, validates the platform/OS
     arguments (rejects unsupported macOS / iOS versions), and then calls
     the subcommand's bound `func` with the parsed `argparse.Namespace`.
@@ -289,12 +322,29 @@ def parse_cli() -> None:
         help="Path to output directory.",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        default=False,
+        help="parse every rule file instead of reusing the cached parsed rules",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        type=positive_int,
+        metavar="N",
+        help="number of worker processes used to parse rule files and to generate baselines in admin baselines (default: CPU count)",
+    )
+
     # Sub Parsers for individual commands
     subparsers = parser.add_subparsers(
         title="Generate commands",
         required=True,
         dest="subcommand",
-        metavar="{baseline,guidance,mapping,scap}",
+        metavar="{baseline,guidance,mapping,scap,query,coverage,refs,diff}",
     )
 
     # 'baseline' subcommand
@@ -612,6 +662,120 @@ compliance script (e.g. disa_stig, cis.benchmark)
     #     choices=["2", "3"],
     # )
 
+    query_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "query",
+        help="list the rules across all platforms matching a query expression",
+        parents=[parent_parser],
+        add_help=False,
+    )
+    query_parser.set_defaults(func=generate_query)
+    query_parser.add_argument(
+        "expression",
+        help='query expression, e.g. "benchmark:cis_lvl1 & platform:macos & !tag:manual & control:AC-2*". '
+        "Fields: benchmark, control, has, id, mechanism, os, platform, tag, version",
+    )
+    query_parser.add_argument(
+        "--format",
+        choices=["human", "json"],
+        default="human",
+        help="output format for the matching rules",
+    )
+    query_parser.add_argument(
+        "--count",
+        help="print only the number of matching rules",
+        action="store_true",
+    )
+
+    coverage_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "coverage",
+        help="report NIST 800-53 baseline control coverage for every platform and version",
+        parents=[parent_parser],
+        add_help=False,
+    )
+    coverage_parser.set_defaults(func=generate_coverage)
+    coverage_parser.add_argument(
+        "--format",
+        choices=["csv", "json"],
+        default="csv",
+        help="output format for the coverage report",
+    )
+    coverage_parser.add_argument(
+        "--output",
+        help="directory to write the coverage report to (default: <output_dir>/coverage)",
+        type=Path,
+        default=None,
+        metavar="PATH",
+    )
+
+    refs_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "refs",
+        help="list the rules and platforms carrying framework reference identifiers",
+        parents=[parent_parser],
+        add_help=False,
+    )
+    refs_parser.set_defaults(func=generate_refs)
+    refs_parser.add_argument(
+        "identifiers",
+        nargs="*",
+        help='reference identifiers such as CCE, CCI, SRG, STIG, CIS or 800-53 IDs; '
+        'globs are allowed, e.g. "AC-2(*)" or "SRG-OS-0001*"',
+    )
+    refs_parser.add_argument(
+        "--file",
+        help="read additional identifiers from a file, one per line",
+        type=Path,
+        default=None,
+        metavar="PATH",
+    )
+    refs_parser.add_argument(
+        "--family",
+        help="also match the 800-53 enhancements of each control, e.g. AC-2 matches AC-2(1)",
+        action="store_true",
+    )
+    refs_parser.add_argument(
+        "--format",
+        choices=["human", "json"],
+        default="human",
+        help="output format for the matching rules",
+    )
+
+    diff_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "diff",
+        help="list the rules added, removed and changed between two OS versions",
+        parents=[parent_parser],
+        add_help=False,
+    )
+    diff_parser.set_defaults(func=generate_diff)
+    diff_parser.add_argument(
+        "--from",
+        dest="source",
+        help="platform and OS version to compare from, e.g. macos:15.0",
+        type=platform_version,
+        required=True,
+        metavar="PLATFORM:VERSION",
+    )
+    diff_parser.add_argument(
+        "--to",
+        dest="target",
+        help="platform and OS version to compare to, e.g. macos:26.0",
+        type=platform_version,
+        required=True,
+        metavar="PLATFORM:VERSION",
+    )
+    diff_parser.add_argument(
+        "--format",
+        choices=["markdown", "json"],
+        default="markdown",
+        help="output format for the differences",
+    )
+    diff_parser.add_argument(
+        "--output",
+        help="write the differences to a file instead of printing them",
+        type=Path,
+        default=None,
+        metavar="PATH",
+    )
+
     admin_parser: argparse.ArgumentParser = subparsers.add_parser(
         "admin",
         parents=[parent_parser],
@@ -630,6 +794,16 @@ compliance script (e.g. disa_stig, cis.benchmark)
         help="build all baselines supported in MSCP",
         add_help=False,
     )
+    build_all_parser.add_argument(
+        "--all-versions",
+        action="store_true",
+        help="build baselines for every OS version in mscp_data, not only --os_version",
+    )
+    build_all_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every baseline, even those the baseline manifest records as up to date",
+    )
     build_all_parser.set_defaults(func=build_all_baselines)
 
     add_rule_parser = admin_subparsers.add_parser(
@@ -714,6 +888,56 @@ compliance script (e.g. disa_stig, cis.benchmark)
         action="store_true",
     )
 
+    synthetic_parser: argparse.ArgumentParser = admin_subparsers.add_parser(
+        "synthetic",
+        parents=[parent_parser],
+        help="generate a synthetic rule library scaled from the current rules, for performance testing",
+        add_help=False,
+    )
+    synthetic_parser.set_defaults(func=generate_synthetic_corpus)
+
+    synthetic_parser.add_argument(
+        "--scale",
+        help="number of copies of each rule to generate",
+        type=positive_int,
+        default=10,
+        metavar="N",
+    )
+    synthetic_parser.add_argument(
+        "--output",
+        help="empty directory, or one holding a previous synthetic corpus, to write the synthetic rules and baselines to (default: <output_dir>/synthetic_corpus)",
+        type=Path,
+        default=None,
+        metavar="PATH",
+    )
+
+    catalog_parser: argparse.ArgumentParser = admin_subparsers.add_parser(
+        "catalog",
+        parents=[parent_parser],
+        help="build a SQLite catalog of every rule for every supported platform",
+        add_help=False,
+    )
+    catalog_subparsers = catalog_parser.add_subparsers(
+        title="Catalog Utilities",
+        required=True,
+        dest="catalog_command",
+    )
+    catalog_build_parser: argparse.ArgumentParser = catalog_subparsers.add_parser(
+        "build",
+        parents=[parent_parser],
+        help="write the fully resolved rule library to a SQLite file",
+        add_help=False,
+    )
+    catalog_build_parser.set_defaults(func=build_rule_catalog)
+
+    catalog_build_parser.add_argument(
+        "--output",
+        help="catalog file to write (default: <output_dir>/mscp_catalog.sqlite)",
+        type=Path,
+        default=None,
+        metavar="PATH",
+    )
+
     validate_parser: argparse.ArgumentParser = admin_subparsers.add_parser(
         "validate",
         help="validates the YAML files against the mscp_rule.json schema found in the rules and custom directories",
@@ -801,6 +1025,10 @@ compliance script (e.g. disa_stig, cis.benchmark)
             config["output_dir"] = str(args.output_dir.expanduser().resolve())
         if args.custom_dir:
             set_custom_dir(args.custom_dir.expanduser().resolve())
+        if args.no_cache:
+            config["rule_cache"] = False
+        if args.jobs:
+            config["jobs"] = args.jobs
         ensure_custom_dirs()
     except argparse.ArgumentError as e:
         logger.error("Argument Error: {}", e)
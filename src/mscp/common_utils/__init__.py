@@ -6,7 +6,10 @@ Re-exports the loguru logger (`logger`), file I/O helpers
 configuration model (`config`, `set_custom_dir`, `ensure_custom_dirs`,
 `search_paths`),
 input validation utilities (`sanitize_input`, `prompt_for_odv`,
-`validate_yaml_file`, `validate_rule_folder_structure`), localization
+`validate_yaml_file`, `validate_rule_folder_structure`), the parsed
+rule cache (`load_rule_file`, `load_rule_files`, `save_rule_cache`,
+`clear_rule_cache`), the rule / section file index (`get_file_index`, `find_file`,
+`find_file_by_id`), localization
 helpers (`get_supported_languages`), version metadata accessors
 (`get_version_data`, `get_mscp_data`, `mscp_data`), the shell-command
 runner (`run_command`), and the spinner decorator
@@ -21,7 +24,7 @@ from .config import (
     search_paths,
 )
 from .constants import SCHEMA_PATH, APPLE_OS, NIX_OS, PLATFORM_MAP
-from .customization import collect_overrides
+from .customization import clear_override_cache, collect_overrides
 from .file_handling import (
     append_text,
     create_csv,
@@ -47,6 +50,20 @@ from .mscp_data import get_mscp_data, mscp_data
 from .run_command import run_command
 from .sanitize_input import sanitize_input
 from .prompt_for_odv import prompt_for_odv
+from .rule_cache import (
+    clear_rule_cache,
+    load_rule_file,
+    load_rule_files,
+    save_rule_cache,
+)
+from .rule_index import (
+    RULE_SUFFIXES,
+    YAML_SUFFIXES,
+    clear_file_indexes,
+    find_file,
+    find_file_by_id,
+    get_file_index,
+)
 from .validate_rules import validate_yaml_file, validate_rule_folder_structure
 from .version_data import get_version_data
 from .spinner_utils import conditional_inject_spinner
@@ -71,6 +88,16 @@ __all__ = [
     "run_command",
     "sanitize_input",
     "prompt_for_odv",
+    "load_rule_file",
+    "load_rule_files",
+    "save_rule_cache",
+    "clear_rule_cache",
+    "get_file_index",
+    "find_file",
+    "find_file_by_id",
+    "clear_file_indexes",
+    "RULE_SUFFIXES",
+    "YAML_SUFFIXES",
     "get_version_data",
     "mscp_data",
     "get_mscp_data",
@@ -88,6 +115,7 @@ __all__ = [
     "logger",
     "get_supported_languages",
     "collect_overrides",
+    "clear_override_cache",
     "validate_rule_folder_structure",
     "conditional_inject_spinner",
 ]
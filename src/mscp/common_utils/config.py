@@ -78,6 +78,7 @@ _defaults_only = frozenset({"locales_dir"})
 config["custom"] = {
     "root_dir": str(_custom_base),
     "misc_dir": str(_custom_base / "misc"),
+    "cache_dir": str(_custom_base / "cache"),
 }
 for _key in _pkg_dir_keys - _defaults_only:
     config["custom"][_key] = str(
@@ -5,21 +5,46 @@ Customization files live alongside the default rules but only contain
 the keys the user wants to override. `collect_overrides` walks a
 directory tree, gathers them, and returns a flat
 ``rule_id → override_dict`` mapping consumed by `Macsecurityrule.load_rules`.
+
+The mapping is built once per directory and process and reused until a
+directory in the tree or one of the override files changes (checked by
+mtime), so loading many sections or platforms walks the tree only once.
 """
 
 # Standard python modules
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 # Local python modules
 from .logger_instance import logger
-from .file_handling import open_file
+from .rule_cache import load_rule_file
+
+
+class _OverrideIndex(NamedTuple):
+    overrides: dict[str, Any]
+    mtimes: dict[str, int]
+
+
+_override_indexes: dict[str, _OverrideIndex] = {}
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
 
 
 def collect_overrides(override_location: Path) -> dict[str, Any]:
     """
     Collects all custom override yaml files from the provided overrides location.
 
+    The result is memoized per directory and rebuilt only when a directory
+    under ``override_location`` or an override file has a new mtime. The
+    returned mapping is shared between callers and must not be mutated;
+    copy override values before merging them into a rule.
+
     Args:
         override_location (Path): The path to the folder containing the overrides to process.
 
@@ -30,13 +55,26 @@ def collect_overrides(override_location: Path) -> dict[str, Any]:
         Exception: If there is an error processing the overrides file.
     """
 
+    key = str(override_location)
+    index = _override_indexes.get(key)
+    if index is not None and all(
+        _mtime(path) == mtime for path, mtime in index.mtimes.items()
+    ):
+        return index.overrides
+
     overrides = {}
     overrides_dir = override_location
+    mtimes: dict[str, int] = {key: _mtime(key)}
+
+    for path in overrides_dir.rglob("*"):
+        if path.is_dir():
+            mtimes[str(path)] = _mtime(str(path))
 
     for override_file in overrides_dir.rglob("*.y*ml"):
+        mtimes[str(override_file)] = _mtime(str(override_file))
         try:
             logger.info("Attempting to open custom override file: {}", override_file)
-            override_data: dict[str, Any] = open_file(override_file)
+            override_data: dict[str, Any] = load_rule_file(override_file)
 
             override_id: str = override_data.get("id", "")
 
@@ -54,4 +92,11 @@ def collect_overrides(override_location: Path) -> dict[str, Any]:
         except Exception as e:
             logger.error("Failed to load override from file {}: {}", override_file, e)
 
+    _override_indexes[key] = _OverrideIndex(overrides=overrides, mtimes=mtimes)
+
     return overrides
+
+
+def clear_override_cache() -> None:
+    """Forget every memoized override index."""
+    _override_indexes.clear()
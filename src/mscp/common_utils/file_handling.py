@@ -4,6 +4,7 @@
 import csv
 import json
 import plistlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -17,6 +18,12 @@ from .logger_instance import logger
 
 ENCODING: str = "utf-8"
 
+#: YAML loader used by `open_yaml`: libyaml's C parser when PyYAML was built
+#: against it, otherwise the pure-Python ``SafeLoader``.
+YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_installed_translation: gettext.NullTranslations | None = None
+
 
 class MyDumper(yaml.Dumper):
     def increase_indent(self, flow=False, indentless=False):
@@ -88,6 +95,23 @@ def open_text(file_path: Path) -> str:
         raise
 
 
+@lru_cache(maxsize=None)
+def _get_translation(language: str | None) -> gettext.NullTranslations:
+    """Return the gettext translation for ``language``, loading it once.
+
+    Falls back to ``NullTranslations`` when no catalog exists for the
+    language.
+    """
+    localedir: str = str(Path(__file__).parent.parent / "data" / "locales")
+
+    return gettext.translation(
+        "messages",
+        localedir=localedir,
+        languages=[language] if language else None,
+        fallback=True,
+    )
+
+
 def open_yaml(
     file_path: Path,
     language: str = None,
@@ -95,7 +119,8 @@ def open_yaml(
     """
     Attempts to open a yaml file and read its contents with error checking and logging.
     Supports automatic gettext localization for specified yaml fields defined in
-    the "fields_to_translate" list.
+    the "fields_to_translate" list. Parsing uses `YAML_LOADER` (libyaml when
+    available).
 
     Args:
         file_path (Path): The path to the file to be opened.
@@ -104,17 +129,14 @@ def open_yaml(
     Returns:
         dict[str, Any]: The content of the file if successful, empty dict otherwise.
     """
-    # set up localization for all yaml files
-    domain: str = "messages"
-    localedir: str = str(Path(__file__).parent.parent / "data" / "locales")
+    global _installed_translation
 
-    t = gettext.translation(
-        domain,
-        localedir=localedir,
-        languages=[language],
-        fallback=True,
-    )
-    t.install()
+    # set up localization for all yaml files; catalogs are loaded once per
+    # language and only (re)installed when the language changes
+    t = _get_translation(language)
+    if t is not _installed_translation:
+        t.install()
+        _installed_translation = t
     _ = t.gettext
 
     try:
@@ -122,7 +144,7 @@ def open_yaml(
 
         fields_to_translate = ["name", "description", "title", "discussion"]
 
-        data = yaml.safe_load(file_path.read_text(encoding=ENCODING))
+        data = yaml.load(file_path.read_text(encoding=ENCODING), Loader=YAML_LOADER)
 
         for field in data:
             if field in fields_to_translate:
@@ -311,6 +333,9 @@ def create_yaml(file_path: Path, data: dict[str, Any], append: bool = False) ->
     """
     Create YAML file.
 
+    An existing file that already holds exactly the same YAML is left
+    untouched, so its modification time does not change.
+
     Args:
         file_path (Path): The path to the file that the data will be added to.
         data (dict): The data that will be added to the file.
@@ -321,23 +346,23 @@ def create_yaml(file_path: Path, data: dict[str, Any], append: bool = False) ->
     try:
         logger.debug("Attempting to create YAML: {}", file_path)
 
-        if not file_path.exists():
-            file_path.touch()
-
-        file_path.write_text(
-            yaml.dump(
-                dict(data),
-                default_flow_style=False,
-                sort_keys=False,
-                explicit_start=True,
-                indent=2,
-                allow_unicode=True,
-                Dumper=MyDumper,
-                width=float("inf"),
-            ),
-            encoding=ENCODING,
+        text: str = yaml.dump(
+            dict(data),
+            default_flow_style=False,
+            sort_keys=False,
+            explicit_start=True,
+            indent=2,
+            allow_unicode=True,
+            Dumper=MyDumper,
+            width=float("inf"),
         )
 
+        if file_path.is_file() and file_path.read_text(encoding=ENCODING) == text:
+            logger.debug("YAML unchanged: {}", file_path)
+            return
+
+        file_path.write_text(text, encoding=ENCODING)
+
         logger.success("Created YAML: {}", file_path)
 
     except yaml.YAMLError as e:
@@ -100,6 +100,8 @@ def register_yaml_constructors() -> None:
     """
     yaml.add_constructor("!localize", localize_constructor)
     yaml.SafeLoader.add_constructor("!localize", localize_constructor)
+    if hasattr(yaml, "CSafeLoader"):
+        yaml.CSafeLoader.add_constructor("!localize", localize_constructor)
 
 
 def configure_localization_for_yaml(
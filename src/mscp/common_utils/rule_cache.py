@@ -0,0 +1,299 @@
+# mscp/common_utils/rule_cache.py
+"""Persistent cache of parsed rule YAML documents.
+
+Parsing the rule library is the dominant cost of most `mscp` commands,
+so `load_rule_file` keeps the parsed (and localized) document for each
+rule file in a pickle store under ``config["custom"]["cache_dir"]``.
+Entries are keyed by the file path and language and validated against
+the file's mtime / size, falling back to a SHA-256 content hash when the
+mtime changed (e.g. after a ``git checkout``), plus `CACHE_VERSION` and
+the mtime of the gettext catalog used for translation.
+
+`load_rule_files` loads a batch of files at once and parses the cache
+misses in a pool of forked worker processes (``mscp --jobs N``).
+
+`save_rule_cache` writes the store back to disk when it was modified;
+`clear_rule_cache` drops it. Setting ``config["rule_cache"]`` to
+``False`` (``mscp --no-cache``) bypasses the cache entirely.
+"""
+
+# Standard python modules
+import hashlib
+import multiprocessing
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+# Local python modules
+from .config import config
+from .file_handling import open_file
+from .logger_instance import logger
+
+#: Bump whenever `open_yaml` or the cached document shape changes so stale
+#: stores written by an older loader are discarded instead of reused.
+CACHE_VERSION: int = 1
+
+_CACHE_FILE: str = "rules.pickle"
+
+#: Fewer uncached files than this are parsed in-process by `load_rule_files`;
+#: below it, starting worker processes costs more than it saves.
+MIN_PARALLEL_FILES: int = 32
+
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    catalog: int
+    blob: bytes
+
+
+_store: dict[tuple[str, str], _CacheEntry] | None = None
+_store_path: Path | None = None
+_dirty: bool = False
+
+
+def _cache_enabled() -> bool:
+    return bool(config.get("rule_cache", True))
+
+
+def _cache_path() -> Path:
+    return Path(config["custom"]["cache_dir"], _CACHE_FILE)
+
+
+@lru_cache(maxsize=None)
+def _catalog_stamp(language: str) -> int:
+    """Return the mtime of the gettext catalog for ``language``, or 0."""
+    mo_file = Path(config["locales_dir"], language, "LC_MESSAGES", "messages.mo")
+    try:
+        return mo_file.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_store() -> dict[tuple[str, str], _CacheEntry]:
+    """Return the in-memory store, reading it from disk on first use.
+
+    The store is re-read if the configured cache location changed (for
+    example after `set_custom_dir`). Unreadable or outdated stores are
+    discarded.
+    """
+    global _store, _store_path, _dirty
+
+    path = _cache_path()
+    if _store is not None and _store_path == path:
+        return _store
+
+    _store, _store_path, _dirty = {}, path, False
+    if not path.is_file():
+        return _store
+
+    try:
+        with path.open("rb") as file:
+            data = pickle.load(file)
+        if data.get("version") == CACHE_VERSION:
+            _store = data["entries"]
+        else:
+            logger.info("Discarding rule cache written by an older loader: {}", path)
+    except Exception as e:
+        logger.warning("Unable to read rule cache {}, rebuilding: {}", path, e)
+
+    return _store
+
+
+def _parse_rule_file(file_path: Path, language: str) -> tuple[int, int, str, bytes]:
+    """Parse one rule file and return its stat, digest and pickled document.
+
+    Module-level so `load_rule_files` can hand it to worker processes.
+    The file is stat'ed before it is read so a concurrent edit can only
+    make the cache entry look stale, never mask a change.
+    """
+    stat = file_path.stat()
+    digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+    data = open_file(file_path, language)
+    return (
+        stat.st_mtime_ns,
+        stat.st_size,
+        digest,
+        pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+
+
+def _cached_blob(file_path: Path, language: str) -> bytes | None:
+    """Return the cached pickled document for ``file_path`` if still valid."""
+    global _dirty
+
+    store = _load_store()
+    key = (str(file_path), language)
+    entry = store.get(key)
+    if entry is None or entry.catalog != _catalog_stamp(language):
+        return None
+
+    stat = file_path.stat()
+    if entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+        return entry.blob
+
+    digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+    if digest == entry.digest:
+        store[key] = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        _dirty = True
+        return entry.blob
+
+    return None
+
+
+def _remember(
+    file_path: Path, language: str, parsed: tuple[int, int, str, bytes]
+) -> None:
+    """Record a freshly parsed document in the store."""
+    global _dirty
+
+    mtime_ns, size, digest, blob = parsed
+    _load_store()[(str(file_path), language)] = _CacheEntry(
+        mtime_ns=mtime_ns,
+        size=size,
+        digest=digest,
+        catalog=_catalog_stamp(language),
+        blob=blob,
+    )
+    _dirty = True
+
+
+def load_rule_file(file_path: Path, language: str = "en") -> dict[str, Any]:
+    """Return the parsed contents of a rule file, using the cache when valid.
+
+    Each call returns a fresh copy of the document, so callers are free
+    to mutate the result.
+
+    Args:
+        file_path (Path): Rule YAML (or JSON) file to load.
+        language (str): Language code used to localize translatable
+            fields. Defaults to ``"en"``.
+
+    Returns:
+        dict[str, Any]: The parsed rule document.
+    """
+    if not _cache_enabled():
+        return open_file(file_path, language)
+
+    if (blob := _cached_blob(file_path, language)) is None:
+        parsed = _parse_rule_file(file_path, language)
+        _remember(file_path, language, parsed)
+        blob = parsed[3]
+
+    return pickle.loads(blob)
+
+
+def load_rule_files(
+    file_paths: Iterable[Path], language: str = "en", jobs: int = 1
+) -> dict[Path, dict[str, Any]]:
+    """Return the parsed contents of many rule files.
+
+    Cache hits are served from the store; the remaining files are parsed
+    in a pool of ``jobs`` forked worker processes when there are enough of
+    them to be worth the start-up cost, and in this process otherwise
+    (including on platforms without ``fork``, where spawned workers would
+    re-import the ``mscp.py`` entry script and lose the runtime config). The
+    result is keyed by path in the order the paths were given, regardless
+    of the order in which workers finish.
+
+    Args:
+        file_paths (Iterable[Path]): Rule files to load.
+        language (str): Language code used to localize translatable
+            fields. Defaults to ``"en"``.
+        jobs (int): Maximum number of worker processes. Defaults to ``1``
+            (no pool).
+
+    Returns:
+        dict[Path, dict[str, Any]]: Fresh parsed documents keyed by path.
+    """
+    use_cache = _cache_enabled()
+    blobs: dict[Path, bytes] = {}
+    misses: list[Path] = []
+
+    file_paths = list(dict.fromkeys(file_paths))
+    for file_path in file_paths:
+        if use_cache and (blob := _cached_blob(file_path, language)) is not None:
+            blobs[file_path] = blob
+        else:
+            misses.append(file_path)
+
+    parsed: list[tuple[int, int, str, bytes]] | None = None
+    if (
+        jobs > 1
+        and len(misses) >= MIN_PARALLEL_FILES
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        workers = min(jobs, len(misses))
+        logger.debug("Parsing {} rule files with {} workers", len(misses), workers)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                parsed = list(
+                    pool.map(
+                        _parse_rule_file,
+                        misses,
+                        repeat(language),
+                        chunksize=max(1, len(misses) // (workers * 4)),
+                    )
+                )
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Rule parsing pool unavailable, parsing serially: {}", e)
+
+    if parsed is None:
+        parsed = [_parse_rule_file(file_path, language) for file_path in misses]
+
+    for file_path, result in zip(misses, parsed):
+        if use_cache:
+            _remember(file_path, language, result)
+        blobs[file_path] = result[3]
+
+    return {file_path: pickle.loads(blobs[file_path]) for file_path in file_paths}
+
+
+def save_rule_cache() -> None:
+    """Write the in-memory store to disk if it changed since it was loaded.
+
+    The store is written to a temporary file and atomically renamed into
+    place so concurrent `mscp` invocations never observe a partial file.
+    Failures are logged and otherwise ignored; the cache is an
+    optimization only.
+    """
+    global _dirty
+
+    if not _dirty or _store is None or _store_path is None:
+        return
+
+    tmp_name: str | None = None
+    try:
+        _store_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=_store_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(
+                {"version": CACHE_VERSION, "entries": _store},
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_name, _store_path)
+        _dirty = False
+        logger.debug("Saved rule cache: {}", _store_path)
+    except Exception as e:
+        logger.warning("Unable to write rule cache {}: {}", _store_path, e)
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def clear_rule_cache() -> None:
+    """Drop the in-memory store and delete the on-disk cache file."""
+    global _store, _store_path, _dirty
+
+    _store, _store_path, _dirty = None, None, False
+    _catalog_stamp.cache_clear()
+    _cache_path().unlink(missing_ok=True)
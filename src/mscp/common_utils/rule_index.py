@@ -0,0 +1,178 @@
+# mscp/common_utils/rule_index.py
+"""Process-wide file-stem indexes for rule and section directories.
+
+Looking up one rule with ``Path.rglob`` walks the whole rules tree, so
+resolving every rule that way is quadratic in the size of the library.
+`get_file_index` instead walks a list of directories once with
+`os.scandir` and maps each file stem to its path. Earlier directories
+take precedence over later ones, and within a directory YAML files take
+precedence over JSON files, matching the search order previously used
+by `Macsecurityrule.load_rules`.
+
+Indexes are memoized per ``(directories, suffixes)`` and revalidated
+against the mtime of every directory they scanned, so files added or
+removed after the index was built are picked up on the next lookup.
+"""
+
+# Standard python modules
+import os
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+# Local python modules
+from .logger_instance import logger
+from .rule_cache import load_rule_file
+
+#: YAML file suffixes, in precedence order (sections, overrides).
+YAML_SUFFIXES: tuple[str, ...] = (".yaml", ".yml")
+
+#: Suffixes searched for rule files, in precedence order.
+RULE_SUFFIXES: tuple[str, ...] = (*YAML_SUFFIXES, ".json")
+
+
+class _FileIndex(NamedTuple):
+    files: dict[str, Path]
+    dir_mtimes: dict[str, int]
+    ids: dict[str, Path] | None = None
+
+
+_indexes: dict[tuple[tuple[str, ...], tuple[str, ...]], _FileIndex] = {}
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _scan(
+    directory: str, suffixes: tuple[str, ...], dir_mtimes: dict[str, int]
+) -> dict[str, Path]:
+    """Walk ``directory`` once and map file stems to paths.
+
+    Every directory visited (including missing roots) has its mtime
+    recorded in ``dir_mtimes`` so the index can be revalidated cheaply.
+    """
+    found: dict[str, tuple[int, Path]] = {}
+    pending: list[str] = [directory]
+
+    while pending:
+        current = pending.pop()
+        dir_mtimes[current] = _mtime(current)
+        try:
+            with os.scandir(current) as entries:
+                children = sorted(entries, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs: list[str] = []
+        for entry in children:
+            if entry.is_dir():
+                subdirs.append(entry.path)
+                continue
+            stem, suffix = os.path.splitext(entry.name)
+            if suffix not in suffixes:
+                continue
+            rank = suffixes.index(suffix)
+            if stem not in found or rank < found[stem][0]:
+                found[stem] = (rank, Path(entry.path))
+        pending.extend(reversed(subdirs))
+
+    return {stem: path for stem, (_, path) in found.items()}
+
+
+def get_file_index(
+    directories: Iterable[Path | str], suffixes: tuple[str, ...] = RULE_SUFFIXES
+) -> dict[str, Path]:
+    """Return a ``stem → path`` index over ``directories``.
+
+    Args:
+        directories (Iterable[Path | str]): Directories to index, highest
+            precedence first. Missing directories are tolerated.
+        suffixes (tuple[str, ...]): File suffixes to include, highest
+            precedence first. Defaults to `RULE_SUFFIXES`.
+
+    Returns:
+        dict[str, Path]: Mapping of file stem to the winning file path.
+            The mapping is shared; callers must not mutate it.
+    """
+    key = (tuple(str(d) for d in directories), suffixes)
+    index = _indexes.get(key)
+
+    if index is not None and all(
+        _mtime(path) == mtime for path, mtime in index.dir_mtimes.items()
+    ):
+        return index.files
+
+    logger.debug("Building file index for: {}", ", ".join(key[0]))
+    files: dict[str, Path] = {}
+    dir_mtimes: dict[str, int] = {}
+    for directory in key[0]:
+        for stem, path in _scan(directory, suffixes, dir_mtimes).items():
+            files.setdefault(stem, path)
+
+    _indexes[key] = _FileIndex(files=files, dir_mtimes=dir_mtimes)
+    return files
+
+
+def find_file(
+    stem: str,
+    directories: Iterable[Path | str],
+    suffixes: tuple[str, ...] = RULE_SUFFIXES,
+) -> Path | None:
+    """Return the path for ``stem`` under ``directories``, or ``None``.
+
+    Args:
+        stem (str): File stem to look up (e.g. a rule ID).
+        directories (Iterable[Path | str]): Directories to search,
+            highest precedence first.
+        suffixes (tuple[str, ...]): File suffixes to consider. Defaults to
+            `RULE_SUFFIXES`.
+
+    Returns:
+        Path | None: Matching file path, if any.
+    """
+    return get_file_index(directories, suffixes).get(stem)
+
+
+def find_file_by_id(
+    rule_id: str, directories: Iterable[Path | str]
+) -> Path | None:
+    """Return the rule file whose ``id:`` field is ``rule_id``, or ``None``.
+
+    Used as a fallback when a rule file is not named after its ID. The
+    ``id → path`` mapping is built once per index (reading each file
+    through `load_rule_file`) and rebuilt only when the index changes.
+
+    Args:
+        rule_id (str): Rule ID to match against each file's ``id`` key.
+        directories (Iterable[Path | str]): Directories to search,
+            highest precedence first.
+
+    Returns:
+        Path | None: Matching file path, if any.
+    """
+    directories = tuple(str(d) for d in directories)
+    files = get_file_index(directories, YAML_SUFFIXES)
+    key = (directories, YAML_SUFFIXES)
+    index = _indexes[key]
+
+    if index.ids is None:
+        ids: dict[str, Path] = {}
+        for path in files.values():
+            try:
+                file_id = load_rule_file(path).get("id")
+            except Exception as e:
+                logger.warning("Unable to read rule file {}: {}", path, e)
+                continue
+            if file_id:
+                ids.setdefault(file_id, path)
+        index = _indexes[key] = index._replace(ids=ids)
+
+    return index.ids.get(rule_id)
+
+
+def clear_file_indexes() -> None:
+    """Forget every memoized file index."""
+    _indexes.clear()
@@ -4,8 +4,11 @@
 Re-exports the top-level generator functions: `generate_baseline`
 (YAML baseline files), `generate_guidance` (human-readable guidance
 documents), `generate_mapping` (control-mapping reports),
-`generate_scap` (SCAP/XCCDF content), `generate_localize_template`
-and `generate_mo_from_json` (localization support files).
+`generate_scap` (SCAP/XCCDF content), `generate_query` (ad-hoc rule
+queries), `generate_coverage` (800-53 control coverage reports), `generate_refs`
+(reference identifier tracing), `generate_diff` (cross-version rule diffs),
+`generate_localize_template` and `generate_mo_from_json` (localization
+support files).
 """
 
 from .baseline import generate_baseline
@@ -17,6 +20,10 @@ from .translation import (
 
 # from .local_report import generate_local_report
 from .mapping import generate_mapping
+from .query import generate_query
+from .coverage import generate_coverage
+from .refs import generate_refs
+from .diff import generate_diff
 from .scap import generate_scap
 
 __all__ = [
@@ -24,6 +31,10 @@ __all__ = [
     "generate_guidance",
     "generate_mapping",
     "generate_scap",
+    "generate_query",
+    "generate_coverage",
+    "generate_refs",
+    "generate_diff",
     "generate_localize_template",
     "generate_mo_from_json",
 ]
@@ -12,14 +12,21 @@ import argparse
 import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..common_utils import conditional_inject_spinner
 from yaspin.core import Yaspin
 from yaspin.spinners import Spinners
 
 # Local python modules
-from ..classes import Author, Baseline, Macsecurityrule
+from ..classes import (
+    Author,
+    Baseline,
+    ControlCoverage,
+    Macsecurityrule,
+    RuleHeader,
+)
+from ..classes.baseline import load_section_descriptions
 from ..classes.legacy_baseline import LegacyBaseline
 from ..classes.rule_library import RuleLibrary
 from ..common_utils import (
@@ -32,8 +39,59 @@ from ..common_utils import (
 )
 
 
+class BaselineResources(NamedTuple):
+    """Data `generate_baseline` reads on every call, loaded once for bulk runs.
+
+    Attributes:
+        nist_baselines (dict[str, Any]): ``includes/800-53_baselines.yaml``.
+        section_descriptions (dict[str, str]): Section name → description
+            (see `load_section_descriptions`).
+        established_benchmarks (dict[tuple[str, float], tuple[str, ...]]):
+            ``(os_name, os_version)`` → `collect_established_benchmarks`
+            of that platform's preloaded rules.
+        benchmark_members (dict[tuple[str, float], dict[str, frozenset[str]]]):
+            ``(os_name, os_version)`` → `benchmark_members` of that
+            platform's preloaded rules.
+    """
+
+    nist_baselines: dict[str, Any]
+    section_descriptions: dict[str, str]
+    established_benchmarks: dict[tuple[str, float], tuple[str, ...]]
+    benchmark_members: dict[tuple[str, float], dict[str, frozenset[str]]]
+
+    @classmethod
+    def load(
+        cls, platform_rules: dict[tuple[str, float], list[Macsecurityrule]]
+    ) -> "BaselineResources":
+        """Load the shared data for the given preloaded rules.
+
+        Args:
+            platform_rules (dict[tuple[str, float], list[Macsecurityrule]]):
+                Preloaded rules keyed by ``(os_name, os_version)``.
+
+        Returns:
+            BaselineResources: The shared data.
+        """
+        return cls(
+            nist_baselines=open_file(
+                Path(config.get("includes_dir", ""), "800-53_baselines.yaml")
+            ),
+            section_descriptions=load_section_descriptions(),
+            established_benchmarks={
+                key: tuple(collect_established_benchmarks(rules))
+                for key, rules in platform_rules.items()
+            },
+            benchmark_members={
+                (os_name, os_version): benchmark_members(
+                    rules, os_name, str(os_version)
+                )
+                for (os_name, os_version), rules in platform_rules.items()
+            },
+        )
+
+
 def collect_tags_and_benchmarks(
-    rules: list[Macsecurityrule],
+    rules: list[Macsecurityrule] | list[RuleHeader],
 ) -> tuple[list[str], dict[str, set[str]]]:
     """Collect all tags and benchmark-to-platform mappings from a rule list.
 
@@ -42,7 +100,8 @@ def collect_tags_and_benchmarks(
     mapping each benchmark name to the set of OS types that declare it.
 
     Args:
-        rules (list[Macsecurityrule]): Rules to inspect.
+        rules (list[Macsecurityrule] | list[RuleHeader]): Rules (or rule
+            headers) to inspect.
 
     Returns:
         tuple[list[str], dict[str, set[str]]]: ``(sorted_tags, benchmark_platforms)``
@@ -73,14 +132,15 @@ def collect_tags_and_benchmarks(
 
 
 def collect_established_benchmarks(
-    rules: list[Macsecurityrule],
+    rules: list[Macsecurityrule] | list[RuleHeader],
 ) -> list[str]:
     """
     Attempts to collect all established benchmarks in the MSCP library. An established
     benchmark is one where an ODV has been defined for a given benchmark.
 
     Args:
-       rules (list[Macsecurityrule]): A list of collected rules from the library.
+       rules (list[Macsecurityrule] | list[RuleHeader]): A list of collected rules
+           (or rule headers) from the library.
 
     Returns:
         list: A sorted set of discovered benchmarks
@@ -128,12 +188,12 @@ def print_keyword_summary(
 
 
 def rule_has_benchmark_for_version(
-    rule: Macsecurityrule, keyword: str, os_type: str, os_version: str
+    rule: Macsecurityrule | RuleHeader, keyword: str, os_type: str, os_version: str
 ) -> bool:
     """Return True if *rule* declares *keyword* as a benchmark for the given OS version.
 
     Args:
-        rule (Macsecurityrule): Rule to inspect.
+        rule (Macsecurityrule | RuleHeader): Rule (or rule header) to inspect.
         keyword (str): Benchmark name to look for.
         os_type (str): OS type string (e.g. ``"macos"``); ``"os"`` is
             normalized to ``"OS"`` before the lookup.
@@ -160,6 +220,44 @@ def rule_has_benchmark_for_version(
     return False
 
 
+def benchmark_members(
+    rules: list[Macsecurityrule] | list[RuleHeader], os_type: str, os_version: str
+) -> dict[str, frozenset[str]]:
+    """Map every benchmark to the IDs of the rules declaring it for one OS version.
+
+    Walks each rule's ``platforms`` entry once, so keyword selection can
+    use set lookups instead of calling `rule_has_benchmark_for_version`
+    for every rule and keyword.
+
+    Args:
+        rules (list[Macsecurityrule] | list[RuleHeader]): Rules (or rule
+            headers) to index.
+        os_type (str): OS type string (e.g. ``"macos"``); ``"os"`` is
+            normalized to ``"OS"`` as in `rule_has_benchmark_for_version`.
+        os_version (str): OS version string (e.g. ``"26.0"``).
+
+    Returns:
+        dict[str, frozenset[str]]: Benchmark name → rule IDs.
+    """
+    os_type = os_type.replace("os", "OS")
+    members: defaultdict[str, set[str]] = defaultdict(set)
+
+    for rule in rules:
+        version_map = (rule.platforms or {}).get(os_type, {})
+        if not isinstance(version_map, dict):
+            continue
+
+        version_info = version_map.get(os_version)
+        if not isinstance(version_info, dict):
+            continue
+
+        for benchmark in version_info.get("benchmarks", []):
+            if isinstance(benchmark, dict) and benchmark.get("name") is not None:
+                members[benchmark["name"]].add(rule.rule_id)
+
+    return {name: frozenset(rule_ids) for name, rule_ids in members.items()}
+
+
 def migrate_legacy_baseline(args: argparse.Namespace) -> None:
     """Migrate a legacy (pre-2.0) baseline YAML to the current format.
 
@@ -242,6 +340,47 @@ def migrate_legacy_baseline(args: argparse.Namespace) -> None:
         print("All rules resolved successfully.")
 
 
+def select_rules(
+    rules: list[Macsecurityrule] | list[RuleHeader],
+    keyword: str,
+    os_name: str,
+    os_version: float,
+    members: dict[str, frozenset[str]] | None = None,
+) -> list[Macsecurityrule] | list[RuleHeader]:
+    """Return the rules a baseline for ``keyword`` includes.
+
+    A rule is included when ``keyword`` is one of its benchmarks for the
+    given OS version or one of its tags; ``"all_rules"`` includes every
+    rule.
+
+    Args:
+        rules (list[Macsecurityrule] | list[RuleHeader]): Rules (or rule
+            headers) of one platform and OS version.
+        keyword (str): Benchmark or tag to select.
+        os_name (str): OS type (e.g. ``"macos"``).
+        os_version (float): OS version (e.g. ``26.0``).
+        members (dict[str, frozenset[str]] | None): `benchmark_members`
+            of ``rules`` for this OS version. Computed when omitted; pass
+            it when selecting several keywords from the same rules.
+
+    Returns:
+        list[Macsecurityrule] | list[RuleHeader]: The selected rules, in
+            the order given.
+    """
+    if members is None:
+        members = benchmark_members(rules, os_name, str(os_version))
+    benchmark_rules: frozenset[str] = members.get(keyword, frozenset())
+
+    return [
+        rule
+        for rule in rules
+        if rule.rule_id in benchmark_rules
+        or (rule.tags is not None and keyword in rule.tags)
+        # or any(item in misc_tags for item in rule.tags or [])
+        or keyword == "all_rules"
+    ]
+
+
 @logger.catch
 @conditional_inject_spinner()
 def generate_baseline(
@@ -249,6 +388,7 @@ def generate_baseline(
     args: argparse.Namespace,
     admin=False,
     preloaded_rules: list[Macsecurityrule] | None = None,
+    resources: BaselineResources | None = None,
 ) -> None:
     """Generate a YAML baseline file for the specified OS and keyword.
 
@@ -256,6 +396,10 @@ def generate_baseline(
     optionally runs the interactive tailoring workflow, and writes the
     resulting baseline YAML to disk.
 
+    Rules are loaded in two phases: keyword matching runs on the
+    lightweight headers from `Macsecurityrule.collect_platform_headers`,
+    and full `Macsecurityrule` models are built only for the matches.
+
     Args:
         args (argparse.Namespace): Parsed CLI arguments.  Expected attributes:
             ``os_name``, ``os_version``, ``keyword``, ``tailor``,
@@ -267,6 +411,9 @@ def generate_baseline(
             provided, skips the ``collect_platform_rules`` call. Useful
             for bulk generation where the same platform rules are reused
             across many calls.
+        resources: Data shared across bulk calls (800-53 baselines,
+            section descriptions, established benchmarks of the preloaded
+            rules). Loaded per call when omitted.
     """
     sp.spinner = Spinners.dots
     if getattr(args, "migrate", None):
@@ -282,9 +429,12 @@ def generate_baseline(
         build_path / f"{args.keyword}_{args.os_name}_{args.os_version}.yaml"
     )
 
-    baselines_data: dict = open_file(
-        Path(config.get("includes_dir", ""), "800-53_baselines.yaml")
-    )
+    if resources is not None:
+        baselines_data: dict = resources.nist_baselines
+    else:
+        baselines_data: dict = open_file(
+            Path(config.get("includes_dir", ""), "800-53_baselines.yaml")
+        )
 
     benchmark: str = "recommended"
     full_title: str = args.keyword
@@ -330,59 +480,65 @@ def generate_baseline(
         print_keyword_summary(all_tags, benchmark_map)
         sp.ok("✔")
 
+    def materialize(
+        rules: list[Macsecurityrule] | list[RuleHeader],
+    ) -> list[Macsecurityrule]:
+        if preloaded_rules is not None:
+            return rules
+        return Macsecurityrule.from_headers(
+            rules, args.os_name, args.os_version, args.tailor, parent_values="Default"
+        )
+
     if preloaded_rules is not None:
-        all_rules: list[Macsecurityrule] = preloaded_rules
+        all_rules: list[Macsecurityrule] | list[RuleHeader] = preloaded_rules
     else:
         sp.text = f"Loading rules for {args.os_name} {args.os_version}"
-        all_rules = Macsecurityrule.collect_platform_rules(
-            args.os_name, args.os_version, args.tailor, parent_values="Default"
+        all_rules = Macsecurityrule.collect_platform_headers(
+            args.os_name, args.os_version, args.tailor
         )
         sp.ok("✔")
-    all_tags, benchmark_map = collect_tags_and_benchmarks(all_rules)
-
-    established_benchmarks: tuple[str, ...] = collect_established_benchmarks(all_rules)
+    established_benchmarks: tuple[str, ...] | None = None
+    if resources is not None:
+        established_benchmarks = resources.established_benchmarks.get(
+            (args.os_name, args.os_version)
+        )
+    if established_benchmarks is None:
+        established_benchmarks = collect_established_benchmarks(all_rules)
 
     if args.controls:
-        included_controls: list[str] = sorted(
-            {
-                control
-                for rule in all_rules
-                for control in (rule.references.nist.nist_800_53r5 or [])
-            }
+        coverage = ControlCoverage(
+            materialize(all_rules), {"low": baselines_data.get("low", [])}
         )
 
-        needed_controls: list[str] = [
-            control for control in baselines_data.get("low", [])
-        ]
-
-        for control in needed_controls:
-            if control not in included_controls:
+        for os_type, os_version in coverage.platforms:
+            for control in coverage.missing(os_type, os_version, "low"):
                 logger.info(
                     f"{control} missing from any rule, needs a rule, or included in supplemental"
                 )
 
         sys.exit()
 
-    if (
-        args.keyword not in all_tags
-        and not args.keyword
-        and args.keyword not in benchmark_map
-    ):
-        logger.info(
-            "No rules found for the keyword provided, please verify from the following list:"
-        )
-        print_keyword_summary(all_tags, benchmark_map)
+    if not args.keyword:
+        all_tags, benchmark_map = collect_tags_and_benchmarks(all_rules)
+        if args.keyword not in all_tags and args.keyword not in benchmark_map:
+            logger.info(
+                "No rules found for the keyword provided, please verify from the following list:"
+            )
+            print_keyword_summary(all_tags, benchmark_map)
 
-    found_rules = [
-        rule
-        for rule in all_rules
-        if rule_has_benchmark_for_version(
-            rule, args.keyword, args.os_name, str(args.os_version)
+    found_rules: list[Macsecurityrule] = materialize(
+        select_rules(
+            all_rules,
+            args.keyword,
+            args.os_name,
+            args.os_version,
+            members=(
+                resources.benchmark_members.get((args.os_name, args.os_version))
+                if resources is not None
+                else None
+            ),
         )
-        or (rule.tags is not None and args.keyword in rule.tags)
-        # or any(item in misc_tags for item in rule.tags or [])
-        or args.keyword == "all_rules"
-    ]
+    )
 
     baseline_dict = {}
 
@@ -438,6 +594,9 @@ def generate_baseline(
             os_type=args.os_name,
             os_version=args.os_version,
             baseline_dict=baseline_dict,
+            section_descriptions=(
+                resources.section_descriptions if resources is not None else None
+            ),
         )
 
         try:
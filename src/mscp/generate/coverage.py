@@ -0,0 +1,45 @@
+# mscp/generate/coverage.py
+"""NIST SP 800-53r5 control coverage reports for mSCP.
+
+Provides `generate_coverage`, the ``mscp coverage`` subcommand, which
+loads every supported platform and OS version into a `RuleLibrary` and
+writes the `ControlCoverage` summary and per-rule control counts.
+"""
+
+# Standard python modules
+import argparse
+from pathlib import Path
+
+# Local python modules
+from ..classes import ControlCoverage, RuleLibrary
+from ..common_utils import config
+from ..common_utils.logger_instance import logger
+
+
+def generate_coverage(args: argparse.Namespace) -> None:
+    """Write 800-53 baseline coverage for every platform and OS version.
+
+    Prints one line per platform, version and baseline with the number
+    of required controls covered by at least one rule, and writes the
+    full report (including the missing controls and per-rule counts) as
+    CSV or JSON.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments. Expected
+            attributes: ``format`` (``"csv"`` or ``"json"``) and
+            ``output`` (directory; defaults to ``coverage`` under
+            ``config["output_dir"]``).
+    """
+    output_dir = Path(args.output or Path(config["output_dir"], "coverage"))
+
+    logger.info("Computing control coverage for all platforms")
+    coverage = ControlCoverage(RuleLibrary.from_rules_dir())
+
+    for row in coverage.summary().itertuples():
+        print(
+            f"{row.platform:<10}{row.os_version:<7}{row.baseline:<10}"
+            f"{row.covered:>4}/{row.required:<4} {row.coverage:5.1f}%"
+        )
+
+    for path in coverage.write(output_dir, args.format):
+        print(f"Wrote {path}")
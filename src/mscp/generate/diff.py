@@ -0,0 +1,55 @@
+# mscp/generate/diff.py
+"""Cross-version rule diff for mSCP.
+
+Provides `generate_diff`, the ``mscp diff`` subcommand, which loads the
+rules for two platform / OS version pairs from a single parse of the rule
+files and reports the rules added, removed and changed between them
+(see `RuleLibrary.diff`) as Markdown or JSON.
+"""
+
+# Standard python modules
+import argparse
+import json
+from collections import defaultdict
+
+# Local python modules
+from ..classes import Macsecurityrule, RuleLibrary
+from ..common_utils import create_json, create_text
+from ..common_utils.logger_instance import logger
+
+
+def generate_diff(args: argparse.Namespace) -> None:
+    """Print or write the differences between two platform / OS versions.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments. Expected
+            attributes: ``source`` and ``target`` (``(platform,
+            os_version)`` tuples), ``format`` (``"markdown"`` or
+            ``"json"``) and ``output`` (file path, or ``None`` to print).
+    """
+    platforms: defaultdict[str, list[float]] = defaultdict(list)
+    for platform, os_version in (args.source, args.target):
+        if os_version not in platforms[platform]:
+            platforms[platform].append(os_version)
+
+    library = RuleLibrary(Macsecurityrule.collect_all_platform_rules(platforms))
+    diff = library.diff(args.source, args.target)
+    logger.info(
+        "{} → {}: {} added, {} removed, {} changed",
+        diff.source,
+        diff.target,
+        len(diff.added),
+        len(diff.removed),
+        len(diff.changed),
+    )
+
+    if args.output:
+        if args.format == "json":
+            create_json(args.output, diff.to_dict())
+        else:
+            create_text(args.output, diff.to_markdown())
+        logger.success("Wrote rule diff to {}", args.output)
+    elif args.format == "json":
+        print(json.dumps(diff.to_dict(), indent=2, default=str))
+    else:
+        print(diff.to_markdown(), end="")
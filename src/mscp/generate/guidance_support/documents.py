@@ -471,7 +471,7 @@ def render_template(
 
     template: Template = env.get_template(template_name)
 
-    baseline_dict: dict[str, Any] = baseline.model_dump()
+    baseline_dict: dict[str, Any] = baseline.to_template_dict()
     acronyms_data: dict[str, Any] = open_file(acronyms_file, language)
 
     _title_parts = baseline.title.split(":", 1)
@@ -253,9 +253,8 @@ def generate_excel(file_out: Path, baseline: Baseline) -> None:
     dataframe = baseline.to_dataframe()
 
     # drop unnecessary columns
-    dataframe.drop("uuid", axis=1, inplace=True)
     # dataframe.drop("section", axis=1, inplace=True)
-    dataframe.drop("platforms", axis=1, inplace=True)
+    dataframe.drop("benchmarks", axis=1, inplace=True)
     dataframe.drop("os_name", axis=1, inplace=True)
     dataframe.drop("os_type", axis=1, inplace=True)
     dataframe.drop("os_version", axis=1, inplace=True)
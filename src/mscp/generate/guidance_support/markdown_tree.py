@@ -329,7 +329,7 @@ def generate_markdown_tree(
     template_dirs = search_paths("documents_templates_dir")
     env = _build_env(template_dirs, language)
 
-    baseline_dict = baseline.model_dump()
+    baseline_dict = baseline.to_template_dict()
     benchmark = baseline.title.split()[-1]
     benchmarks = mscp_data.get("benchmarks", "")
     baseline_dict["tailored"] = "Tailored from" in baseline.title
@@ -371,23 +371,22 @@ def generate_markdown_tree(
     # Sections: position 2+ (overview is position 1 / no-prefix index.md).
     # The section directory carries a NN- prefix matching section_position so
     # the filesystem sort order matches the document order.
-    for section_position, profile in enumerate(baseline.profile, start=2):
-        section_slug = create_slug(profile.section)
+    for section_position, profile in enumerate(baseline_dict["profile"], start=2):
+        section_slug = create_slug(profile["section"])
         section_dir = output_root / f"{section_position:02d}-{section_slug}"
         make_dir(section_dir)
 
-        section_description = asciidoc_to_markdown(profile.description).strip()
+        section_description = asciidoc_to_markdown(profile["description"]).strip()
         section_index_body = section_description + "\n" if section_description else ""
         section_index = (
-            _frontmatter({"title": profile.section})
+            _frontmatter({"title": profile["section"]})
             + "\n\n"
             + mdx_escape(section_index_body)
         )
         (section_dir / "index.md").write_text(section_index, encoding="utf-8")
 
-        for rule_position, rule in enumerate(profile.rules, start=1):
-            rule_dict = rule.model_dump()
-            body = rule_template.render(rule=rule_dict, **context)
+        for rule_position, rule in enumerate(profile["rules"], start=1):
+            body = rule_template.render(rule=rule, **context)
             page = _frontmatter({"title": rule.title}) + "\n\n" + mdx_escape(body)
             rule_file = (
                 section_dir / f"{rule_position:02d}-{create_slug(rule.title)}.md"
@@ -396,8 +395,8 @@ def generate_markdown_tree(
 
         logger.debug(
             "Markdown tree: wrote {} rules for section '{}'",
-            len(profile.rules),
-            profile.section,
+            len(profile["rules"]),
+            profile["section"],
         )
 
     logger.success(f"Markdown tree output written to {output_root}")
@@ -0,0 +1,70 @@
+# mscp/generate/query.py
+"""Ad-hoc rule queries for mSCP.
+
+Provides `generate_query`, the ``mscp query`` subcommand, which loads
+every supported platform and OS version into a `RuleLibrary` and prints
+the rules matched by a `RuleLibrary.query` expression.
+"""
+
+# Standard python modules
+import argparse
+import json
+import sys
+
+# Local python modules
+from ..classes import RuleLibrary
+from ..common_utils.logger_instance import logger
+
+
+def generate_query(args: argparse.Namespace) -> None:
+    """Print the rules matching ``args.expression`` across every platform.
+
+    Each match is printed as ``rule_id``, platform, OS version and
+    enforcement mechanism, in library order, followed by a count. With
+    ``--format json`` a JSON list of the same fields (plus ``title``) is
+    printed instead; with ``--count`` only the number of matches.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments. Expected
+            attributes: ``expression``, ``format`` (``"human"`` or
+            ``"json"``), ``count``.
+    """
+    library = RuleLibrary.from_rules_dir()
+
+    try:
+        matches = library.query(args.expression)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    logger.info("Query {!r} matched {} rules", args.expression, len(matches))
+
+    if args.count:
+        print(len(matches))
+        return
+
+    if args.format == "json":
+        print(
+            json.dumps(
+                [
+                    {
+                        "id": rule.rule_id,
+                        "platform": rule.os_type,
+                        "os_version": rule.os_version,
+                        "mechanism": rule.mechanism,
+                        "title": rule.title,
+                    }
+                    for rule in matches
+                ],
+                indent=2,
+            )
+        )
+        return
+
+    width = max((len(rule.rule_id) for rule in matches), default=0) + 2
+    for rule in matches:
+        print(
+            f"{rule.rule_id.ljust(width)}{rule.os_type.ljust(10)}"
+            f"{str(rule.os_version).ljust(7)}{rule.mechanism}"
+        )
+    print(f"\n{len(matches)} rules matched")
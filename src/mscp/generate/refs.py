@@ -0,0 +1,92 @@
+# mscp/generate/refs.py
+"""Reference tracing for mSCP.
+
+Provides `generate_refs`, the ``mscp refs`` subcommand, which loads every
+supported platform and OS version into a `RuleLibrary`, builds a
+`ReferenceIndex`, and lists the rules and platforms carrying each
+requested framework identifier.
+"""
+
+# Standard python modules
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Local python modules
+from ..classes import ReferenceIndex, RuleLibrary
+from ..common_utils.logger_instance import logger
+
+
+def _read_identifiers(path: Path) -> list[str]:
+    """Return the identifiers in ``path``, one per line; ``#`` starts a comment."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    identifiers = (line.split("#", 1)[0].strip() for line in lines)
+    return [identifier for identifier in identifiers if identifier]
+
+
+def generate_refs(args: argparse.Namespace) -> None:
+    """Print the rules carrying each identifier in ``args.identifiers``.
+
+    Identifiers containing ``*``, ``?`` or ``[`` are matched as globs
+    (e.g. ``"AC-2(*)"``, ``"SRG-OS-0001*"``); with ``--family`` each
+    identifier also matches its 800-53 enhancements. For every
+    identifier the matching rules are printed with the framework field
+    that carries the identifier and the platforms / OS versions of the
+    rule; with ``--format json`` a JSON object keyed by identifier is
+    printed instead. Identifiers with no match are listed at the end.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments. Expected
+            attributes: ``identifiers``, ``file`` (path or ``None``),
+            ``family``, ``format`` (``"human"`` or ``"json"``).
+    """
+    identifiers: list[str] = list(args.identifiers)
+    if args.file:
+        identifiers.extend(_read_identifiers(args.file))
+    if not identifiers:
+        logger.error("No identifiers given; pass them as arguments or with --file")
+        sys.exit(1)
+
+    index = ReferenceIndex(RuleLibrary.from_rules_dir())
+    logger.info("Indexed {} reference identifiers", len(index))
+
+    results = {
+        identifier: index.family(identifier) if args.family else index.find(identifier)
+        for identifier in dict.fromkeys(identifiers)
+    }
+
+    if args.format == "json":
+        print(
+            json.dumps(
+                {
+                    identifier: [hit._asdict() for hit in hits]
+                    for identifier, hits in results.items()
+                },
+                indent=2,
+            )
+        )
+        return
+
+    rows: dict[str, dict[tuple[str, str, str], list[str]]] = {}
+    for identifier, hits in results.items():
+        for hit in hits:
+            rows.setdefault(identifier, {}).setdefault(
+                (hit.reference, hit.framework, hit.rule_id), []
+            ).append(f"{hit.os_type} {hit.os_version}")
+
+    widths = [
+        max((len(key[i]) for found in rows.values() for key in found), default=0) + 2
+        for i in range(3)
+    ]
+    for identifier, found in rows.items():
+        print(identifier)
+        for (reference, framework, rule_id), platforms in found.items():
+            print(
+                f"  {reference.ljust(widths[0])}{framework.ljust(widths[1])}"
+                f"{rule_id.ljust(widths[2])}{', '.join(platforms)}"
+            )
+
+    missing = [identifier for identifier, hits in results.items() if not hits]
+    if missing:
+        print(f"\nNot found ({len(missing)}): {', '.join(missing)}")
@@ -29,9 +29,9 @@ from ..classes import Macsecurityrule
 from ..common_utils import config, get_version_data, logger, mscp_data
 
 from .baseline import (
+    benchmark_members,
     print_keyword_summary,
     collect_tags_and_benchmarks,
-    rule_has_benchmark_for_version,
 )
 
 
@@ -160,14 +160,18 @@ def generate_scap(sp: Yaspin, args: argparse.Namespace) -> None:
     else:
         all_baseline_benchmark = [args.baseline]
 
+    # benchmark → rule IDs for this OS version, shared by every profile
+    members: dict[str, frozenset[str]] = benchmark_members(
+        all_rules, args.os_name, str(args.os_version)
+    )
+
     all_the_baselines = [{}]
     for b in all_baseline_benchmark:
+        benchmark_rules = members.get(b, frozenset())
         found_rules = [
             rule
             for rule in all_rules
-            if rule_has_benchmark_for_version(
-                rule, b, args.os_name, str(args.os_version)
-            )
+            if rule.rule_id in benchmark_rules
             or (rule.tags is not None and b in rule.tags)
         ]
         baseline_dict = {b: found_rules}
@@ -200,8 +204,6 @@ def generate_scap(sp: Yaspin, args: argparse.Namespace) -> None:
                         odv_tag = b
                 except (TypeError, KeyError) as e:
                     logger.warning(f"Error when looking up ODV for {rule.rule_id}: {e}")
-                newrule = rule.model_copy(deep=True)
-                newrule._fill_in_odv(b)
 
                 xccdfProfiles = (
                     xccdfProfiles
@@ -217,9 +219,7 @@ def generate_scap(sp: Yaspin, args: argparse.Namespace) -> None:
             continue
         if args.baseline != "all_rules":
             if (
-                not rule_has_benchmark_for_version(
-                    rule, args.baseline, args.os_name, str(args.os_version)
-                )
+                rule.rule_id not in members.get(args.baseline, frozenset())
                 and args.baseline not in rule.tags
             ):
                 continue
@@ -312,7 +312,6 @@ def generate_scap(sp: Yaspin, args: argparse.Namespace) -> None:
                 selected_os_benchmark.append("recommended")
 
             for k, _ in rule.odv.items():
-                newrule = rule.model_copy(deep=True)
                 if k == "hint":
                     continue
                 check_existence = ""
@@ -325,7 +324,7 @@ def generate_scap(sp: Yaspin, args: argparse.Namespace) -> None:
                             oval_counter
                         )
 
-                    newrule._fill_in_odv(k)
+                    newrule = rule.resolve_odv(k)
                     fix_value = "none" if newrule.fix is None else escape(newrule.fix)
                     check_value = (
                         "none" if newrule.check is None else escape(newrule.check)
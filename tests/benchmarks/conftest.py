@@ -0,0 +1,86 @@
+"""Shared fixtures for the performance benchmark suite.
+
+The benchmarks time the generation pipeline against the bundled rules and
+baselines with `pytest-benchmark` (``pip install -e .[dev]``). They are
+deselected from the regular test run by the ``-m "not benchmark"`` default
+in ``pyproject.toml``; run them explicitly and write machine-readable
+results with::
+
+    pytest tests/benchmarks -m benchmark --benchmark-json=benchmark.json
+
+Compare a change against a saved run with ``--benchmark-autosave`` and
+``--benchmark-compare``. Every benchmark writes into a temporary custom
+and output directory, so the working tree is left untouched. Without
+`pytest-benchmark` installed the suite is not collected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from mscp.common_utils import (
+    config,
+    ensure_custom_dirs,
+    get_version_data,
+    logging_config,
+    mscp_data,
+    set_custom_dir,
+)
+
+#: Bundled baseline used by the guidance benchmarks.
+BASELINE_PATH: Path = (
+    Path(__file__).parents[2]
+    / "src"
+    / "mscp"
+    / "data"
+    / "baselines"
+    / "macos"
+    / "cis_lvl1_macos_26.0.yaml"
+)
+
+OS_NAME: str = "macos"
+OS_VERSION: float = 26.0
+
+# the benchmarks need the ``benchmark`` fixture; skip them without the plugin
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(autouse=True)
+def workspace(tmp_path, monkeypatch) -> Path:
+    """Redirect custom and output directories into ``tmp_path``."""
+    previous_custom_dir = Path(config["custom_dir"])
+    set_custom_dir(tmp_path / "custom")
+    ensure_custom_dirs()
+    output_dir = tmp_path / "build"
+    output_dir.mkdir()
+    monkeypatch.setitem(config, "output_dir", str(output_dir))
+    monkeypatch.setattr(logging_config, "suppress_spinner", True)
+    yield tmp_path
+    set_custom_dir(previous_custom_dir)
+
+
+@pytest.fixture
+def baseline_path() -> Path:
+    return BASELINE_PATH
+
+
+@pytest.fixture
+def version_data() -> dict:
+    return get_version_data(OS_NAME, OS_VERSION, mscp_data)
+
+
+@pytest.fixture
+def cli_args():
+    """Return a factory for the `argparse.Namespace` the CLI would build."""
+
+    def make(**overrides) -> argparse.Namespace:
+        values = {"os_name": OS_NAME, "os_version": OS_VERSION}
+        values.update(overrides)
+        return argparse.Namespace(**values)
+
+    return make
@@ -0,0 +1,28 @@
+"""Benchmarks for the baseline and SCAP generators."""
+
+from __future__ import annotations
+
+import pytest
+
+from mscp.generate.baseline import generate_baseline
+from mscp.generate.scap import generate_scap
+
+pytestmark = pytest.mark.benchmark(group="generate")
+
+
+@pytest.mark.parametrize("keyword", ["cis_lvl1", "all_rules"])
+def test_generate_baseline(benchmark, cli_args, workspace, keyword):
+    args = cli_args(
+        keyword=keyword, tailor=False, list_tags=False, controls=False, migrate=None
+    )
+    benchmark.pedantic(generate_baseline, args=(args,), rounds=3)
+    assert list((workspace / "custom" / "baselines").glob(f"{keyword}_*.yaml"))
+
+
+@pytest.mark.parametrize("baseline", ["cis_lvl1", "all_rules"])
+def test_generate_scap(benchmark, cli_args, workspace, baseline):
+    args = cli_args(
+        baseline=baseline, list_tags=False, oval=None, xccdf=None, disa_stig=None
+    )
+    benchmark.pedantic(generate_scap, args=(args,), rounds=3)
+    assert list((workspace / "build").glob("*.xml"))
@@ -0,0 +1,66 @@
+"""Benchmarks for the guidance artifact generators."""
+
+from __future__ import annotations
+
+import pytest
+
+from mscp.classes import Baseline
+from mscp.generate.guidance_support import (
+    generate_excel,
+    generate_markdown_tree,
+    generate_profiles,
+    generate_restore_script,
+    generate_script,
+)
+
+pytestmark = pytest.mark.benchmark(group="guidance")
+
+
+@pytest.fixture
+def baseline(baseline_path) -> Baseline:
+    return Baseline.from_yaml(baseline_path)
+
+
+def test_generate_excel(benchmark, baseline, workspace):
+    output_file = workspace / "build" / "cis_lvl1.xlsx"
+    benchmark.pedantic(generate_excel, args=(output_file, baseline), rounds=3)
+    assert output_file.is_file()
+
+
+def test_generate_profiles(benchmark, baseline, workspace):
+    build_path = workspace / "build" / "cis_lvl1"
+    benchmark.pedantic(
+        generate_profiles,
+        args=(build_path, "cis_lvl1", baseline),
+        kwargs={"consolidated": True, "granular": True},
+        rounds=3,
+    )
+    assert any(build_path.rglob("*.mobileconfig"))
+
+
+def test_generate_markdown_tree(benchmark, baseline, version_data, workspace):
+    build_path = workspace / "build" / "cis_lvl1"
+    benchmark.pedantic(
+        generate_markdown_tree,
+        kwargs={
+            "build_path": build_path,
+            "baseline": baseline,
+            "version_info": version_data,
+        },
+        rounds=3,
+    )
+    assert (build_path / "markdown_tree" / "index.md").is_file()
+
+
+def test_generate_scripts(benchmark, baseline, version_data, workspace):
+    build_path = workspace / "build" / "cis_lvl1"
+    build_path.mkdir(parents=True)
+
+    def render() -> None:
+        for generator in (generate_script, generate_restore_script):
+            generator(
+                build_path, "cis_lvl1", "cis_lvl1", baseline, "default", version_data
+            )
+
+    benchmark.pedantic(render, rounds=3)
+    assert (build_path / "cis_lvl1_compliance.sh").is_file()
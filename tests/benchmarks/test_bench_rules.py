@@ -0,0 +1,60 @@
+"""Benchmarks for loading the bundled rule library."""
+
+from __future__ import annotations
+
+import pytest
+
+from mscp.classes import Baseline, Macsecurityrule, RuleLibrary
+from mscp.common_utils import clear_file_indexes, clear_override_cache, config
+
+from .conftest import OS_NAME, OS_VERSION
+
+pytestmark = pytest.mark.benchmark(group="rules")
+
+
+def _cold_caches() -> None:
+    clear_file_indexes()
+    clear_override_cache()
+
+
+def test_collect_platform_rules_cold(benchmark, monkeypatch):
+    monkeypatch.setitem(config, "rule_cache", False)
+    rules = benchmark.pedantic(
+        Macsecurityrule.collect_platform_rules,
+        args=(OS_NAME, OS_VERSION),
+        setup=_cold_caches,
+        rounds=3,
+    )
+    assert rules
+
+
+def test_collect_platform_rules_warm(benchmark):
+    Macsecurityrule.collect_platform_rules(OS_NAME, OS_VERSION)
+    rules = benchmark.pedantic(
+        Macsecurityrule.collect_platform_rules, args=(OS_NAME, OS_VERSION), rounds=5
+    )
+    assert rules
+
+
+def test_rule_library_from_rules_dir(benchmark):
+    library = benchmark.pedantic(RuleLibrary.from_rules_dir, rounds=3)
+    assert len(library)
+
+
+def test_baseline_from_yaml(benchmark, baseline_path):
+    baseline = benchmark.pedantic(Baseline.from_yaml, args=(baseline_path,), rounds=5)
+    assert baseline.profile
+
+
+def test_rule_library_chained_filters(benchmark):
+    library = RuleLibrary.from_rules_dir()
+
+    def query() -> RuleLibrary:
+        return (
+            library.by_platform(OS_NAME)
+            .by_os(os_version=OS_VERSION)
+            .by_benchmark("cis_lvl1")
+            .by_nist_control("AC-2")
+        )
+
+    assert benchmark(query) is not None
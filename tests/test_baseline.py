@@ -0,0 +1,81 @@
+"""Tests for loading baselines.
+
+Covers:
+- `Baseline.from_yaml` builds the same profiles as loading each
+  profile's rules on its own
+- `load_section_files` is memoized per directory and language and
+  re-reads changed files
+- `benchmark_members` / `select_rules` agree with
+  `rule_has_benchmark_for_version`
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from mscp.classes import Baseline, Macsecurityrule
+from mscp.classes.baseline import load_section_files
+from mscp.common_utils import config, open_file
+from mscp.generate.baseline import (
+    benchmark_members,
+    collect_tags_and_benchmarks,
+    rule_has_benchmark_for_version,
+    select_rules,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_from_yaml_matches_per_profile_load(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    monkeypatch.setitem(config, "rule_cache", False)
+    path = Path("baselines/macos/cis_lvl2_macos_26.0.yaml")
+    baseline = Baseline.from_yaml(path)
+    data = open_file(path)
+
+    assert len(baseline.profile) == len(data["profile"])
+    for profile, prof in zip(baseline.profile, data["profile"]):
+        expected = Macsecurityrule.load_rules(
+            prof["rules"],
+            data["platform"]["os"],
+            data["platform"]["version"],
+            data["parent_values"],
+            profile.section,
+        )
+        assert [r.model_dump(exclude={"uuid"}) for r in profile.rules] == [
+            r.model_dump(exclude={"uuid"}) for r in expected
+        ]
+
+
+def test_section_files_cached(tmp_path):
+    section = tmp_path / "auditing.yaml"
+    section.write_text("name: Auditing\ndescription: old\n")
+
+    first = load_section_files(tmp_path)
+    assert first[section]["description"] == "old"
+    assert load_section_files(tmp_path) is first
+    assert load_section_files(tmp_path, "de") is not first
+
+    section.write_text("name: Auditing\ndescription: new\n")
+    stat = section.stat()
+    os.utime(section, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_section_files(tmp_path)[section]["description"] == "new"
+
+
+def test_benchmark_members(monkeypatch):
+    monkeypatch.setitem(config, "rule_cache", False)
+    rules = Macsecurityrule.collect_platform_rules("macos", 26.0)
+    members = benchmark_members(rules, "macos", "26.0")
+    all_tags, benchmark_map = collect_tags_and_benchmarks(rules)
+
+    assert set(members) <= set(benchmark_map)
+    for keyword in [*benchmark_map, *all_tags]:
+        expected = [
+            rule
+            for rule in rules
+            if rule_has_benchmark_for_version(rule, keyword, "macos", "26.0")
+            or keyword in rule.tags
+            or keyword == "all_rules"
+        ]
+        assert select_rules(rules, keyword, "macos", 26.0, members=members) == expected
@@ -0,0 +1,116 @@
+"""Tests for `run_baseline_jobs`.
+
+Covers:
+- forked workers see the preloaded rules, write the same files and
+  print the same output, in job order, as a serial run
+- duplicate jobs run once
+- `build_all_baselines` only regenerates the baselines a rule change
+  affects and leaves identical files untouched
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+from mscp.admin_utils import build_baselines
+from mscp.admin_utils.baseline_manifest import BaselineManifest
+from mscp.admin_utils.build_baselines import (
+    BaselineJob,
+    build_all_baselines,
+    run_baseline_jobs,
+)
+from mscp.common_utils import config
+
+
+def _fake_generate_baseline(args, admin, preloaded_rules, resources):
+    path = Path(config["baseline_dir"], args.os_name, f"{args.keyword}.txt")
+    path.write_text(f"{args.os_version} {' '.join(preloaded_rules)}")
+    print(f"wrote {path.name}")
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_baselines, "generate_baseline", _fake_generate_baseline)
+    monkeypatch.setitem(config, "baseline_dir", str(tmp_path))
+    (tmp_path / "macos").mkdir()
+    (tmp_path / "ios").mkdir()
+
+    def run(workers: int) -> dict[str, str]:
+        for path in tmp_path.rglob("*.txt"):
+            path.unlink()
+        jobs = [
+            BaselineJob(keyword, os_name, 26.0)
+            for os_name in ("macos", "ios")
+            for keyword in ("cis_lvl1", "800-53r5_low", "all_rules")
+        ]
+        platform_rules = {("macos", 26.0): ["os_a", "os_b"], ("ios", 26.0): ["os_c"]}
+        args = argparse.Namespace(os_version=15.0)
+        run_baseline_jobs(args, jobs + jobs[:2], platform_rules, workers=workers)
+        return {
+            str(path.relative_to(tmp_path)): path.read_text()
+            for path in sorted(tmp_path.rglob("*.txt"))
+        }
+
+    return run
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_parallel_matches_serial(run, capsys):
+    serial = run(workers=1)
+    serial_output = capsys.readouterr().out
+    parallel = run(workers=3)
+
+    assert parallel == serial
+    assert serial["ios/all_rules.txt"] == "26.0 os_c"
+    assert capsys.readouterr().out == serial_output
+    assert serial_output.splitlines() == [
+        f"wrote {keyword}.txt"
+        for _ in ("macos", "ios")
+        for keyword in ("cis_lvl1", "800-53r5_low", "all_rules")
+    ]
+
+
+def test_incremental_build(tmp_path, monkeypatch, capsys):
+    baselines = tmp_path / "baselines"
+    custom = tmp_path / "custom"
+    custom.mkdir()
+    monkeypatch.setitem(config, "baseline_dir", str(baselines))
+    monkeypatch.setitem(config, "jobs", 1)
+    monkeypatch.setitem(config, "rule_cache", False)
+    monkeypatch.setitem(config["custom"], "rules_dir", str(custom))
+
+    def build(**kwargs) -> set[str]:
+        """Build, returning the baselines whose files were (re)written."""
+        for path in baselines.rglob("*.yaml"):
+            os.utime(path, ns=(0, 0))
+        build_all_baselines(
+            argparse.Namespace(os_name="macos", os_version=26.0, **kwargs)
+        )
+        capsys.readouterr()
+        return {
+            path.relative_to(baselines).as_posix()
+            for path in baselines.rglob("*.yaml")
+            if path.stat().st_mtime_ns
+        }
+
+    written = build()
+    assert "macos/cis_lvl1_macos_26.0.yaml" in written
+    assert build() == set()
+    assert build(force=True) == set()
+
+    (custom / "icloud_calendar_disable.yaml").write_text(
+        "id: icloud_calendar_disable\ntags:\n  - cis_lvl1\n"
+    )
+    assert build() == {"macos/cis_lvl1_macos_26.0.yaml"}
+    manifest = BaselineManifest.load(baselines)
+    assert "macos/cis_lvl1_macos_26.0.yaml" in manifest.dependents(
+        "icloud_calendar_disable"
+    )
+    assert set(manifest.names()) == written
@@ -0,0 +1,102 @@
+"""Tests for `ControlCoverage`.
+
+Covers:
+- the rule × control matrix and per-platform coverage match a set-based
+  computation over the same rules
+- control IDs are normalized and ordered naturally
+- `ControlCoverage.write`: CSV and JSON reports
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+
+import pytest
+
+from mscp.classes import ControlCoverage, Macsecurityrule
+from mscp.classes.rule_library import normalize_control_id
+from mscp.common_utils import config
+
+
+@pytest.fixture(scope="module")
+def rules() -> list[Macsecurityrule]:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return Macsecurityrule.collect_all_platform_rules(
+            {"ios": [26.0, 18.0], "visionos": [26.0]}
+        )
+
+
+@pytest.fixture(scope="module")
+def coverage(rules) -> ControlCoverage:
+    return ControlCoverage(rules)
+
+
+def _covered_by(rules, os_type, os_version) -> set[str]:
+    return {
+        normalize_control_id(control)
+        for rule in rules
+        if (rule.os_type, rule.os_version) == (os_type, os_version)
+        for control in rule.references.nist.nist_800_53r5 or []
+    }
+
+
+def test_matrix_matches_rule_references(coverage, rules):
+    assert coverage.matrix.shape == (len(rules), len(coverage.controls))
+    for row, rule in zip(coverage.matrix, rules):
+        assert {coverage.controls[i] for i in row.nonzero()[0]} == {
+            normalize_control_id(c) for c in rule.references.nist.nist_800_53r5 or []
+        }
+
+
+def test_missing_matches_set_computation(coverage, rules):
+    assert len(coverage.platforms) == 3
+    for os_type, os_version in coverage.platforms:
+        covered = _covered_by(rules, os_type, os_version)
+        for name, controls in coverage.baselines.items():
+            expected = {normalize_control_id(c) for c in controls} - covered
+            missing = coverage.missing(os_type, os_version, name)
+            assert set(missing) == expected
+            assert missing == [c for c in coverage.controls if c in expected]
+
+
+def test_summary_counts(coverage):
+    summary = coverage.summary()
+    assert len(summary) == len(coverage.platforms) * len(coverage.baselines)
+    assert (summary["covered"] + summary["missing"] == summary["required"]).all()
+    assert (summary["missing_controls"].str.len() == summary["missing"]).all()
+
+
+def test_rule_counts(coverage, rules):
+    counts = coverage.rule_counts()
+    assert list(counts["rule_id"]) == [rule.rule_id for rule in rules]
+    assert (counts["low"] <= counts["controls"]).all()
+
+
+def test_controls_are_normalized_and_ordered(rules):
+    coverage = ControlCoverage(rules[:0], {"low": ["AC-14", "ac-02(01)", "AC-2"]})
+    assert coverage.controls == ["AC-2", "AC-2(01)", "AC-14"]
+    assert coverage.platforms == []
+
+
+@pytest.mark.parametrize("output_format", ["csv", "json"])
+def test_write(coverage, tmp_path, output_format):
+    written = coverage.write(tmp_path, output_format)
+    summary = coverage.summary()
+
+    if output_format == "json":
+        assert [p.name for p in written] == ["coverage.json"]
+        data = json.loads(written[0].read_text())
+        assert len(data["summary"]) == len(summary)
+        assert len(data["rules"]) == len(coverage.rules)
+        assert data["summary"][0]["missing_controls"] == summary["missing_controls"][0]
+    else:
+        assert [p.name for p in written] == [
+            "coverage_summary.csv",
+            "coverage_rules.csv",
+        ]
+        with written[0].open() as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == len(summary)
+        assert rows[0]["missing_controls"] == ";".join(summary["missing_controls"][0])
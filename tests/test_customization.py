@@ -0,0 +1,93 @@
+"""Tests for the memoized customization override index.
+
+Covers:
+- `collect_overrides`: reuse within a process, invalidation on added and
+  edited override files
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from mscp.common_utils import config, customization
+from mscp.common_utils.customization import clear_override_cache, collect_overrides
+
+
+@pytest.fixture(autouse=True)
+def _fresh(monkeypatch):
+    monkeypatch.setitem(config, "rule_cache", False)
+    clear_override_cache()
+    yield
+    clear_override_cache()
+
+
+@pytest.fixture
+def overrides_dir(tmp_path):
+    (tmp_path / "os").mkdir()
+    (tmp_path / "os" / "os_one.yaml").write_text("id: os_one\ntags:\n  - extra\n")
+    return tmp_path
+
+
+def _count_loads(monkeypatch) -> list:
+    calls = []
+    real = customization.load_rule_file
+
+    def counting(path, *args, **kwargs):
+        calls.append(path)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(customization, "load_rule_file", counting)
+    return calls
+
+
+def test_reused_until_tree_changes(overrides_dir, monkeypatch):
+    calls = _count_loads(monkeypatch)
+    first = collect_overrides(overrides_dir)
+    assert collect_overrides(overrides_dir) is first
+    assert first == {"os_one": {"id": "os_one", "tags": ["extra"]}}
+    assert len(calls) == 1
+
+
+def test_new_file_invalidates(overrides_dir):
+    collect_overrides(overrides_dir)
+    (overrides_dir / "os" / "os_two.yaml").write_text("id: os_two\n")
+    assert set(collect_overrides(overrides_dir)) == {"os_one", "os_two"}
+
+
+def test_edited_file_invalidates(overrides_dir):
+    collect_overrides(overrides_dir)
+    path = overrides_dir / "os" / "os_one.yaml"
+    path.write_text("id: os_one\ntags:\n  - changed\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert collect_overrides(overrides_dir)["os_one"]["tags"] == ["changed"]
+
+
+def test_loading_rules_leaves_overrides_untouched(tmp_path, monkeypatch):
+    from mscp.classes import Macsecurityrule
+
+    rules_dir = tmp_path / "rules"
+    (rules_dir / "os").mkdir(parents=True)
+    (rules_dir / "os" / "os_airdrop_disable.yaml").write_text(
+        "id: os_airdrop_disable\n"
+        "references:\n"
+        "  nist:\n"
+        "    800-53r5:\n"
+        "      - AC-99\n"
+        "    cce:\n"
+        "      macos_26:\n"
+        "        - CCE-TEST\n"
+    )
+    monkeypatch.setitem(config["custom"], "rules_dir", str(rules_dir))
+    expected = {"800-53r5": ["AC-99"], "cce": {"macos_26": ["CCE-TEST"]}}
+
+    for _ in range(2):
+        (rule,) = Macsecurityrule.load_rules(
+            ["os_airdrop_disable"], "macos", 26.0, "default", "Test"
+        )
+        assert rule.references.nist.nist_800_53r5 == ["AC-99"]
+        assert rule.references.nist.cce == ["CCE-TEST"]
+        overrides = collect_overrides(rules_dir)
+        assert overrides["os_airdrop_disable"]["references"]["nist"] == expected
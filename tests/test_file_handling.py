@@ -0,0 +1,56 @@
+"""Tests for `open_yaml`.
+
+Covers:
+- parsing through the libyaml-backed loader
+- gettext catalogs loaded once per language
+"""
+
+from __future__ import annotations
+
+import yaml
+
+from mscp.common_utils import file_handling
+from mscp.common_utils.file_handling import YAML_LOADER, open_yaml
+
+
+def test_uses_libyaml_when_available():
+    if yaml.__with_libyaml__:
+        assert YAML_LOADER is yaml.CSafeLoader
+    else:
+        assert YAML_LOADER is yaml.SafeLoader
+
+
+def test_parses_like_safe_load(tmp_path):
+    text = (
+        "id: os_rule\n"
+        "title: Title\n"
+        "platforms:\n"
+        "  macOS:\n"
+        "    '26.0':\n"
+        "      benchmarks: [cis_lvl1]\n"
+        "odv:\n"
+        "  default: 5\n"
+    )
+    path = tmp_path / "os_rule.yaml"
+    path.write_text(text)
+    assert open_yaml(path, language="en") == yaml.safe_load(text)
+
+
+def test_translation_loaded_once_per_language(tmp_path, monkeypatch):
+    file_handling._get_translation.cache_clear()
+    calls: list[str] = []
+    real_translation = file_handling.gettext.translation
+
+    def counting_translation(*args, **kwargs):
+        calls.append(kwargs["languages"][0])
+        return real_translation(*args, **kwargs)
+
+    monkeypatch.setattr(file_handling.gettext, "translation", counting_translation)
+
+    path = tmp_path / "section.yaml"
+    path.write_text("name: Auditing\n")
+    for language in ("en", "en", "de", "en"):
+        open_yaml(path, language=language)
+
+    assert calls == ["en", "de"]
+    file_handling._get_translation.cache_clear()
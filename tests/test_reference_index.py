@@ -0,0 +1,76 @@
+"""Tests for `ReferenceIndex`.
+
+Covers:
+- exact lookups match a scan of every rule's references
+- 800-53 normalization (including zero-padded enhancements), family,
+  prefix and glob lookups
+- CIS benchmark sections and nested custom references
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from mscp.classes import Macsecurityrule, ReferenceIndex, RuleLibrary
+from mscp.common_utils import config
+
+
+@pytest.fixture(scope="module")
+def library() -> RuleLibrary:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return RuleLibrary(
+            Macsecurityrule.collect_all_platform_rules(
+                {"macos": [26.0], "ios": [26.0]}
+            )
+        )
+
+
+@pytest.fixture(scope="module")
+def index(library) -> ReferenceIndex:
+    return ReferenceIndex(library)
+
+
+def _scan(library, field) -> dict[str, set[tuple[str, str]]]:
+    found: dict[str, set[tuple[str, str]]] = {}
+    for rule in library:
+        for reference in rule.references.get_ref(field, default=[]):
+            found.setdefault(reference, set()).add((rule.rule_id, rule.os_type))
+    return found
+
+
+@pytest.mark.parametrize("field", ["cce", "nist_800_171r3", "cci", "srg", "disa_stig", "cmmc"])
+def test_lookup_matches_scan(library, index, field):
+    expected = _scan(library, field)
+    assert expected
+    for reference, rules in expected.items():
+        hits = [h for h in index.lookup(reference.lower()) if h.framework.endswith(field)]
+        assert {(h.rule_id, h.os_type) for h in hits} == rules
+
+
+def test_controls_are_normalized(index):
+    assert index.lookup("AC-2(1)")
+    assert index.lookup("ac-02(1)") == index.lookup("AC-2(1)")
+    assert index.lookup("AC-02(01)") == index.lookup("AC-2(1)")
+    assert index.family("ac-02") == index.family("AC-2")
+    assert "ac-2(1)" in index
+    assert "not-a-reference" not in index
+
+
+def test_family_and_globs(index):
+    family = {h.reference for h in index.family("AC-2")}
+    assert "AC-2" in family and "AC-2(1)" in family
+    assert not any(ref.startswith("AC-20") for ref in family)
+    assert {h.reference for h in index.find("AC-2(*)")} == family - {"AC-2"}
+
+    prefix = index.prefix("srg-os-0001")
+    assert prefix
+    assert all(h.reference.startswith("SRG-OS-0001") for h in prefix)
+    assert prefix == index.find("SRG-OS-0001*")
+
+
+def test_cis_sections_and_custom_references(index):
+    assert any(h.reference == "3.1 (level 1)" for h in index.lookup("3.1"))
+    assert any(
+        h.framework == "custom_refs.references.hhs.hicp" for h in index.lookup("3.L.C")
+    )
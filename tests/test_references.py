@@ -0,0 +1,116 @@
+"""Tests for `References.get_ref`.
+
+Covers:
+- cached namespaced and unqualified lookups match the submodels
+- returned values are copies, so mutating them leaves the cache intact
+- `flat_refs` lists every field under its namespaced key
+- the cache is dropped when namespaces are assigned or deleted, and by
+  `RuleLibrary` control mutations
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from mscp.classes import Macsecurityrule, RuleLibrary
+from mscp.classes.references import hhsReferences
+from mscp.common_utils import config
+
+
+@pytest.fixture(scope="module")
+def rules() -> list[Macsecurityrule]:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return Macsecurityrule.collect_platform_rules("macos", 26.0)
+
+
+@pytest.fixture
+def rule(rules) -> Macsecurityrule:
+    rule = next(r for r in rules if r.rule_id == "os_sudo_log_enforce")
+    return rule.model_copy(deep=True)
+
+
+def test_lookups_match_submodels(rules):
+    for rule in rules:
+        refs = rule.references
+        assert refs.get_ref("nist.cce") == refs.nist.cce
+        assert refs.get_ref("800-53r5") == [str(c) for c in refs.nist.nist_800_53r5 or []]
+        if refs.disa:
+            assert refs.get_ref("disa.cmmc") == refs.disa.cmmc
+            assert refs.get_ref("disa_stig") == [str(c) for c in refs.disa.disa_stig or []]
+        if refs.cis:
+            assert refs.get_ref("cis") == [str(c) for c in refs.cis.benchmark or []]
+
+
+def test_missing_keys(rule):
+    refs = rule.references
+    assert refs.get_ref("nope", default=None) is None
+    with pytest.raises(KeyError, match="not found in any namespace"):
+        refs.get_ref("nope")
+    with pytest.raises(KeyError, match="Field 'nope' not found in 'nist'"):
+        refs.get_ref("nist.nope")
+    with pytest.raises(KeyError, match="Namespace 'hhs' not present"):
+        refs.get_ref("hhs.hicp")
+    assert refs.get_ref("hicp", search_order=("hhs",), default=[]) == []
+
+
+def test_search_order(rule):
+    refs = rule.references
+    refs.disa.cci = ["CCI-000001"]
+    refs.clear_ref_cache()
+    assert refs.get_ref("cci") == ["CCI-000001"]
+    assert refs.get_ref("cci", search_order=("nist",), default=None) is None
+
+
+def test_assignment_clears_cache(rule):
+    refs = rule.references
+    assert refs.get_ref("hicp", search_order=("hhs",), default=None) is None
+
+    refs["hhs"] = hhsReferences(hicp=["1.M.A"])
+    assert refs.get_ref("hhs.hicp") == ["1.M.A"]
+
+    del refs.hhs
+    with pytest.raises(KeyError):
+        refs.get_ref("hhs.hicp")
+
+    refs.nist.cce = ["CCE-00000-0"]
+    refs.clear_ref_cache()
+    assert refs.get_ref("cce") == ["CCE-00000-0"]
+
+
+def test_library_control_mutations_clear_cache(rule):
+    rule.source_file = None
+    library = RuleLibrary([rule])
+    assert "ZZ-1" not in rule.references.get_ref("800-53r5")
+
+    library.add_nist_control("ZZ-1")
+    assert "ZZ-1" in rule.references.get_ref("800-53r5")
+
+    library.remove_nist_control("ZZ-1")
+    assert "ZZ-1" not in rule.references.get_ref("800-53r5")
+
+
+def test_returned_values_do_not_alias_cache(rule):
+    refs = rule.references
+    refs.get_ref("800-53r5").append("ZZ-1")
+    refs.get_ref("nist.nist_800_53r5").append("ZZ-2")
+    assert refs.get_ref("800-53r5") == [str(c) for c in refs.nist.nist_800_53r5 or []]
+    assert refs.get_ref("nist.nist_800_53r5") == refs.nist.nist_800_53r5
+
+
+def test_nested_custom_references_are_copied(rules):
+    refs = next(
+        r.references
+        for r in rules
+        if r.references.get_ref("custom_refs.references", default=None)
+    )
+    refs.get_ref("custom_refs.references")[0].clear()
+    assert refs.get_ref("custom_refs.references")[0]
+
+
+def test_flat_refs_match_namespaced_lookups(rule):
+    flat = rule.references.flat_refs()
+    assert flat["nist.nist_800_53r5"] == tuple(rule.references.nist.nist_800_53r5)
+    for key, value in flat.items():
+        expected = rule.references.get_ref(key)
+        assert (list(value) if isinstance(value, tuple) else value) == expected
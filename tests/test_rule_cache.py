@@ -0,0 +1,164 @@
+"""Tests for the persistent parsed-rule cache.
+
+Covers:
+- `load_rule_file`: cold parse, warm hit, mtime-only change, content change
+- `load_rule_files`: batch loading, serial and through a forked worker
+  pool
+- `save_rule_cache`: round-trip through the on-disk store
+- ``config["rule_cache"] = False`` bypasses the cache
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mscp.common_utils import config, rule_cache
+from mscp.common_utils.rule_cache import (
+    clear_rule_cache,
+    load_rule_file,
+    load_rule_files,
+    save_rule_cache,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the rule cache at a temp dir and reset its in-memory state."""
+    monkeypatch.setitem(config["custom"], "cache_dir", str(tmp_path / "cache"))
+    clear_rule_cache()
+    yield tmp_path / "cache"
+    clear_rule_cache()
+
+
+@pytest.fixture
+def rule_file(tmp_path) -> Path:
+    path = tmp_path / "os_test_rule.yaml"
+    path.write_text("id: os_test_rule\ntitle: First\ntags:\n  - one\n")
+    return path
+
+
+def _parse_count(monkeypatch) -> list[Path]:
+    calls: list[Path] = []
+    real_open_file = rule_cache.open_file
+
+    def counting_open_file(file_path, language="en"):
+        calls.append(file_path)
+        return real_open_file(file_path, language)
+
+    monkeypatch.setattr(rule_cache, "open_file", counting_open_file)
+    return calls
+
+
+class TestLoadRuleFile:
+    def test_warm_hit_skips_parse(self, cache_dir, rule_file, monkeypatch):
+        calls = _parse_count(monkeypatch)
+        first = load_rule_file(rule_file)
+        second = load_rule_file(rule_file)
+        assert first == second == {
+            "id": "os_test_rule",
+            "title": "First",
+            "tags": ["one"],
+        }
+        assert len(calls) == 1
+
+    def test_returns_independent_copies(self, cache_dir, rule_file):
+        load_rule_file(rule_file)["tags"].append("mutated")
+        assert load_rule_file(rule_file)["tags"] == ["one"]
+
+    def test_touched_file_reuses_entry(self, cache_dir, rule_file, monkeypatch):
+        calls = _parse_count(monkeypatch)
+        load_rule_file(rule_file)
+        stat = rule_file.stat()
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        load_rule_file(rule_file)
+        assert len(calls) == 1
+
+    def test_changed_file_is_reparsed(self, cache_dir, rule_file):
+        load_rule_file(rule_file)
+        rule_file.write_text("id: os_test_rule\ntitle: Second title\n")
+        assert load_rule_file(rule_file)["title"] == "Second title"
+
+    def test_store_persists_across_processes(self, cache_dir, rule_file, monkeypatch):
+        load_rule_file(rule_file)
+        save_rule_cache()
+        assert (cache_dir / "rules.pickle").is_file()
+
+        # simulate a fresh process by dropping the in-memory store only
+        monkeypatch.setattr(rule_cache, "_store", None)
+        calls = _parse_count(monkeypatch)
+        assert load_rule_file(rule_file)["title"] == "First"
+        assert calls == []
+
+    def test_failed_write_leaves_no_temp_file(
+        self, cache_dir, rule_file, monkeypatch
+    ):
+        load_rule_file(rule_file)
+
+        def fail_replace(src, dst):
+            raise OSError("read-only")
+
+        monkeypatch.setattr(rule_cache.os, "replace", fail_replace)
+        save_rule_cache()
+        assert list(cache_dir.iterdir()) == []
+
+    def test_disabled_cache_always_parses(self, cache_dir, rule_file, monkeypatch):
+        monkeypatch.setitem(config, "rule_cache", False)
+        calls = _parse_count(monkeypatch)
+        load_rule_file(rule_file)
+        load_rule_file(rule_file)
+        save_rule_cache()
+        assert len(calls) == 2
+        assert not (cache_dir / "rules.pickle").exists()
+
+
+class TestLoadRuleFiles:
+    @pytest.fixture
+    def rule_files(self, tmp_path) -> list[Path]:
+        paths = []
+        for n in range(rule_cache.MIN_PARALLEL_FILES + 4):
+            path = tmp_path / f"os_rule_{n:03}.yaml"
+            path.write_text(f"id: os_rule_{n:03}\ntitle: Rule {n}\n")
+            paths.append(path)
+        return paths
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_matches_single_file_loads(self, cache_dir, rule_files, jobs):
+        documents = load_rule_files(rule_files, jobs=jobs)
+        assert list(documents) == rule_files
+        clear_rule_cache()
+        assert documents == {path: load_rule_file(path) for path in rule_files}
+
+    def test_forked_pool_matches_serial_parse(
+        self, cache_dir, rule_files, monkeypatch
+    ):
+        monkeypatch.setitem(config, "rule_cache", False)
+        contexts = []
+        real_executor = rule_cache.ProcessPoolExecutor
+
+        def recording_executor(*args, **kwargs):
+            contexts.append(kwargs.get("mp_context"))
+            return real_executor(*args, **kwargs)
+
+        monkeypatch.setattr(rule_cache, "ProcessPoolExecutor", recording_executor)
+        pooled = load_rule_files(rule_files, jobs=2)
+        serial = load_rule_files(rule_files, jobs=1)
+
+        assert [ctx.get_start_method() for ctx in contexts] == ["fork"]
+        assert list(pooled) == rule_files
+        assert pooled == serial
+
+    def test_pool_results_are_cached(self, cache_dir, rule_files, monkeypatch):
+        load_rule_files(rule_files, jobs=2)
+        calls = _parse_count(monkeypatch)
+        load_rule_files(rule_files, jobs=2)
+        assert calls == []
+
+    def test_disabled_cache_still_loads(self, cache_dir, rule_files, monkeypatch):
+        monkeypatch.setitem(config, "rule_cache", False)
+        documents = load_rule_files(rule_files, jobs=2)
+        assert documents[rule_files[0]]["title"] == "Rule 0"
+        save_rule_cache()
+        assert not (cache_dir / "rules.pickle").exists()
@@ -0,0 +1,139 @@
+"""Tests for the SQLite rule catalog.
+
+Covers:
+- `write_catalog` / `load_catalog`: rules, source files and ``$ODV``
+  plans survive the round trip; platform / version filters
+- the catalog tables answer tag, benchmark and reference lookups like
+  the in-memory indexes
+- catalogs with another schema version are rejected
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from mscp.classes import (
+    Macsecurityrule,
+    ReferenceIndex,
+    RuleLibrary,
+    load_catalog,
+    write_catalog,
+)
+from mscp.common_utils import config
+
+
+@pytest.fixture(scope="module")
+def library() -> RuleLibrary:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return RuleLibrary(
+            Macsecurityrule.collect_all_platform_rules(
+                {"macos": [26.0], "ios": [26.0]}
+            )
+        )
+
+
+@pytest.fixture(scope="module")
+def catalog(library, tmp_path_factory):
+    return write_catalog(library, tmp_path_factory.mktemp("catalog") / "rules.sqlite")
+
+
+def _rule_ids(connection: sqlite3.Connection, query: str, *params) -> list[tuple]:
+    return connection.execute(
+        "SELECT DISTINCT r.rule_id, r.os_type, r.os_version FROM rules r "
+        f"{query} ORDER BY r.row",
+        params,
+    ).fetchall()
+
+
+class TestRoundTrip:
+    def test_rules_match(self, library, catalog):
+        loaded = RuleLibrary.from_catalog(catalog)
+        assert [r.model_dump_json() for r in loaded] == [
+            r.model_dump_json() for r in library
+        ]
+        assert [r.source_file for r in loaded] == [r.source_file for r in library]
+
+    def test_odv_resolution(self, library, catalog):
+        loaded = load_catalog(catalog)
+        rules = [(old, new) for old, new in zip(library, loaded) if old.odv]
+        assert rules
+        for old, new in rules:
+            for benchmark in old.odv:
+                assert (
+                    old.resolve_odv(benchmark).check == new.resolve_odv(benchmark).check
+                )
+        assert any(new.odv_plan_data() for _, new in rules)
+        assert [new.odv_plan_data() for _, new in rules] == [
+            old.odv_plan_data() for old, _ in rules
+        ]
+
+    def test_filters(self, library, catalog):
+        loaded = load_catalog(catalog, platform="iOS", os_version=26)
+        expected = library.by_platform("ios").by_os(os_version=26.0)
+        assert [r.uuid for r in loaded] == [r.uuid for r in expected]
+
+
+class TestTables:
+    @pytest.fixture
+    def connection(self, catalog):
+        connection = sqlite3.connect(catalog)
+        yield connection
+        connection.close()
+
+    @staticmethod
+    def _keys(rules) -> list[tuple]:
+        return [(r.rule_id, r.os_type, r.os_version) for r in rules]
+
+    def test_tags_and_benchmarks(self, library, connection):
+        assert _rule_ids(
+            connection, "JOIN tags t ON t.rule = r.row WHERE t.tag = ?", "cis_lvl1"
+        ) == self._keys(library.by_tag("cis_lvl1"))
+        assert _rule_ids(
+            connection,
+            "JOIN benchmarks b ON b.rule = r.row WHERE b.benchmark = ?",
+            "disa_stig",
+        ) == self._keys(library.by_benchmark("disa_stig"))
+
+    def test_references(self, library, connection):
+        index = ReferenceIndex(library)
+        for identifier in ("AC-2(1)", "CCI-000765", "SRG-OS-000480-GPOS-00227"):
+            hits = index.lookup(identifier)
+            assert hits
+            rows = _rule_ids(
+                connection, "JOIN refs f ON f.rule = r.row WHERE f.key = ?", identifier
+            )
+            assert sorted(rows) == sorted(
+                {(h.rule_id, h.os_type, h.os_version) for h in hits}
+            )
+
+    def test_payload_keys(self, library, connection):
+        expected = {
+            (r.rule_id, r.os_type, r.os_version)
+            for r in library
+            for payload in r.mobileconfig_info or []
+            for content in payload.payload_content
+            if "allowCamera" in content
+        }
+        assert expected
+        assert set(
+            _rule_ids(
+                connection,
+                "JOIN payload_keys p ON p.rule = r.row WHERE p.key = ?",
+                "allowCamera",
+            )
+        ) == expected
+
+
+def test_rejects_other_schema_versions(catalog, tmp_path):
+    copy = tmp_path / "old.sqlite"
+    copy.write_bytes(catalog.read_bytes())
+    with sqlite3.connect(copy) as connection:
+        connection.execute(
+            "UPDATE catalog_info SET value = '0' WHERE key = 'schema_version'"
+        )
+    connection.close()
+    with pytest.raises(ValueError, match="schema version 0"):
+        load_catalog(copy)
@@ -0,0 +1,70 @@
+"""Tests for cross-version rule diffs.
+
+Covers:
+- `RuleLibrary.diff`: added / removed rules match the rule ID sets and
+  every common rule is either changed or unchanged
+- `diff_rules`: only the fields that differ are reported
+- JSON and Markdown rendering
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from mscp.classes import Macsecurityrule, RuleLibrary, diff_rules
+from mscp.common_utils import config
+
+
+@pytest.fixture(scope="module")
+def library() -> RuleLibrary:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return RuleLibrary(
+            Macsecurityrule.collect_all_platform_rules({"macos": [26.0, 15.0]})
+        )
+
+
+def test_added_and_removed(library):
+    diff = library.diff(("macOS", 15.0), ("macos", 26.0))
+    old = {r.rule_id for r in library.by_os(os_version=15.0)}
+    new = {r.rule_id for r in library.by_os(os_version=26.0)}
+
+    assert (diff.source, diff.target) == ("macOS 15.0", "macOS 26.0")
+    assert set(diff.added) == new - old
+    assert set(diff.removed) == old - new
+    assert len(diff.changed) + diff.unchanged == len(old & new)
+
+
+def test_only_changed_fields_reported(library):
+    rules = list(library.by_os(os_version=26.0))
+    edited = [rule.model_copy() for rule in rules]
+    edited[0].check = "/usr/bin/true"
+    edited[1].tags = [*edited[1].tags, "diff_test"]
+
+    diff = diff_rules(rules, edited)
+    assert diff.unchanged == len(rules) - 2
+    assert [(c.field, c.new) for c in diff.changed[rules[0].rule_id]] == [
+        ("check", "/usr/bin/true")
+    ]
+    (change,) = diff.changed[rules[1].rule_id]
+    assert change.to_dict()["added"] == ["diff_test"]
+    assert change.to_dict()["removed"] == []
+
+
+def test_rendering(library):
+    diff = library.diff(("macos", 15.0), ("macos", 26.0))
+    data = json.loads(json.dumps(diff.to_dict()))
+    assert data["summary"]["changed"] == len(diff.changed)
+    assert [entry["rule_id"] for entry in data["added"]] == list(diff.added)
+
+    markdown = diff.to_markdown()
+    assert markdown.startswith("# macOS 15.0 → macOS 26.0\n")
+    for rule_id in [*diff.added, *diff.removed, *diff.changed]:
+        assert f"`{rule_id}`" in markdown
+
+
+def test_missing_side(library):
+    with pytest.raises(ValueError, match="no rules loaded for ios 26.0"):
+        library.diff(("macos", 15.0), ("ios", 26.0))
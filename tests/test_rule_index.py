@@ -0,0 +1,84 @@
+"""Tests for the rule / section file index.
+
+Covers:
+- `get_file_index`: precedence across directories and suffixes
+- revalidation when files are added under an indexed directory
+- `find_file_by_id`: fallback lookup by the ``id:`` field
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mscp.common_utils.rule_index import (
+    YAML_SUFFIXES,
+    clear_file_indexes,
+    find_file,
+    find_file_by_id,
+    get_file_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    clear_file_indexes()
+    yield
+    clear_file_indexes()
+
+
+@pytest.fixture
+def trees(tmp_path) -> tuple[Path, Path]:
+    bundled = tmp_path / "bundled"
+    custom = tmp_path / "custom"
+    (bundled / "os").mkdir(parents=True)
+    (bundled / "audit").mkdir()
+    custom.mkdir()
+
+    (bundled / "os" / "os_one.yaml").write_text("id: os_one\n")
+    (bundled / "os" / "os_one.json").write_text('{"id": "os_one"}')
+    (bundled / "audit" / "audit_two.yml").write_text("id: audit_two\n")
+    (bundled / "os" / "notes.txt").write_text("ignored")
+    (custom / "os_one.yaml").write_text("tags: [custom]\n")
+    (custom / "custom_three.json").write_text('{"id": "custom_three"}')
+    return bundled, custom
+
+
+class TestGetFileIndex:
+    def test_indexes_nested_files(self, trees):
+        bundled, custom = trees
+        index = get_file_index([bundled, custom])
+        assert set(index) == {"os_one", "audit_two", "custom_three"}
+
+    def test_earlier_directory_wins(self, trees):
+        bundled, custom = trees
+        assert find_file("os_one", [bundled, custom]) == bundled / "os" / "os_one.yaml"
+        assert find_file("os_one", [custom, bundled]) == custom / "os_one.yaml"
+
+    def test_yaml_preferred_over_json(self, trees):
+        bundled, _ = trees
+        assert get_file_index([bundled])["os_one"].suffix == ".yaml"
+
+    def test_suffix_filter(self, trees):
+        bundled, custom = trees
+        assert find_file("custom_three", [bundled, custom], YAML_SUFFIXES) is None
+
+    def test_missing_directory_tolerated(self, tmp_path):
+        assert get_file_index([tmp_path / "missing"]) == {}
+
+    def test_new_file_invalidates_index(self, trees):
+        bundled, custom = trees
+        assert find_file("os_new", [bundled, custom]) is None
+        (bundled / "os" / "os_new.yaml").write_text("id: os_new\n")
+        assert find_file("os_new", [bundled, custom]) == bundled / "os" / "os_new.yaml"
+
+
+class TestFindFileById:
+    def test_matches_id_field(self, tmp_path, monkeypatch):
+        from mscp.common_utils import config
+
+        monkeypatch.setitem(config, "rule_cache", False)
+        (tmp_path / "renamed.yaml").write_text("id: os_actual_id\n")
+        assert find_file_by_id("os_actual_id", [tmp_path]) == tmp_path / "renamed.yaml"
+        assert find_file_by_id("os_other", [tmp_path]) is None
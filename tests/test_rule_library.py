@@ -0,0 +1,343 @@
+"""Tests for `RuleLibrary` and multi-platform rule loading.
+
+Covers:
+- `Macsecurityrule.collect_all_platform_rules`: same rules, in the same
+  order, as one `collect_platform_rules` call per platform
+- `collect_platform_headers` / `from_headers`: two-phase loading builds
+  the same rules as filtering fully built ones
+- `Macsecurityrule.resolve_odv`: per-benchmark ``$ODV`` resolution from
+  the templates recorded at load time
+- `RuleLibrary` filters: indexed results match a scan of the rules, and
+  indexes are rebuilt after mutations
+- `RuleLibrary.transaction`: one atomic write per source file, same
+  result as unbatched mutations, nothing written on error
+- `RuleLibrary.refresh`: only changed, added and removed rules are
+  reloaded, and the result matches a fresh `from_rules_dir` load
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from mscp.classes import Macsecurityrule, RuleLibrary, rule_library
+from mscp.common_utils import config, mscp_data
+from mscp.generate.baseline import (
+    collect_established_benchmarks,
+    collect_tags_and_benchmarks,
+    rule_has_benchmark_for_version,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_rule_cache(monkeypatch):
+    monkeypatch.setitem(config, "rule_cache", False)
+
+
+def _fingerprint(rules: list[Macsecurityrule]) -> list[str]:
+    return [rule.model_dump_json(exclude={"uuid"}) for rule in rules]
+
+
+class TestCollectAllPlatformRules:
+    def test_matches_per_platform_loading(self):
+        platforms = {"ios": [26.0, 18.0], "visionos": [26.0]}
+        expected = [
+            rule
+            for os_type, versions in platforms.items()
+            for os_version in versions
+            for rule in Macsecurityrule.collect_platform_rules(os_type, os_version)
+        ]
+        combined = Macsecurityrule.collect_all_platform_rules(platforms)
+        assert expected
+        assert _fingerprint(combined) == _fingerprint(expected)
+
+    def test_platform_rules_do_not_share_state(self):
+        rules = Macsecurityrule.collect_all_platform_rules(
+            {"ios": [26.0], "visionos": [26.0]}
+        )
+        ios = {r.rule_id: r for r in rules if r.os_type.lower() == "ios"}
+        vision = {r.rule_id: r for r in rules if r.os_type.lower() == "visionos"}
+        shared = ios.keys() & vision.keys()
+        assert shared
+        for rule_id in shared:
+            assert ios[rule_id].platforms is not vision[rule_id].platforms
+
+
+class TestRuleHeaders:
+    def test_headers_match_full_rules(self):
+        rules = Macsecurityrule.collect_platform_rules("macos", 26.0)
+        headers = Macsecurityrule.collect_platform_headers("macos", 26.0)
+        assert [h.rule_id for h in headers] == [r.rule_id for r in rules]
+        assert collect_tags_and_benchmarks(headers) == collect_tags_and_benchmarks(
+            rules
+        )
+        assert collect_established_benchmarks(
+            headers
+        ) == collect_established_benchmarks(rules)
+
+    def test_from_headers_builds_only_matches(self):
+        def matches(rule) -> bool:
+            return rule_has_benchmark_for_version(rule, "cis_lvl1", "macos", "26.0")
+
+        rules = Macsecurityrule.collect_platform_rules(
+            "macos", 26.0, parent_values="cis_lvl1"
+        )
+        headers = Macsecurityrule.collect_platform_headers("macos", 26.0)
+        built = Macsecurityrule.from_headers(
+            [h for h in headers if matches(h)],
+            "macos",
+            26.0,
+            parent_values="cis_lvl1",
+        )
+        assert built
+        assert _fingerprint(built) == _fingerprint([r for r in rules if matches(r)])
+
+        # the headers keep their documents, so they can be built again
+        rebuilt = Macsecurityrule.from_headers(
+            [h for h in headers if matches(h)],
+            "macos",
+            26.0,
+            parent_values="cis_lvl1",
+        )
+        assert _fingerprint(rebuilt) == _fingerprint(built)
+
+
+class TestResolveOdv:
+    @pytest.fixture
+    def rule(self) -> Macsecurityrule:
+        (rule,) = Macsecurityrule.load_rules(
+            ["audit_retention_configure"], "macos", 26.0, "default", "Auditing"
+        )
+        return rule
+
+    def test_load_fills_recommended(self, rule):
+        assert rule.title == "Configure Audit Retention to 7d"
+        assert "expire-after:7d" in rule.fix
+
+    def test_resolves_each_benchmark(self, rule):
+        view = rule.resolve_odv("cis_lvl1")
+        assert view.title == "Configure Audit Retention to 60d OR 5G"
+        assert view["discussion"].count("60d OR 5G") == 1
+        assert "expire-after:60d OR 5G" in view.fix
+        assert rule.resolve_odv("nlmapgov_base").title.endswith("180d")
+
+    def test_leaves_rule_untouched(self, rule):
+        before = rule.model_dump_json()
+        view = rule.resolve_odv("cis_lvl1")
+        assert view.rule_id == rule.rule_id
+        assert view.references is rule.references
+        assert rule.model_dump_json() == before
+
+    def test_fill_matches_view(self, rule):
+        expected = rule.resolve_odv("cis_lvl1")
+        rule._fill_in_odv("cis_lvl1")
+        assert rule.title == expected.title
+        assert rule.platforms == expected.platforms
+        assert rule.resolve_odv("recommended").title.endswith("7d")
+
+    def test_reassigned_field_is_kept(self, rule):
+        rule.title = "Retention set by STIG"
+        assert rule.resolve_odv("cis_lvl1").title == "Retention set by STIG"
+
+
+@pytest.fixture(scope="module")
+def library() -> RuleLibrary:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return RuleLibrary(
+            Macsecurityrule.collect_all_platform_rules(
+                {"ios": [26.0, 18.0], "visionos": [26.0]}
+            )
+        )
+
+
+class TestRuleLibraryIndexes:
+    def test_filters_match_scans(self, library):
+        def ids(rules) -> list[tuple]:
+            return [(r.rule_id, r.os_type, r.os_version) for r in rules]
+
+        assert ids(library.by_tag("cmmc_lvl2")) == ids(
+            r for r in library if "cmmc_lvl2" in r.tags
+        )
+        assert ids(library.by_platform("iOS").by_os(os_version=18.0)) == ids(
+            r
+            for r in library
+            if r.os_type.lower() == "ios" and r.os_version == 18.0
+        )
+        assert ids(library.by_mechanism("configuration profile").has_odv()) == ids(
+            r
+            for r in library
+            if r.mechanism == "Configuration Profile" and r.odv is not None
+        )
+        assert ids(library.by_nist_control("cm-07(1)")) == ids(
+            r
+            for r in library
+            if "CM-7(1)" in (r.references.nist.nist_800_53r5 or [])
+        )
+        assert library.by_nist_control("CM-7(1)")
+
+    def test_derived_libraries_share_index(self, library):
+        child = library.by_platform("ios").by_benchmark("cis_lvl1_byod")
+        assert child._shared is library._shared
+        assert child
+        assert all(r.os_type.lower() == "ios" for r in child)
+
+    def test_unknown_benchmark_lists_available(self, library):
+        with pytest.raises(ValueError, match="cis_lvl1_byod") as excinfo:
+            library.by_platform("visionos").by_benchmark("cis_lvl1_byod")
+        assert "disa_stig" not in str(excinfo.value).split("Available:")[0]
+
+    def test_mutation_rebuilds_index(self, tmp_path):
+        (rule,) = Macsecurityrule.load_rules(
+            ["audit_retention_configure"], "macos", 26.0, "default", "Auditing"
+        )
+        rule.source_file = Path(shutil.copy(rule.source_file, tmp_path))
+        library = RuleLibrary([rule])
+
+        assert not library.by_tag("indexed_tag")
+        library.add_tag("indexed_tag")
+        assert library.by_tag("indexed_tag").rules == ["audit_retention_configure"]
+        library.by_tag("indexed_tag").remove_tag("indexed_tag")
+        assert not library.by_tag("indexed_tag")
+
+
+class TestTransaction:
+    RULE_IDS = ["audit_retention_configure", "os_gatekeeper_enable"]
+
+    @pytest.fixture
+    def make_library(self, tmp_path):
+        def make(folder: str) -> RuleLibrary:
+            (tmp_path / folder).mkdir()
+            rules = Macsecurityrule.load_rules(
+                self.RULE_IDS, "macos", 26.0, "default", "Auditing"
+            )
+            for rule in rules:
+                copy = shutil.copy(rule.source_file, tmp_path / folder)
+                rule.source_file = Path(copy)
+            return RuleLibrary(rules)
+
+        return make
+
+    @staticmethod
+    def _mutate(library: RuleLibrary) -> None:
+        library.add_tag("batched").remove_tag("800-53r5_low")
+        library.add_nist_control("AC-99").remove_nist_control("AU-9")
+        library.add_benchmark("batched_benchmark", "low")
+
+    @staticmethod
+    def _texts(library: RuleLibrary) -> list[str]:
+        return [r.source_file.read_text() for r in library]
+
+    def test_matches_unbatched_mutations(self, make_library, monkeypatch):
+        plain, batched = make_library("plain"), make_library("batched")
+        self._mutate(plain)
+
+        writes = []
+        real_write = rule_library._write_text_atomic
+        monkeypatch.setattr(
+            rule_library,
+            "_write_text_atomic",
+            lambda path, text: writes.append(path) or real_write(path, text),
+        )
+        before = self._texts(batched)
+        with batched.transaction():
+            self._mutate(batched)
+            assert self._texts(batched) == before
+
+        assert self._texts(batched) == self._texts(plain) != before
+        assert sorted(writes) == sorted(r.source_file for r in batched)
+        assert not list(batched[0].source_file.parent.glob("*.tmp"))
+
+    def test_derived_libraries_join_transaction(self, make_library):
+        library = make_library("derived")
+        with library.transaction():
+            library.by_tag("800-53r5_low").add_tag("derived_tag")
+            assert "derived_tag" not in library[0].source_file.read_text()
+        assert "  - derived_tag\n" in library[0].source_file.read_text()
+
+    def test_error_discards_writes(self, make_library):
+        library = make_library("failed")
+        before = self._texts(library)
+        with pytest.raises(RuntimeError):
+            with library.transaction():
+                library.add_tag("never_written")
+                raise RuntimeError("abort")
+        assert self._texts(library) == before
+        library.add_tag("written")
+        assert "  - written\n" in library[0].source_file.read_text()
+
+
+class TestRefresh:
+    @pytest.fixture
+    def rules_dir(self, tmp_path, monkeypatch) -> Path:
+        rules_dir = Path(shutil.copytree(config["rules_dir"], tmp_path / "rules"))
+        custom_dir = tmp_path / "custom"
+        (custom_dir / "rules").mkdir(parents=True)
+        monkeypatch.setitem(config, "rules_dir", str(rules_dir))
+        monkeypatch.setitem(config, "custom_dir", str(custom_dir))
+        monkeypatch.setitem(config["custom"], "rules_dir", str(custom_dir / "rules"))
+        platforms = mscp_data["versions"]["platforms"]
+        monkeypatch.setitem(
+            mscp_data["versions"],
+            "platforms",
+            {
+                os_type: [v for v in platforms[os_type] if v["os_version"] == 26.0]
+                for os_type in ("ios", "visionos")
+            },
+        )
+        return rules_dir
+
+    @staticmethod
+    def _assert_fresh(library: RuleLibrary) -> None:
+        fresh = RuleLibrary.from_rules_dir()
+        assert _fingerprint(library) == _fingerprint(fresh)
+        for field in ("id", "tag", "control"):
+            assert library._shared.keys(field) == fresh._shared.keys(field)
+
+    def test_edits_and_overrides(self, rules_dir):
+        library = RuleLibrary.from_rules_dir()
+        rule_file = next(rules_dir.rglob("os_airdrop_disable.yaml"))
+        assert len(library.by_tag("refreshed")) == 0
+
+        rule_file.touch()
+        assert library.refresh() == []
+
+        rule_file.write_text(
+            rule_file.read_text().replace("tags:\n", "tags:\n  - refreshed\n", 1)
+        )
+        rows = library._shared.rules
+        assert library.refresh() == ["os_airdrop_disable"]
+        assert library._shared.rules is rows
+        assert [r.rule_id for r in library.by_tag("refreshed")] == [
+            "os_airdrop_disable",
+            "os_airdrop_disable",
+        ]
+        self._assert_fresh(library)
+
+        override = Path(config["custom"]["rules_dir"], "os_airdrop_disable.yaml")
+        override.write_text("id: os_airdrop_disable\ntitle: Overridden\n")
+        assert library.refresh() == ["os_airdrop_disable"]
+        assert library.by_platform("ios")["os_airdrop_disable"].title == "Overridden"
+        self._assert_fresh(library)
+
+    def test_added_and_removed_rules(self, rules_dir):
+        library = RuleLibrary.from_rules_dir()
+        count = len(library)
+        source = next(rules_dir.rglob("os_airdrop_disable.yaml"))
+        shutil.copy(source, source.with_name("os_zz_refresh_added.yaml"))
+        next(rules_dir.rglob("os_camera_disable.yaml")).unlink()
+
+        assert library.refresh() == ["os_camera_disable", "os_zz_refresh_added"]
+        assert len(library) == count
+        assert "os_camera_disable" not in library
+        self._assert_fresh(library)
+
+    def test_requires_source_and_no_transaction(self, rules_dir):
+        with pytest.raises(ValueError):
+            RuleLibrary([]).refresh()
+        library = RuleLibrary.from_rules_dir()
+        with pytest.raises(RuntimeError):
+            with library.transaction():
+                library.refresh()
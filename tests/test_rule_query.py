@@ -0,0 +1,104 @@
+"""Tests for `RuleLibrary.query` and the query compiler.
+
+Covers:
+- `compile_query`: operator precedence, quoting, memoized plans, errors
+- `RuleLibrary.query`: results match the equivalent chained filters and
+  keep library order
+"""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from mscp.classes import Macsecurityrule, RuleLibrary
+from mscp.classes.rule_query import _And, _Not, _Or, _Term, compile_query
+from mscp.common_utils import config
+
+
+@pytest.fixture(scope="module")
+def library() -> RuleLibrary:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return RuleLibrary(
+            Macsecurityrule.collect_all_platform_rules(
+                {"ios": [26.0, 18.0], "visionos": [26.0]}
+            )
+        )
+
+
+class TestCompileQuery:
+    def test_precedence(self):
+        plan = compile_query("tag:a | !tag:b & platform:iOS")
+        assert plan.root == _Or(
+            (
+                _Term("tag", "a", False),
+                _And((_Not(_Term("tag", "b", False)), _Term("platform", "ios", False))),
+            )
+        )
+
+    def test_values(self):
+        plan = compile_query(
+            '(control:ac-02(1) | control:"SC-7 (10)") & version:18 & id:os_*'
+        )
+        (either, version, rule_id) = plan.root.operands
+        assert either.operands[0] == _Term("control", "AC-2(1)", False)
+        assert either.operands[1].key == "SC-7 (10)"
+        assert version == _Term("os_version", 18.0, False)
+        assert rule_id == _Term("id", "os_*", True)
+
+    def test_plans_are_memoized(self):
+        assert compile_query("tag:a & tag:b") is compile_query("tag:a & tag:b")
+
+    @pytest.mark.parametrize(
+        "expression, message",
+        [
+            ("", "empty query"),
+            ("tag:a &", "unexpected end"),
+            ("(tag:a", "missing ')'"),
+            ("tag:a )", "unexpected ')'"),
+            ("colour:red", "unknown field"),
+            ("has:profile", "unknown has: value"),
+            ("version:*", "does not support wildcards"),
+            ("tag", "expected a field:value term"),
+        ],
+    )
+    def test_errors(self, expression, message):
+        with pytest.raises(ValueError, match=re.escape(message)):
+            compile_query(expression)
+
+
+class TestRuleLibraryQuery:
+    def test_matches_chained_filters(self, library):
+        result = library.query(
+            "platform:ios & version:26 & benchmark:cis_lvl1_byod & has:mobileconfig"
+        )
+        expected = (
+            library.by_platform("ios")
+            .by_os(os_version=26.0)
+            .by_benchmark("cis_lvl1_byod")
+            .has_mobileconfig()
+        )
+        assert result
+        assert list(result) == list(expected)
+
+    def test_negation_and_globs(self, library):
+        result = library.query("platform:visionos & !control:CM-7* & id:os_*")
+        expected = [
+            r
+            for r in library.by_platform("visionos")
+            if r.rule_id.startswith("os_")
+            and not any(
+                c.startswith("CM-7") for c in r.references.nist.nist_800_53r5 or []
+            )
+        ]
+        assert result
+        assert list(result) == expected
+
+    def test_query_on_filtered_library(self, library):
+        ios = library.by_platform("ios")
+        assert list(ios.query("!has:odv")) == [r for r in ios if r.odv is None]
+
+    def test_unknown_values_match_nothing(self, library):
+        assert len(library.query("benchmark:not_a_benchmark")) == 0
@@ -0,0 +1,79 @@
+"""Tests for `RuleRecord` and the rendering paths that use it.
+
+Covers:
+- records carry the same values as ``model_dump()`` minus the
+  multi-platform fields
+- records are immutable and share repeated strings within one pool
+- `Baseline.to_dataframe` / `Baseline.to_template_dict` build on records
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from mscp.classes import Baseline, Macsecurityrule, RuleRecord
+from mscp.common_utils import config
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+def rules() -> list[Macsecurityrule]:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(config, "rule_cache", False)
+        return Macsecurityrule.collect_platform_rules("macos", 26.0)
+
+
+def test_matches_model_dump(rules):
+    for rule in rules:
+        record = RuleRecord.from_rule(rule).to_dict()
+        dumped = rule.model_dump()
+        for omitted in ("uuid", "platforms", "source_file"):
+            dumped.pop(omitted, None)
+        assert record.pop("benchmarks") == rule.benchmark_names()
+        assert record == dumped
+
+
+def test_records_are_immutable(rules):
+    record = RuleRecord.from_rule(rules[0])
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.title = "changed"
+    assert not hasattr(record, "__dict__")
+    assert record.get("missing", "default") == "default"
+
+
+def test_repeated_strings_are_shared(rules):
+    rule = rules[0]
+    copy = rule.model_copy(deep=True)
+    pool: dict[str, str] = {}
+    first = RuleRecord.from_rule(rule, pool)
+    second = RuleRecord.from_rule(copy, pool)
+    assert first.discussion is second.discussion
+    assert first.check is second.check
+    assert all(a is b for a, b in zip(first.tags, second.tags))
+
+    unpooled = RuleRecord.from_rule(copy)
+    assert unpooled.discussion is copy.discussion
+    assert unpooled == first
+
+
+def test_baseline_uses_records(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    monkeypatch.setitem(config, "rule_cache", False)
+    baseline = Baseline.from_yaml(Path("baselines/macos/cis_lvl1_macos_26.0.yaml"))
+
+    context = baseline.to_template_dict()
+    assert [p["section"] for p in context["profile"]] == [
+        p.section for p in baseline.profile
+    ]
+    first = context["profile"][0]["rules"][0]
+    assert isinstance(first, RuleRecord)
+    assert first.rule_id == baseline.profile[0].rules[0].rule_id
+
+    dataframe = baseline.to_dataframe()
+    assert len(dataframe) == sum(len(p.rules) for p in baseline.profile)
+    assert {"nist", "benchmarks"} <= set(dataframe.columns)
+    assert not {"uuid", "platforms", "references"} & set(dataframe.columns)
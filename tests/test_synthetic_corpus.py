@@ -0,0 +1,143 @@
+"""Tests for the synthetic rule corpus generator.
+
+Covers:
+- `generate_synthetic_corpus`: scaled rule copies pass `validate_yaml_file`
+- supplemental rules are copied once only
+- copies get their own tag and ODV values and are spread over sections
+- baselines list every copy of their rules under the copy's section
+- only empty or previously generated output directories are written to
+"""
+
+from __future__ import annotations
+
+import shutil
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from mscp.admin_utils import generate_synthetic_corpus
+from mscp.admin_utils.synthetic_corpus import MARKER_NAME
+from mscp.common_utils import config, open_file, validate_yaml_file
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BUNDLED_RULES = Path(config["rules_dir"])
+
+SAMPLE_RULES = {
+    "audit": ["audit_configure_capacity_notify", "audit_retention_configure"],
+    "auth": ["auth_smartcard_enforce"],
+    "os": ["os_sudo_log_enforce"],
+    "supplemental": ["supplemental_cis_manual"],
+}
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch) -> Path:
+    rules_dir = tmp_path / "source" / "rules"
+    for folder, rule_ids in SAMPLE_RULES.items():
+        (rules_dir / folder).mkdir(parents=True)
+        for rule_id in rule_ids:
+            shutil.copy(BUNDLED_RULES / folder / f"{rule_id}.yaml", rules_dir / folder)
+
+    baseline_dir = tmp_path / "source" / "baselines"
+    (baseline_dir / "macos").mkdir(parents=True)
+    (baseline_dir / "macos" / "sample.yaml").write_text(
+        "title: Sample\n"
+        "profile:\n"
+        "  - section: Auditing\n"
+        "    rules:\n"
+        "      - audit_retention_configure\n"
+        "  - section: Supplemental\n"
+        "    rules:\n"
+        "      - supplemental_cis_manual\n"
+    )
+
+    monkeypatch.setitem(config, "rule_cache", False)
+    monkeypatch.setitem(config, "rules_dir", str(rules_dir))
+    monkeypatch.setitem(config, "baseline_dir", str(baseline_dir))
+
+    output = tmp_path / "corpus"
+    generate_synthetic_corpus(Namespace(scale=3, output=output))
+    return output
+
+
+def _rule_paths(corpus: Path) -> list[str]:
+    return sorted(
+        path.relative_to(corpus / "rules").as_posix()
+        for path in (corpus / "rules").rglob("*.yaml")
+    )
+
+
+def test_copies_pass_validation(corpus, monkeypatch, capsys):
+    monkeypatch.chdir(REPO_ROOT)
+    monkeypatch.setitem(config, "rules_dir", str(corpus / "rules"))
+    monkeypatch.setitem(config["custom"], "rules_dir", str(corpus / "missing"))
+
+    validate_yaml_file(Namespace(all_validation=False))
+    assert "All YAML files passed validation" in capsys.readouterr().out
+
+
+def test_rule_copies(corpus):
+    assert _rule_paths(corpus) == [
+        "audit/audit_configure_capacity_notify.yaml",
+        "audit/audit_retention_configure.yaml",
+        "audit/auth_smartcard_enforce_s002.yaml",
+        "audit/os_sudo_log_enforce_s001.yaml",
+        "auth/audit_configure_capacity_notify_s001.yaml",
+        "auth/audit_retention_configure_s001.yaml",
+        "auth/auth_smartcard_enforce.yaml",
+        "auth/os_sudo_log_enforce_s002.yaml",
+        "os/audit_configure_capacity_notify_s002.yaml",
+        "os/audit_retention_configure_s002.yaml",
+        "os/auth_smartcard_enforce_s001.yaml",
+        "os/os_sudo_log_enforce.yaml",
+        "supplemental/supplemental_cis_manual.yaml",
+    ]
+
+    source = BUNDLED_RULES / "audit" / "audit_configure_capacity_notify.yaml"
+    assert (corpus / "rules" / "audit" / source.name).read_text() == source.read_text()
+
+    original = open_file(source)
+    copy = open_file(corpus / "rules" / "os" / "audit_configure_capacity_notify_s002.yaml")
+    assert copy.pop("id") == "audit_configure_capacity_notify_s002"
+    assert copy.pop("tags") == [*original.pop("tags"), "synthetic_s002"]
+    odv = copy.pop("odv")
+    assert odv["hint"] == original["odv"]["hint"]
+    assert odv["recommended"] == original["odv"]["recommended"] + 2
+    original.pop("id")
+    original.pop("odv")
+    assert copy == original
+
+
+def test_baseline_lists_copies(corpus):
+    baseline = open_file(corpus / "baselines" / "macos" / "sample.yaml")
+    assert baseline["profile"] == [
+        {"section": "Auditing", "rules": ["audit_retention_configure"]},
+        {"section": "Supplemental", "rules": ["supplemental_cis_manual"]},
+        {"section": "Authentication", "rules": ["audit_retention_configure_s001"]},
+        {"section": "Operating System", "rules": ["audit_retention_configure_s002"]},
+    ]
+
+
+def test_rerun_replaces_previous_corpus(corpus):
+    generate_synthetic_corpus(Namespace(scale=1, output=corpus))
+    assert "_s0" not in " ".join(_rule_paths(corpus))
+
+
+@pytest.mark.parametrize("content", ["file", "symlink"])
+def test_refuses_foreign_output(tmp_path, content):
+    output = tmp_path / "foreign"
+    library = tmp_path / "library"
+    (library / "audit").mkdir(parents=True)
+    (library / "audit" / "rule.yaml").write_text("id: rule\n")
+    output.mkdir()
+    if content == "file":
+        (output / "notes.txt").write_text("keep me\n")
+    else:
+        (output / MARKER_NAME).write_text("")
+        (output / "rules").symlink_to(library)
+
+    with pytest.raises(SystemExit):
+        generate_synthetic_corpus(Namespace(scale=2, output=output))
+    assert (library / "audit" / "rule.yaml").is_file()
+    assert content == "symlink" or (output / "notes.txt").is_file()